@@ -0,0 +1,17 @@
+# shellcheck shell=bash
+
+function main {
+  local benchmark_local_repo="${PWD}/../owasp_benchmark"
+
+  echo '[INFO] Creating staging area' \
+    && copy '__argBenchmarkRepo__' "${benchmark_local_repo}" \
+    && echo '[INFO] Measuring performance' \
+    && python3.8 'skims/skims/benchmark/performance.py' \
+      "owasp=${benchmark_local_repo}" \
+      'iac=skims/test/data/lib_path' \
+      'lib_root=skims/test/data/lib_root' \
+      "${@}" \
+    || return 1
+}
+
+main "${@}"
@@ -0,0 +1,20 @@
+{
+  inputs,
+  makeScript,
+  outputs,
+  ...
+}:
+makeScript {
+  name = "skims-benchmark-performance";
+  replace = {
+    __argBenchmarkRepo__ = inputs.skimsBenchmarkOwaspRepo;
+  };
+  searchPaths = {
+    bin = [
+      inputs.nixpkgs.python38
+      outputs."/skims"
+    ];
+    source = [outputs."/skims/config/runtime"];
+  };
+  entrypoint = ./entrypoint.sh;
+}
@@ -0,0 +1,177 @@
+import asyncio
+from concurrent.futures.process import (
+    ProcessPoolExecutor,
+)
+from core.scan import (
+    execute_skims,
+)
+from ctx import (
+    CTX,
+)
+import json
+from lib_sast.types import (
+    Paths,
+)
+from model import (
+    core_model,
+)
+from multiprocessing import (
+    get_context,
+)
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from typing import (
+    Any,
+    NamedTuple,
+)
+from utils.logs import (
+    configure as configure_logs,
+    log_blocking,
+)
+from utils.repositories import (
+    get_repo_head_hash,
+)
+from utils.timings import (
+    flush_timings,
+    load_timings,
+    Timing,
+)
+
+# Constants
+DEFAULT_CORPORA: dict[str, str] = {
+    "iac": "skims/test/data/lib_path",
+    "lib_root": "skims/test/data/lib_root",
+}
+# These checks need the advisories index, which is downloaded at runtime
+EXCLUDED_CHECKS: set[core_model.FindingEnum] = {
+    core_model.FindingEnum.F011,
+    core_model.FindingEnum.F393,
+}
+KIBIBYTES_PER_MEBIBYTE: int = 1024
+
+
+class CorpusResult(NamedTuple):
+    files: int
+    files_per_second: float
+    peak_rss_mib: float
+    peak_worker_rss_mib: float
+    seconds: float
+    timings: dict[str, Timing]
+    vulnerabilities: int
+
+
+def _get_config(
+    working_dir: str, output_folder: str
+) -> core_model.SkimsConfig:
+    return core_model.SkimsConfig(
+        apk=core_model.SkimsAPKConfig(exclude=(), include=()),
+        checks=set(core_model.FindingEnum) - EXCLUDED_CHECKS,
+        commit=None,
+        dast=None,
+        execution_id=None,
+        group=None,
+        language=core_model.LocalesEnum.EN,
+        namespace="benchmark",
+        output=core_model.SkimsOutputConfig(
+            file_path=os.path.join(output_folder, "results.csv"),
+            format=core_model.OutputFormat.CSV,
+        ),
+        path=core_model.SkimsPathConfig(
+            exclude=(),
+            include=(".",),
+            lib_path=True,
+            lib_root=True,
+        ),
+        start_dir=os.getcwd(),
+        working_dir=working_dir,
+    )
+
+
+async def _execute_skims() -> int:
+    stores = await execute_skims()
+    return sum(store.length() for store in stores.values())
+
+
+def run_corpus(path: str) -> CorpusResult:
+    """Scan the corpus at `path` and measure where the time went.
+
+    Meant to run in a fresh process, so the peak RSS is that of this corpus
+    alone. Worker processes are measured once they have been reaped.
+    """
+    with tempfile.TemporaryDirectory() as output_folder:
+        CTX.config = _get_config(os.path.abspath(path), output_folder)
+        configure_logs()
+        os.chdir(CTX.config.working_dir)
+        paths = Paths(CTX.config.path.include, CTX.config.path.exclude)
+        files = len(paths.get_all())
+
+        CTX.timings_folder = os.path.join(output_folder, "timings")
+        os.mkdir(CTX.timings_folder)
+        start = time.perf_counter()
+        vulnerabilities = asyncio.run(_execute_skims())
+        seconds = time.perf_counter() - start
+        flush_timings()
+        timings = load_timings(CTX.timings_folder)
+        CTX.timings_folder = None
+        os.chdir(CTX.config.start_dir)
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_worker_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return CorpusResult(
+        files=files,
+        files_per_second=files / seconds,
+        peak_rss_mib=peak_rss / KIBIBYTES_PER_MEBIBYTE,
+        peak_worker_rss_mib=peak_worker_rss / KIBIBYTES_PER_MEBIBYTE,
+        seconds=seconds,
+        timings=timings,
+        vulnerabilities=vulnerabilities,
+    )
+
+
+def run_corpora(corpora: dict[str, str]) -> dict[str, Any]:
+    results: dict[str, Any] = {
+        "commit": get_repo_head_hash(os.getcwd()),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "corpora": {},
+    }
+    for name, path in corpora.items():
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=get_context("fork")
+        ) as executor:
+            result = executor.submit(run_corpus, path).result()
+
+        log_blocking(
+            "info",
+            "%s: %s files in %.2fs, %.2f files/s, peak RSS %.1f MiB",
+            name,
+            result.files,
+            result.seconds,
+            result.files_per_second,
+            max(result.peak_rss_mib, result.peak_worker_rss_mib),
+        )
+        results["corpora"][name] = {
+            **result._asdict(),
+            "timings": {
+                stage: timing._asdict()
+                for stage, timing in sorted(result.timings.items())
+            },
+        }
+
+    return results
+
+
+def main() -> None:
+    configure_logs()
+    corpora = dict(arg.split("=", 1) for arg in sys.argv[1:])
+    results = run_corpora(corpora or DEFAULT_CORPORA)
+    with open("benchmark_performance.json", "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+from collections.abc import (
+    Iterator,
+)
+import json
+from model.graph_model import (
+    GraphShardMetadataLanguage,
+)
+import os
+from sast.parse import (
+    build_ast_graph,
+)
+from syntax_cfg.generate import (
+    add_syntax_cfg,
+)
+from syntax_graph.generate import (
+    build_syntax_graph,
+)
+import sys
+import time
+from typing import (
+    NamedTuple,
+)
+from utils.fs import (
+    decide_language,
+)
+from utils.logs import (
+    log_blocking,
+)
+
+# Constants
+DEFAULT_CORPUS: str = "skims/test/data/lib_root"
+REPETITIONS: int = 5
+
+
+class BuildTiming(NamedTuple):
+    files: int
+    nodes: int
+    syntax_cfg_seconds: float
+    syntax_graph_seconds: float
+
+
+def _iter_paths(paths: tuple[str, ...]) -> Iterator[str]:
+    for path in paths:
+        if os.path.isfile(path):
+            yield path
+        for root, dirs, names in os.walk(path):
+            dirs.sort()
+            yield from (os.path.join(root, name) for name in sorted(names))
+
+
+def benchmark_syntax_graph(
+    paths: tuple[str, ...],
+    repetitions: int = REPETITIONS,
+) -> dict[str, BuildTiming]:
+    """Time the syntax graph and CFG builders over `paths`, per language.
+
+    Each file is parsed once, and the best time of `repetitions` builds is
+    kept to leave parsing and noise out of the measure.
+    """
+    timings: dict[str, BuildTiming] = {}
+    for path in _iter_paths(paths):
+        language = decide_language(path)
+        if language == GraphShardMetadataLanguage.NOT_SUPPORTED:
+            continue
+
+        with open(path, "rb") as handle:
+            content = handle.read()
+        if (ast_graph := build_ast_graph(content, language, path)) is None:
+            continue
+
+        syntax_graph_seconds = syntax_cfg_seconds = float("inf")
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            syntax_graph = build_syntax_graph(path, language, ast_graph)
+            syntax_graph_seconds = min(
+                syntax_graph_seconds, time.perf_counter() - start
+            )
+            if syntax_graph is None:
+                break
+
+            start = time.perf_counter()
+            add_syntax_cfg(syntax_graph)
+            syntax_cfg_seconds = min(
+                syntax_cfg_seconds, time.perf_counter() - start
+            )
+
+        if syntax_graph is None:
+            continue
+
+        timing = timings.get(language.name, BuildTiming(0, 0, 0.0, 0.0))
+        timings[language.name] = BuildTiming(
+            files=timing.files + 1,
+            nodes=timing.nodes + len(ast_graph.nodes),
+            syntax_cfg_seconds=timing.syntax_cfg_seconds + syntax_cfg_seconds,
+            syntax_graph_seconds=(
+                timing.syntax_graph_seconds + syntax_graph_seconds
+            ),
+        )
+
+    return timings
+
+
+def main() -> None:
+    paths = tuple(sys.argv[1:]) or (DEFAULT_CORPUS,)
+    timings = benchmark_syntax_graph(paths)
+    for language, timing in sorted(timings.items()):
+        log_blocking(
+            "info",
+            "%s: %s files, %s nodes, syntax graph %.3fs, cfg %.3fs",
+            language,
+            timing.files,
+            timing.nodes,
+            timing.syntax_graph_seconds,
+            timing.syntax_cfg_seconds,
+        )
+
+    with open("benchmark_syntax_graph.json", "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                language: timing._asdict()
+                for language, timing in timings.items()
+            },
+            file,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
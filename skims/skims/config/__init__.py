@@ -90,10 +90,12 @@ def load(group: str | None, path: str) -> core_model.SkimsConfig:
                 "execution_id": confuse.String(),
                 "path": confuse.Template(
                     {
+                        "base_commit": confuse.String(),
                         "exclude": confuse.Sequence(confuse.String()),
                         "include": confuse.Sequence(confuse.String()),
                         "lib_path": confuse.OneOf([True, False]),
                         "lib_root": confuse.OneOf([True, False]),
+                        "record_baseline": confuse.OneOf([True, False]),
                     },
                 ),
                 "working_dir": confuse.String(),
@@ -154,6 +156,8 @@ def load(group: str | None, path: str) -> core_model.SkimsConfig:
                 include=config_path.pop("include", ()),
                 lib_path=config_path.pop("lib_path", True),
                 lib_root=config_path.pop("lib_root", True),
+                base_commit=config_path.pop("base_commit", None),
+                record_baseline=config_path.pop("record_baseline", False),
             ),
             start_dir=os.getcwd(),
             working_dir=str(
@@ -221,10 +225,12 @@ def dump_to_yaml(config: core_model.SkimsConfig) -> str:
             else None,
             "execution_id": config.execution_id,
             "path": {
+                "base_commit": config.path.base_commit,
                 "exclude": list(config.path.exclude),
                 "include": list(config.path.include),
                 "lib_path": config.path.lib_path,
                 "lib_root": config.path.lib_root,
+                "record_baseline": config.path.record_baseline,
             },
             "working_dir": config.working_dir,
         }
@@ -1,4 +1,5 @@
 from collections.abc import (
+    Iterator,
     Mapping,
 )
 from contextlib import (
@@ -9,16 +10,20 @@ from ctx import (
     CRITERIA_VULNERABILITIES,
 )
 import hashlib
+import json
 from model import (
     core_model,
 )
 import re
 import sarif_om
+import shutil
 from state.ephemeral import (
     EphemeralStore,
 )
+import tempfile
 from typing import (
     Any,
+    TextIO,
 )
 from utils.repositories import (
     get_repo_branch,
@@ -27,6 +32,19 @@ from utils.repositories import (
 )
 import yaml
 
+# Constants
+MISSING_DEPENDENCY_PATTERN: re.Pattern[str] = re.compile(
+    r"\(missing dependency: (?P<name>(.+))\)$"
+)
+SCA_INFO_PATTERN: re.Pattern[str] = re.compile(
+    r"\((?P<name>(\S+)) v(?P<version>(.+))\) \[(?P<cve>(.+))\]"
+)
+WHAT_DETAILS_PATTERN: re.Pattern[str] = re.compile(
+    r"\s(\(.*?\))((\s)(\[.*?\]))?"  # NOSONAR
+)
+# Stands for the results of the run while the log is written
+_RESULTS = object()
+
 
 def simplify_sarif(obj: Any) -> Any:
     simplified_obj: Any
@@ -109,30 +127,12 @@ def _get_taxa(requirement_id: str) -> sarif_om.ReportingDescriptor:
     )
 
 
-def _rule_is_present(base: sarif_om.SarifLog, rule_id: str) -> bool:
-    for rule in base.runs[0].tool.driver.rules:
-        if rule.id == rule_id:
-            return True
-
-    return False
-
-
-def _taxa_is_present(base: sarif_om.SarifLog, taxa_id: str) -> bool:
-    for rule in base.runs[0].taxonomies[0].taxa:
-        if rule.id == taxa_id:
-            return True
-
-    return False
-
-
 def _get_sca_info(what: str) -> dict[str, Any] | None:
     try:
         str_info = what.split(" ", maxsplit=1)[1]
     except IndexError:
         return None
-    if match := re.match(
-        r"\((?P<name>(\S+)) v(?P<version>(.+))\) \[(?P<cve>(.+))\]", str_info
-    ):
+    if match := SCA_INFO_PATTERN.match(str_info):
         match_dict = match.groupdict()
         return dict(
             dependency_name=match_dict["name"],
@@ -147,7 +147,7 @@ def _get_missing_dependency(what: str) -> dict[str, Any] | None:
         str_info = what.split(" ", maxsplit=1)[1]
     except IndexError:
         return None
-    if match := re.match(r"\(missing dependency: (?P<name>(.+))\)$", str_info):
+    if match := MISSING_DEPENDENCY_PATTERN.match(str_info):
         match_dict = match.groupdict()
         return dict(
             dependency_name=match_dict["name"],
@@ -157,9 +157,7 @@ def _get_missing_dependency(what: str) -> dict[str, Any] | None:
 
 
 def _format_what(vulnerability: core_model.Vulnerability) -> str:
-    what = re.sub(
-        r"\s(\(.*?\))((\s)(\[.*?\]))?", "", vulnerability.what  # NOSONAR
-    )
+    what = WHAT_DETAILS_PATTERN.sub("", vulnerability.what)
     if vulnerability.kind.value == "inputs":
         while what.endswith("/"):
             what = what.rstrip("/")
@@ -195,11 +193,8 @@ def _get_vuln_properties(
     return properties
 
 
-def _get_sarif(
-    config: core_model.SkimsConfig,
-    stores: Mapping[core_model.FindingEnum, EphemeralStore],
-) -> sarif_om.SarifLog:
-    base = sarif_om.SarifLog(
+def _get_base(config: core_model.SkimsConfig) -> sarif_om.SarifLog:
+    return sarif_om.SarifLog(
         version="2.1.0",
         schema_uri=(
             "https://schemastore.azurewebsites.net/schemas/"
@@ -210,7 +205,10 @@ def _get_sarif(
                 tool=sarif_om.Tool(
                     driver=sarif_om.ToolComponent(
                         name="skims",
-                        rules=[],
+                        rules=[
+                            _get_rule(check.name.replace("F", ""))
+                            for check in config.checks
+                        ],
                     )
                 ),
                 results=[],
@@ -244,113 +242,123 @@ def _get_sarif(
         ],
     )
 
-    for check in config.checks:
-        base.runs[0].tool.driver.rules.append(
-            _get_rule(check.name.replace("F", ""))
-        )
 
-    for store in stores.values():
-        for vulnerability in store.iterate():
-            # remove F from findings
-            rule_id = vulnerability.finding.name.replace("F", "")
-            properties = _get_vuln_properties(vulnerability, rule_id)
-
-            result = sarif_om.Result(
-                rule_id=rule_id,
-                level="error",
-                kind="open",
-                message=sarif_om.MultiformatMessageString(
-                    text=(
-                        vulnerability.skims_metadata.description
-                        if vulnerability.skims_metadata
-                        else ""
-                    ),
-                    properties=properties,
-                ),
-                locations=[
-                    sarif_om.Location(
-                        physical_location=sarif_om.PhysicalLocation(
-                            artifact_location=sarif_om.ArtifactLocation(
-                                uri=_format_what(vulnerability)
-                            ),
-                            region=sarif_om.Region(
-                                start_line=_format_were(vulnerability.where),
-                                snippet=sarif_om.MultiformatMessageString(
-                                    text=vulnerability.skims_metadata.snippet
-                                    if vulnerability.skims_metadata
-                                    else ""
-                                ),
-                            ),
-                        )
-                    ),
-                ],
-                taxa=[],
-                properties={
-                    "kind": vulnerability.kind.value,
-                    "method_developer": (
-                        vulnerability.skims_metadata.developer.value
-                    ),
-                    "source_method": (
-                        vulnerability.skims_metadata.source_method
-                    ),
-                    "stream": vulnerability.stream,
-                    "technique": (
-                        vulnerability.skims_metadata.technique.value
+def _get_result(vulnerability: core_model.Vulnerability) -> sarif_om.Result:
+    # remove F from findings
+    rule_id = vulnerability.finding.name.replace("F", "")
+    properties = _get_vuln_properties(vulnerability, rule_id)
+
+    result = sarif_om.Result(
+        rule_id=rule_id,
+        level="error",
+        kind="open",
+        message=sarif_om.MultiformatMessageString(
+            text=(
+                vulnerability.skims_metadata.description
+                if vulnerability.skims_metadata
+                else ""
+            ),
+            properties=properties,
+        ),
+        locations=[
+            sarif_om.Location(
+                physical_location=sarif_om.PhysicalLocation(
+                    artifact_location=sarif_om.ArtifactLocation(
+                        uri=_format_what(vulnerability)
                     ),
-                    **(
-                        vulnerability.skims_metadata.http_properties._asdict()
-                        if vulnerability.skims_metadata.http_properties
-                        is not None
-                        else {}
+                    region=sarif_om.Region(
+                        start_line=_format_were(vulnerability.where),
+                        snippet=sarif_om.MultiformatMessageString(
+                            text=vulnerability.skims_metadata.snippet
+                            if vulnerability.skims_metadata
+                            else ""
+                        ),
                     ),
-                },
+                )
+            ),
+        ],
+        taxa=[
+            sarif_om.ReportingDescriptorReference(
+                id=taxa_id,
+                tool_component=sarif_om.ToolComponentReference(
+                    name="criteria"
+                ),
             )
-            result.guid = int.from_bytes(
-                hashlib.sha256(
-                    bytes(
-                        (
-                            result.locations[
-                                0
-                            ].physical_location.artifact_location.uri
-                            + str(
-                                result.locations[
-                                    0
-                                ].physical_location.region.start_line
-                            )
-                            + rule_id
-                            + vulnerability.skims_metadata.source_method
-                            # if you want to add a field to the hash you must
-                            # also do it in the integrates function
-                            + (
-                                result.message.properties["dependency_name"]
-                                if result.properties["source_method"]
-                                == "python.pip_incomplete_dependencies_list"
-                                else ""
-                            )
-                        ),
-                        "utf-8",
+            for taxa_id in CRITERIA_VULNS[rule_id]["requirements"]
+        ],
+        properties={
+            "kind": vulnerability.kind.value,
+            "method_developer": vulnerability.skims_metadata.developer.value,
+            "source_method": vulnerability.skims_metadata.source_method,
+            "stream": vulnerability.stream,
+            "technique": vulnerability.skims_metadata.technique.value,
+            **(
+                vulnerability.skims_metadata.http_properties._asdict()
+                if vulnerability.skims_metadata.http_properties is not None
+                else {}
+            ),
+        },
+    )
+    result.guid = int.from_bytes(
+        hashlib.sha256(
+            bytes(
+                (
+                    result.locations[0].physical_location.artifact_location.uri
+                    + str(
+                        result.locations[0].physical_location.region.start_line
                     )
-                ).digest()[:8],
-                "little",
+                    + rule_id
+                    + vulnerability.skims_metadata.source_method
+                    # if you want to add a field to the hash you must
+                    # also do it in the integrates function
+                    + (
+                        result.message.properties["dependency_name"]
+                        if result.properties["source_method"]
+                        == "python.pip_incomplete_dependencies_list"
+                        else ""
+                    )
+                ),
+                "utf-8",
             )
+        ).digest()[:8],
+        "little",
+    )
+
+    return result
 
-            # append rule if not is present
-            if not _rule_is_present(base, rule_id):
-                base.runs[0].tool.driver.rules.append(_get_rule(rule_id))
-
-            # append requirement if not is present
-            for taxa_id in CRITERIA_VULNS[rule_id]["requirements"]:
-                if not _taxa_is_present(base, taxa_id):
-                    base.runs[0].taxonomies[0].taxa.append(_get_taxa(taxa_id))
-                result.taxa.append(
-                    sarif_om.ReportingDescriptorReference(
-                        id=taxa_id,
-                        tool_component=sarif_om.ToolComponentReference(
-                            name="criteria"
-                        ),
-                    )
-                )
-            base.runs[0].results.append(result)
+
+def _iter_results(
+    base: sarif_om.SarifLog,
+    stores: Mapping[core_model.FindingEnum, EphemeralStore],
+) -> Iterator[sarif_om.Result]:
+    """Yield the results in `stores`, adding their rules and taxa to `base`.
+
+    Rules and taxa are added the first time a result references them.
+    """
+    rules: list[sarif_om.ReportingDescriptor] = base.runs[0].tool.driver.rules
+    taxa: list[sarif_om.ReportingDescriptor] = base.runs[0].taxonomies[0].taxa
+    rule_ids: set[str] = {rule.id for rule in rules}
+    taxa_ids: set[str] = {taxon.id for taxon in taxa}
+
+    for store in stores.values():
+        for vulnerability in store.iterate():
+            result = _get_result(vulnerability)
+            if result.rule_id not in rule_ids:
+                rule_ids.add(result.rule_id)
+                rules.append(_get_rule(result.rule_id))
+            for reference in result.taxa:
+                if reference.id not in taxa_ids:
+                    taxa_ids.add(reference.id)
+                    taxa.append(_get_taxa(reference.id))
+            yield result
+
+
+def _get_sarif(
+    config: core_model.SkimsConfig,
+    stores: Mapping[core_model.FindingEnum, EphemeralStore],
+) -> sarif_om.SarifLog:
+    base = _get_base(config)
+    base.runs[0].results.extend(_iter_results(base, stores))
 
     return base
 
@@ -360,3 +368,47 @@ def get_sarif(
     stores: Mapping[core_model.FindingEnum, EphemeralStore],
 ) -> dict[str, Any]:
     return simplify_sarif(_get_sarif(config, stores))
+
+
+def _write_json(obj: Any, results: TextIO, handle: TextIO) -> None:
+    if obj is _RESULTS:
+        handle.write("[")
+        shutil.copyfileobj(results, handle)
+        handle.write("]")
+    elif isinstance(obj, dict):
+        handle.write("{")
+        for index, (key, value) in enumerate(obj.items()):
+            handle.write(f"{', ' if index else ''}{json.dumps(key)}: ")
+            _write_json(value, results, handle)
+        handle.write("}")
+    elif isinstance(obj, list):
+        handle.write("[")
+        for index, value in enumerate(obj):
+            handle.write(", " if index else "")
+            _write_json(value, results, handle)
+        handle.write("]")
+    else:
+        handle.write(json.dumps(obj))
+
+
+def write_sarif(
+    config: core_model.SkimsConfig,
+    stores: Mapping[core_model.FindingEnum, EphemeralStore],
+    handle: TextIO,
+) -> None:
+    """Write the same JSON that `get_sarif` returns to `handle`.
+
+    Results are encoded one at a time and spooled to a temporary file, so
+    only the rules and taxa are held in memory. They precede the results
+    in the log, so it is written once every result has been read.
+    """
+    base = _get_base(config)
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as results:
+        for index, result in enumerate(_iter_results(base, stores)):
+            results.write(", " if index else "")
+            results.write(json.dumps(simplify_sarif(result)))
+        results.seek(0)
+
+        log = simplify_sarif(base)
+        log["runs"][0]["results"] = _RESULTS
+        _write_json(log, results, handle)
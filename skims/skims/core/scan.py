@@ -7,12 +7,11 @@ from contextlib import (
     suppress,
 )
 from core.result import (
-    get_sarif,
+    write_sarif,
 )
 import csv
 from ctx import (
     CTX,
-    MANAGER,
 )
 from custom_exceptions import (
     NoOutputFilePathSpecified,
@@ -20,7 +19,6 @@ from custom_exceptions import (
 from dast.aws.analyze import (
     analyze as analyze_dast_aws,
 )
-import json
 from lib_apk.analyze import (
     analyze as analyze_apk,
 )
@@ -38,6 +36,9 @@ from model import (
     value_model,
 )
 import os
+from sca.index import (
+    ensure_index,
+)
 from state.ephemeral import (
     EphemeralStore,
     get_ephemeral_store,
@@ -89,7 +90,7 @@ async def execute_skims(
     :raises MemoryError: If not enough memory can be allocated by the runtime
     :raises SystemExit: If any critical error occurs
     """
-    CTX.value_to_add = value_model.ValueToAdd(MANAGER.dict())  # type: ignore
+    CTX.value_to_add = value_model.ValueToAdd({})
 
     stores = stores or {
         finding: get_ephemeral_store() for finding in core_model.FindingEnum
@@ -98,6 +99,13 @@ async def execute_skims(
     if config.apk.include:
         analyze_apk(stores=stores)
     if config.path.include:
+        if config.path.lib_path and {
+            core_model.FindingEnum.F011,
+            core_model.FindingEnum.F393,
+        }.intersection(config.checks):
+            # Workers read advisories from this index instead of each one
+            # downloading and holding the whole database
+            await ensure_index()
         analyze_sast(stores=stores)
     if config.dast:
         await execute_dast_analysis(config, stores)
@@ -220,9 +228,8 @@ def notify_findings_as_sarif(
     elif config.output is not None:
         file_path = config.output.file_path
 
-    result = get_sarif(config, stores)
     with open(file_path, "w", encoding="utf-8") as writer:
-        json.dump(result, writer)
+        write_sarif(config, stores, writer)
 
 
 async def main(
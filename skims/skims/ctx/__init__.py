@@ -1,9 +1,3 @@
-from multiprocessing import (
-    Manager,
-)
-from multiprocessing.managers import (
-    SyncManager,
-)
 import os
 from os import (
     environ,
@@ -12,13 +6,23 @@ from os import (
 from os.path import (
     expanduser,
 )
+from types import (
+    SimpleNamespace,
+)
 from typing import (
     Any,
 )
 
 # Constants
-MANAGER: SyncManager = Manager()
-CTX: Any = MANAGER.Namespace()
+# Plain per-process state, worker processes receive a snapshot of it when
+# they start. Workers count `value_to_add` on their own and send it back
+# along with their results
+CTX: Any = SimpleNamespace(
+    config=None,
+    debug=False,
+    timings_folder=None,
+    value_to_add=None,
+)
 STATE_FOLDER: str = expanduser("~/.skims")
 STATE_FOLDER_DEBUG: str = os.path.join(STATE_FOLDER, "debug")
 NAMESPACES_FOLDER: str = os.path.join(STATE_FOLDER, "namespaces")
@@ -31,6 +35,19 @@ def _get_artifact(env_var: str) -> str:
     raise ValueError(f"Expected environment variable: {env_var}")
 
 
+def get_snapshot() -> dict[str, Any]:
+    return dict(vars(CTX))
+
+
+def load_snapshot(snapshot: dict[str, Any]) -> None:
+    """Restore the context of the parent process, used as pool initializer.
+
+    :param snapshot: The result of calling `get_snapshot` in the parent
+    :type snapshot: dict[str, Any]
+    """
+    vars(CTX).update(snapshot)
+
+
 # Side effects
 CIPHER_SUITES_PATH: str = _get_artifact("SKIMS_CIPHER_SUITES_PATH")
 CRITERIA_REQUIREMENTS: str = _get_artifact("SKIMS_CRITERIA_REQUIREMENTS")
@@ -41,6 +41,10 @@ from dast.aws import (
     f406,
     f407,
 )
+from dast.aws.inventory import (
+    open_inventory,
+    RequestKey,
+)
 from model import (
     core_model,
 )
@@ -101,21 +105,22 @@ async def analyze(
     *,
     credentials: AwsCredentials,
     stores: dict[core_model.FindingEnum, EphemeralStore],
+    snapshot: dict[RequestKey, dict[str, Any]] | None = None,
 ) -> None:
-
-    vulnerabilities: list[Vulnerability] = list(
-        collapse(
-            await collect(
-                [
-                    check(credentials)
-                    for finding, checks in CHECKS
-                    for check in checks
-                    if finding in CTX.config.checks
-                ]
-            ),
-            base_type=Vulnerability,
+    async with open_inventory(credentials, snapshot=snapshot):
+        vulnerabilities: list[Vulnerability] = list(
+            collapse(
+                await collect(
+                    [
+                        check(credentials)
+                        for finding, checks in CHECKS
+                        for check in checks
+                        if finding in CTX.config.checks
+                    ]
+                ),
+                base_type=Vulnerability,
+            )
         )
-    )
     with ThreadPoolExecutor(max_workers=cpu_count()) as worker:
         worker.map(
             lambda x: stores[  # pylint: disable=unnecessary-lambda
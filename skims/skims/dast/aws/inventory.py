@@ -0,0 +1,194 @@
+import aioboto3
+import asyncio
+import base64
+import botocore
+from collections.abc import (
+    AsyncIterator,
+)
+from contextlib import (
+    asynccontextmanager,
+    AsyncExitStack,
+)
+from datetime import (
+    datetime,
+)
+import json
+from model.core_model import (
+    AwsCredentials,
+)
+from typing import (
+    Any,
+    NamedTuple,
+)
+from utils.logs import (
+    log_exception_blocking,
+)
+
+# Constants
+MAX_CONCURRENT_CALLS: int = 8
+RequestKey = tuple[str, str, str]
+
+
+class Inventory(NamedTuple):
+    clients: dict[str, Any]
+    exit_stack: AsyncExitStack
+    lock: asyncio.Lock
+    responses: dict[RequestKey, asyncio.Future[dict[str, Any]]]
+    semaphore: asyncio.Semaphore
+    session: aioboto3.Session | None
+
+
+# Inventories of the credentials being analyzed, by access key id
+INVENTORIES: dict[str, Inventory] = {}
+
+
+def _get_key(
+    service: str,
+    function: str,
+    parameters: dict[str, Any],
+) -> RequestKey:
+    return (
+        service,
+        function,
+        json.dumps(parameters, default=str, sort_keys=True),
+    )
+
+
+async def _get_client(inventory: Inventory, service: str) -> Any:
+    async with inventory.lock:
+        if service not in inventory.clients:
+            context = inventory.session.client(service)  # type: ignore
+            client = await inventory.exit_stack.enter_async_context(context)
+            inventory.clients[service] = client
+    return inventory.clients[service]
+
+
+async def _fetch(
+    inventory: Inventory,
+    service: str,
+    function: str,
+    parameters: dict[str, Any],
+) -> dict[str, Any]:
+    async with inventory.semaphore:
+        client = await _get_client(inventory, service)
+        try:
+            if client.can_paginate(function):
+                # The paginator knows the result keys of each operation
+                paginator = client.get_paginator(function)
+                return await paginator.paginate(
+                    **parameters
+                ).build_full_result()
+            return await getattr(client, function)(**parameters)
+        except botocore.exceptions.ClientError:
+            log_exception_blocking(
+                "exception", botocore.exceptions.ClientError
+            )
+            return {}
+
+
+async def get_response(
+    inventory: Inventory,
+    service: str,
+    function: str,
+    parameters: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Return the response of an AWS call, calling it only the first time.
+
+    Paginated operations are followed until their last page. Inventories
+    replaying a snapshot answer calls that were not recorded with {}.
+    """
+    parameters = dict(parameters or {})
+    key = _get_key(service, function, parameters)
+    if key not in inventory.responses:
+        if inventory.session is None:
+            return {}
+        inventory.responses[key] = asyncio.ensure_future(
+            _fetch(inventory, service, function, parameters)
+        )
+
+    return await inventory.responses[key]
+
+
+@asynccontextmanager
+async def open_inventory(
+    credentials: AwsCredentials,
+    *,
+    snapshot: dict[RequestKey, dict[str, Any]] | None = None,
+) -> AsyncIterator[Inventory]:
+    """Serve the AWS calls made with `credentials` from a shared inventory.
+
+    :param credentials: Credentials of the account to inventory
+    :param snapshot: Recorded responses to replay instead of calling AWS
+    """
+    async with AsyncExitStack() as exit_stack:
+        inventory = Inventory(
+            clients={},
+            exit_stack=exit_stack,
+            lock=asyncio.Lock(),
+            responses={},
+            semaphore=asyncio.Semaphore(MAX_CONCURRENT_CALLS),
+            session=None
+            if snapshot is not None
+            else aioboto3.Session(
+                aws_access_key_id=credentials.access_key_id,
+                aws_secret_access_key=credentials.secret_access_key,
+            ),
+        )
+        for key, response in (snapshot or {}).items():
+            inventory.responses[key] = asyncio.Future()
+            inventory.responses[key].set_result(response)
+
+        INVENTORIES[credentials.access_key_id] = inventory
+        try:
+            yield inventory
+        finally:
+            del INVENTORIES[credentials.access_key_id]
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, bytes):
+        return {"__bytes__": base64.b64encode(value).decode()}
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _decode(value: dict[str, Any]) -> Any:
+    if "__datetime__" in value:
+        return datetime.fromisoformat(value["__datetime__"])
+    if "__bytes__" in value:
+        return base64.b64decode(value["__bytes__"])
+    return value
+
+
+def dump_snapshot(inventory: Inventory) -> str:
+    """Serialize the responses fetched so far to JSON."""
+    return json.dumps(
+        [
+            {
+                "service": service,
+                "function": function,
+                "parameters": json.loads(parameters),
+                "response": response.result(),
+            }
+            for (service, function, parameters), response in sorted(
+                inventory.responses.items(), key=lambda item: item[0]
+            )
+            if response.done()
+            and not response.cancelled()
+            and response.exception() is None
+        ],
+        default=_encode,
+        indent=2,
+    )
+
+
+def load_snapshot(content: str) -> dict[RequestKey, dict[str, Any]]:
+    """Parse a snapshot created with `dump_snapshot`."""
+    snapshot: dict[RequestKey, dict[str, Any]] = {}
+    for entry in json.loads(content, object_hook=_decode):
+        key = _get_key(
+            entry["service"], entry["function"], entry["parameters"]
+        )
+        snapshot[key] = entry["response"]
+    return snapshot
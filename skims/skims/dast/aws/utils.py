@@ -3,6 +3,10 @@ import botocore
 from collections.abc import (
     Iterable,
 )
+from dast.aws.inventory import (
+    get_response,
+    INVENTORIES,
+)
 from dast.aws.types import (
     Location,
 )
@@ -100,6 +104,9 @@ async def run_boto3_fun(
     function: str,
     parameters: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
+    if inventory := INVENTORIES.get(credentials.access_key_id):
+        return await get_response(inventory, service, function, parameters)
+
     try:
         session = aioboto3.Session(
             aws_access_key_id=credentials.access_key_id,
@@ -63,7 +63,7 @@ def analyze_one(
         vulnerability
         for get_check_ctx, checks in CHECKS
         for finding, check_list in checks.items()
-        if finding in CTX.config.checks and apk_ctx.apk_obj is not None
+        if finding in CTX.config.checks and apk_ctx.index is not None
         for check in check_list
         for vulnerability in check(get_check_ctx(apk_ctx))
     )
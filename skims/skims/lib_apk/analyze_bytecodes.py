@@ -1,8 +1,3 @@
-import androguard
-from androguard.core.bytecodes.dvm import (
-    ClassDefItem,
-    DalvikVMFormat,
-)
 from bs4 import (
     BeautifulSoup,
 )
@@ -16,9 +11,6 @@ from collections.abc import (
 from model import (
     core_model,
 )
-from operator import (
-    attrgetter,
-)
 from parse_android_manifest import (
     _apk_backups_enabled,
     _apk_debugging_enabled,
@@ -35,35 +27,6 @@ from serializers import (
 import textwrap
 
 
-def is_method_present(
-    dex: DalvikVMFormat, class_name: str, method: str, descriptor: str
-) -> list[str]:
-    """Search if method is present in decompiled code."""
-    met_ana = dex.get_method_analysis_by_name(
-        class_name=class_name, method_name=method, method_descriptor=descriptor
-    )
-
-    if not met_ana:
-        return []
-
-    used_by = [
-        x.name for x, _, _ in met_ana.get_xref_from() if "Activity" in x.name
-    ]
-
-    return used_by
-
-
-def get_activities_source(dvms: list) -> str:
-    """Decompile given Dalvik VM images."""
-    source = [
-        x.get_source()
-        for dvm in dvms
-        for x in dvm.get_classes()
-        if "Activity" in x.name
-    ]
-    return "".join(source)
-
-
 def _add_apk_unsigned_not_signed_location(
     ctx: APKCheckCtx,
     locations: Locations,
@@ -95,10 +58,8 @@ def _add_apk_unsigned_not_signed_location(
 def _apk_unsigned(ctx: APKCheckCtx) -> core_model.Vulnerabilities:
     locations: Locations = Locations([])
 
-    if ctx.apk_ctx.apk_obj is not None:
-        signatures: list[str] = ctx.apk_ctx.apk_obj.get_signature_names()
-
-        if not signatures:
+    if ctx.apk_ctx.index is not None:
+        if not ctx.apk_ctx.index.signature_names:
             _add_apk_unsigned_not_signed_location(ctx, locations)
 
     return _create_vulns(
@@ -137,31 +98,11 @@ def _add_no_root_check_location(
     )
 
 
-def _get_method_names(
-    get_analysis: androguard.core.analysis.analysis.Analysis,
-) -> list[str]:
-    names: list[str] = sorted(
-        set(map(attrgetter("name"), get_analysis.get_methods()))
-    )
-
-    return names
-
-
-def _get_class_names(
-    get_analysis: androguard.core.analysis.analysis.Analysis,
-) -> list[str]:
-    names: list[str] = sorted(
-        set(map(attrgetter("name"), get_analysis.get_classes()))
-    )
-
-    return names
-
-
 def _no_root_check(ctx: APKCheckCtx) -> core_model.Vulnerabilities:
     locations: Locations = Locations([])
 
-    if ctx.apk_ctx.analysis is not None:
-        method_names: list[str] = _get_method_names(ctx.apk_ctx.analysis)
+    if ctx.apk_ctx.index is not None:
+        method_names: list[str] = list(ctx.apk_ctx.index.method_names)
 
         if not any(
             method_name
@@ -246,17 +187,12 @@ def _no_certs_pinning(ctx: APKCheckCtx) -> core_model.Vulnerabilities:
     locations: Locations = Locations([])
 
     if (
-        ctx.apk_ctx.apk_obj is not None
-        and ctx.apk_ctx.analysis is not None
-        and (
-            "Lcom/toyberman/RNSslPinningModule;"
-            not in _get_class_names(ctx.apk_ctx.analysis)
-        )
+        ctx.apk_ctx.index is not None
+        and "Lcom/toyberman/RNSslPinningModule;"
+        not in ctx.apk_ctx.index.class_names
     ):
-        try:
-            nsc: str = "res/xml/network_security_config.xml"
-            nsc_content: bytes = ctx.apk_ctx.apk_obj.zip.read(nsc)
-        except KeyError:
+        nsc_content = ctx.apk_ctx.index.network_security_config
+        if nsc_content is None:
             # No network security config exists
             _add_no_certs_pinning_1_location(ctx, locations)
         else:
@@ -290,60 +226,13 @@ def _add_no_obfuscation_location(
 def _no_obfuscation(ctx: APKCheckCtx) -> core_model.Vulnerabilities:
     locations: Locations = Locations([])
 
-    class_names_unobfuscated: set[str] = {
-        "androidx/annotation/",
-        "javax/inject/",
-        "androidx/browser/",
-        "androidx/viewpager2/",
-        "de/greenrobot/",
-        "androidx/savedstate/",
-        "androidx/media/",
-        "butterknife/internal/",
-        "androidx/activity/",
-        "me/leolin/",
-        "androidx/versionedparcelable/",
-        "io/nlopez/",
-        "butterknife/runtime/",
-        "org/unimodules/",
-        "androidx/cardview/",
-        "com/raizlabs/",
-        "androidx/coordinatorlayout/",
-        "androidx/viewpager/",
-        "androidx/lifecycle/",
-        "android/support/",
-        "net/openid/",
-        "com/amplitude/",
-        "androidx/biometric/",
-        "com/theartofdev/",
-        "androidx/core/",
-        "androidx/fragment/",
-        "okhttp3/internal/",
-        "androidx/recyclerview/",
-        "host/exp/",
-        "com/bumptech/",
-        "androidx/appcompat/",
-        "versioned/host/",
-        "expo/modules/",
-        "com/google/",
-        "com/facebook/",
-    }
-
-    if ctx.apk_ctx.analysis is not None:
-        dvms: DalvikVMFormat
-        for dvms in ctx.apk_ctx.analysis.vms:
-            class_: ClassDefItem
-            for class_ in dvms.get_classes():
-                class_name: str = class_.get_name()[1:-1]
-                class_is_interface: bool = 0x200 & class_.get_access_flags()
-                if not class_is_interface and any(
-                    map(class_name.startswith, class_names_unobfuscated)
-                ):
-                    _add_no_obfuscation_location(
-                        class_name=class_name,
-                        class_source=class_.get_source(),
-                        locations=locations,
-                    )
-                    break
+    if ctx.apk_ctx.index is not None:
+        for class_name, class_source in ctx.apk_ctx.index.unobfuscated_classes:
+            _add_no_obfuscation_location(
+                class_name=class_name,
+                class_source=class_source,
+                locations=locations,
+            )
 
     return _create_vulns(
         ctx=ctx,
@@ -389,11 +278,11 @@ def _add_has_fragment_injection_location(
 def _has_fragment_injection(ctx: APKCheckCtx) -> core_model.Vulnerabilities:
     locations: Locations = Locations([])
 
-    if ctx.apk_ctx.apk_obj is not None and ctx.apk_ctx.analysis is not None:
-        sdk_version = ctx.apk_ctx.apk_obj.get_target_sdk_version()
+    if ctx.apk_ctx.index is not None:
+        sdk_version = ctx.apk_ctx.index.target_sdk_version
         target_sdk_version = int(sdk_version) if sdk_version else 0
 
-        act_source = get_activities_source(ctx.apk_ctx.analysis.vms)
+        act_source = ctx.apk_ctx.index.activities_source
 
         is_vulnerable: bool = (
             target_sdk_version < 19 and "PreferenceActivity" in act_source
@@ -483,8 +372,8 @@ def _webview_vulnerabilities(ctx: APKCheckCtx) -> core_model.Vulnerabilities:
         "setAllowUniversalAccessFromFileURLs",
     }
 
-    if ctx.apk_ctx.analysis is not None:
-        act_source = get_activities_source(ctx.apk_ctx.analysis.vms)
+    if ctx.apk_ctx.index is not None:
+        act_source = ctx.apk_ctx.index.activities_source
         effective_dangerous: list[str] = []
 
         is_vulnerable: bool = (
@@ -547,18 +436,18 @@ def _has_frida(
 ) -> core_model.Vulnerabilities:
     locations: Locations = Locations([])
 
-    apk_obj = ctx.apk_ctx.apk_obj
-    if not apk_obj:
+    index = ctx.apk_ctx.index
+    if not index:
         return _create_vulns(
             ctx=ctx,
             locations=locations,
             method=core_model.MethodsEnum.HAS_FRIDA,
         )
-    frida_gadgets: list[str] = [x for x in apk_obj.get_files() if "frida" in x]
+    frida_gadgets: list[str] = [x for x in index.files if "frida" in x]
     is_frida_gadget_in_files: bool = bool(frida_gadgets)
 
     if is_frida_gadget_in_files:
-        _add_has_frida(ctx, locations, apk_obj.get_files())
+        _add_has_frida(ctx, locations, list(index.files))
 
     return _create_vulns(
         ctx=ctx,
@@ -600,8 +489,8 @@ def _add_not_verifies_ssl_hostname(
 def _not_verifies_ssl_hostname(ctx: APKCheckCtx) -> core_model.Vulnerabilities:
     locations: Locations = Locations([])
 
-    if ctx.apk_ctx.analysis is not None:
-        act_source = get_activities_source(ctx.apk_ctx.analysis.vms)
+    if ctx.apk_ctx.index is not None:
+        act_source = ctx.apk_ctx.index.activities_source
         is_vulnerable: bool = False
 
         if (
@@ -652,12 +541,11 @@ def _add_uses_insecure_delete(
 def _uses_insecure_delete(ctx: APKCheckCtx) -> core_model.Vulnerabilities:
     locations: Locations = Locations([])
 
-    if ctx.apk_ctx.analysis is not None:
-        dex = ctx.apk_ctx.analysis
-        method_names: list[str] = _get_method_names(ctx.apk_ctx.analysis)
+    if ctx.apk_ctx.index is not None:
+        method_names: list[str] = list(ctx.apk_ctx.index.method_names)
 
-        deletes_insecure: list[str] = is_method_present(
-            dex, "Ljava/io/File;", "delete", "()Z"
+        deletes_insecure = ctx.apk_ctx.index.get_method_callers(
+            "Ljava/io/File;", "delete", "()Z"
         )
 
         if deletes_insecure:
@@ -743,16 +631,12 @@ def _uses_http_resources(ctx: APKCheckCtx) -> core_model.Vulnerabilities:
         r"http:\/\/\[",
     }
 
-    if ctx.apk_ctx.analysis is not None:
-        dex = ctx.apk_ctx.analysis
-
+    if ctx.apk_ctx.index is not None:
         insecure_urls = [
-            x.get_value()
-            for x in dex.get_strings()
-            if re.match(r"^http?\:\/\/.+", x.get_value())
-            and not any(
-                re.match(whitel, x.get_value()) for whitel in whitelist
-            )
+            string
+            for string in ctx.apk_ctx.index.strings
+            if re.match(r"^http?\:\/\/.+", string)
+            and not any(re.match(whitel, string) for whitel in whitelist)
         ]
 
         if insecure_urls:
@@ -826,15 +710,13 @@ def _improper_certificate_validation(
 ) -> core_model.Vulnerabilities:
     locations: Locations = Locations([])
 
-    if ctx.apk_ctx.analysis is not None and (apk_obj := ctx.apk_ctx.apk_obj):
+    if (index := ctx.apk_ctx.index) is not None:
         net_conf: str = ""
 
-        try:
-            net_conf = str(
-                apk_obj.get_file("res/xml/network_security_config.xml")
-            )
-        except androguard.core.bytecodes.apk.FileNotPresent:
-            sdk_version = apk_obj.get_target_sdk_version()
+        if index.network_security_config is not None:
+            net_conf = str(index.network_security_config)
+        else:
+            sdk_version = index.target_sdk_version
             target_sdk = int(sdk_version) if sdk_version else 0
             if target_sdk < 24:
                 _add_allow_user_ca_by_default(ctx, locations)
@@ -852,12 +734,10 @@ def _improper_certificate_validation(
 def _uses_insecure_sockets(ctx: APKCheckCtx) -> core_model.Vulnerabilities:
     locations: Locations = Locations([])
 
-    if ctx.apk_ctx.analysis is not None:
-        dex = ctx.apk_ctx.analysis
-        method_names: list[str] = _get_method_names(ctx.apk_ctx.analysis)
+    if ctx.apk_ctx.index is not None:
+        method_names: list[str] = list(ctx.apk_ctx.index.method_names)
 
-        uses_get_insecure: list[str] = is_method_present(
-            dex=dex,
+        uses_get_insecure = ctx.apk_ctx.index.get_method_callers(
             class_name="Landroid/net/SSLCertificateSocketFactory;",
             method="getInsecure",
             descriptor=(
@@ -1,3 +1,6 @@
+from aioextensions import (
+    collect,
+)
 import bs4
 from collections.abc import (
     Callable,
@@ -25,9 +28,6 @@ from model import (
 from more_itertools import (
     collapse,
 )
-from queue import (
-    SimpleQueue,
-)
 from state.ephemeral import (
     EphemeralStore,
 )
@@ -44,8 +44,9 @@ from utils.html import (
     is_html,
 )
 from utils.http import (
-    create_session,
-    request,
+    create_client,
+    fetch,
+    HTTPClient,
 )
 from utils.logs import (
     log_blocking,
@@ -54,6 +55,8 @@ from utils.ntp import (
     get_offset,
 )
 
+# Constants
+HTTP_WORKERS: int = 32
 CHECKS: tuple[
     tuple[
         Callable[[URLContext], Any],
@@ -104,10 +107,10 @@ def analyze_one(
     return vulns
 
 
-# @rate_limited(rpm=LIB_HTTP_DEFAULT)
 async def get_url(
     url: str,
     *,
+    client: HTTPClient,
     ntp_offset: float | None,
 ) -> URLContext | None:
     # Urls for common attached file extensions should be excluded from analysis
@@ -121,72 +124,68 @@ async def get_url(
     if url.endswith(ignored_ext):
         return None
 
-    async with create_session() as session:  # type: ignore
-        if response := await request(session, "GET", url):
-            redirect_url = str(response.url)  # Update with the redirected URL
-            has_redirect: bool = redirect_url != url
-            if not url.endswith("/") and redirect_url == f"{url}/":
-                has_redirect = False
-
-            content_raw = await response.content.read(1048576)
-            content = content_raw.decode("latin-1")
-            soup = bs4.BeautifulSoup(content, features="html.parser")
-
-            return URLContext(
-                components=urllib.parse.urlparse(redirect_url),
-                content=content,
-                custom_f023=await request(
-                    session,
-                    "GET",
-                    url,
-                    headers={
-                        "Host": "fluidattacks.com",
-                    },
-                ),
-                has_redirect=has_redirect,
-                headers_raw=response.headers,  # type: ignore
-                is_html=is_html(content, soup),
-                original_url=url,
-                soup=soup,
-                timestamp_ntp=(
-                    datetime.now().timestamp() + ntp_offset
-                    if ntp_offset
-                    else None
-                ),
-                url=redirect_url,
-                response_status=response.status,
-            )
+    if response := await fetch(client, "GET", url):
+        redirect_url = response.url  # Update with the redirected URL
+        has_redirect: bool = redirect_url != url
+        if not url.endswith("/") and redirect_url == f"{url}/":
+            has_redirect = False
+
+        content = response.content.decode("latin-1")
+        soup = bs4.BeautifulSoup(content, features="html.parser")
+
+        return URLContext(
+            components=urllib.parse.urlparse(redirect_url),
+            content=content,
+            custom_f023=await fetch(
+                client,
+                "GET",
+                url,
+                headers={
+                    "Host": "fluidattacks.com",
+                },
+            ),
+            has_redirect=has_redirect,
+            headers_raw=response.headers,  # type: ignore
+            is_html=is_html(content, soup),
+            original_url=url,
+            soup=soup,
+            timestamp_ntp=(
+                datetime.now().timestamp() + ntp_offset if ntp_offset else None
+            ),
+            url=redirect_url,
+            response_status=response.status,
+        )
 
     return None
 
 
-async def get_urls() -> set[URLContext]:
-    urls: set[URLContext] = set()
-    urls_done: set[str] = set()
-    urls_pending: SimpleQueue = SimpleQueue()
+async def get_urls(*, workers: int = HTTP_WORKERS) -> set[URLContext]:
+    target_urls: set[str] = set(CTX.config.dast.http.include)
     ntp_offset: float | None = get_offset()
 
-    for url in set(CTX.config.dast.http.include):
-        urls_pending.put(url)
-
     if CTX.config.dast.http_checks:
-        for url in get_alternative_protocol_urls(set(CTX.config.dast.urls)):
-            urls_pending.put(url)
-
-    while not urls_pending.empty():
-        url = urls_pending.get()
-        url_ctx: URLContext | None = await get_url(
-            url,
-            ntp_offset=ntp_offset,
+        target_urls.update(
+            get_alternative_protocol_urls(set(CTX.config.dast.urls))
+        )
+
+    async with create_client() as client:
+        url_ctxs: tuple[URLContext | None, ...] = await collect(
+            (
+                get_url(url, client=client, ntp_offset=ntp_offset)
+                for url in target_urls
+            ),
+            workers=workers,
         )
+
+    urls: set[URLContext] = set()
+    for url_ctx in url_ctxs:
         if url_ctx is None:
             continue
 
         urls.add(url_ctx)
-        urls_done.add(url)
 
         for child_url in get_sameorigin_urls(url_ctx.components, url_ctx.soup):
-            if child_url not in urls_done:
+            if child_url not in target_urls:
                 log_blocking("info", "Discovered url: %s", child_url)
 
     return urls
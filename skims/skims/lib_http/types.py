@@ -1,4 +1,3 @@
-import aiohttp
 import bs4
 from typing import (
     NamedTuple,
@@ -7,12 +6,15 @@ from urllib.parse import (
     ParseResult,
     urlsplit,
 )
+from utils.http import (
+    HTTPResponse,
+)
 
 
 class URLContext(NamedTuple):
     components: ParseResult
     content: str
-    custom_f023: aiohttp.ClientResponse | None
+    custom_f023: HTTPResponse | None
     has_redirect: bool
     headers_raw: dict[str, str]
     is_html: bool
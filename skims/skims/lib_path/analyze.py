@@ -1,4 +1,5 @@
 from collections.abc import (
+    Iterator,
     Set,
 )
 from concurrent.futures.process import (
@@ -6,8 +7,11 @@ from concurrent.futures.process import (
 )
 from ctx import (
     CTX,
+    get_snapshot,
+    load_snapshot,
 )
 from functools import (
+    cache,
     partial,
 )
 from lib_path import (
@@ -59,14 +63,21 @@ from lib_path import (
 from lib_sast.types import (
     Paths,
 )
+from metaloaders.model import (
+    Node,
+)
 from model import (
     core_model,
+    value_model,
 )
 import os
 from os.path import (
     split,
     splitext,
 )
+from parse_cfn.loader import (
+    load_templates_blocking,
+)
 import reactivex
 from reactivex import (
     operators as ops,
@@ -76,6 +87,7 @@ from state.ephemeral import (
 )
 from typing import (
     Any,
+    NamedTuple,
 )
 from utils.fs import (
     generate_file_raw_content_blocking,
@@ -85,10 +97,18 @@ from utils.logs import (
     log_blocking,
     log_exception_blocking,
 )
+from utils.timings import (
+    flush_timings,
+    timed,
+)
 
 # Constants
 MEBIBYTE: int = 1048576
 MAX_READ: int = 64 * MEBIBYTE
+CHUNKS_PER_WORKER: int = 4
+MAX_CHUNK_PATHS: int = 256
+# Paths shared by every task of a worker, installed by its initializer
+SHARED_PATHS: dict[str, frozenset[str]] = {}
 
 CHECKS: tuple[tuple[core_model.FindingEnum, Any], ...] = (
     (core_model.FindingEnum.F009, f009.analyze),
@@ -171,10 +191,19 @@ def analyze_one_path(  # noqa: MC0001
     file_name, file_extension = splitext(file_info)
     file_extension = file_extension[1:]
 
+    # Parsed once, on demand, and shared by every check of this file
+    @cache
+    def templates_generator() -> tuple[Node, ...]:
+        with timed("lib_path.templates"):
+            return tuple(
+                load_templates_blocking(file_content, fmt=file_extension)
+            )
+
     result: dict[core_model.FindingEnum, list[core_model.Vulnerabilities]] = {}
+    checks: set[core_model.FindingEnum] = CTX.config.checks
 
     for finding, analyzer in CHECKS:
-        if finding not in CTX.config.checks:
+        if finding not in checks:
             continue
 
         if path in unique_nv_paths:
@@ -186,43 +215,105 @@ def analyze_one_path(  # noqa: MC0001
             }:
                 continue
 
-        result[finding] = analyzer(
-            content_generator=file_content_generator,
-            file_extension=file_extension,
-            file_name=file_name,
-            finding=finding,
-            path=path,
-            raw_content_generator=file_raw_content_generator,
-            unique_nu_paths=unique_nu_paths,
-        )
+        with timed(f"lib_path.{finding.name}"):
+            result[finding] = analyzer(
+                content_generator=file_content_generator,
+                file_extension=file_extension,
+                file_name=file_name,
+                finding=finding,
+                path=path,
+                raw_content_generator=file_raw_content_generator,
+                templates_generator=templates_generator,
+                unique_nu_paths=unique_nu_paths,
+            )
 
     return result
 
 
-def _analyze_one_path(  # noqa: MC0001
-    *,
-    index: int,
-    path: str,
-    unique_nu_paths: Set[str],
-    unique_nv_paths: Set[str],
+class ChunkResult(NamedTuple):
+    vulnerabilities: tuple[
+        tuple[core_model.FindingEnum, core_model.Vulnerability], ...
+    ]
+    # Counted in the worker, merged into the context of the parent
+    value_to_add: dict[str, int]
+
+
+def _initialize_worker(
+    snapshot: dict[str, Any],
+    unique_nu_paths: frozenset[str],
+    unique_nv_paths: frozenset[str],
+) -> None:
+    load_snapshot(snapshot)
+    CTX.value_to_add = value_model.ValueToAdd({})
+    SHARED_PATHS["nu"] = unique_nu_paths
+    SHARED_PATHS["nv"] = unique_nv_paths
+
+
+def _analyze_paths(
+    paths: tuple[tuple[int, str], ...],
     unique_paths_count: int,
-) -> dict[core_model.FindingEnum, list[core_model.Vulnerabilities]]:
-    content = get_file_content_block(path)
-    return analyze_one_path(
-        index=index,
-        path=path,
-        file_content=content,
-        unique_nu_paths=unique_nu_paths,
-        unique_nv_paths=unique_nv_paths,
-        unique_paths_count=unique_paths_count,
-    )
+) -> ChunkResult:
+    results: list[tuple[core_model.FindingEnum, core_model.Vulnerability]] = []
+    try:
+        for index, path in paths:
+            try:
+                result = analyze_one_path(
+                    index=index,
+                    path=path,
+                    file_content=get_file_content_block(path),
+                    unique_nu_paths=SHARED_PATHS["nu"],
+                    unique_nv_paths=SHARED_PATHS["nv"],
+                    unique_paths_count=unique_paths_count,
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                log_exception_blocking("error", exc)
+                continue
+            results.extend(
+                (finding, vuln)
+                for finding, vulns_list in result.items()
+                for vulns in vulns_list
+                for vuln in vulns
+            )
+    finally:
+        flush_timings()
+    return ChunkResult(tuple(results), CTX.value_to_add.pop_all())
+
+
+def _get_chunks(
+    paths: tuple[str, ...], workers: int
+) -> Iterator[tuple[tuple[int, str], ...]]:
+    """Split `paths` in chunks of a similar size in bytes.
+
+    Keeps a few chunks per worker so the load is still balanced when
+    some files take much longer than others to analyze.
+    """
+    sizes: list[int] = []
+    for path in paths:
+        try:
+            sizes.append(os.path.getsize(path))
+        except OSError:
+            sizes.append(0)
+
+    target_size: int = max(sum(sizes) // (workers * CHUNKS_PER_WORKER), 1)
+    chunk: list[tuple[int, str]] = []
+    chunk_size: int = 0
+    for index, (path, size) in enumerate(zip(paths, sizes)):
+        chunk.append((index, path))
+        chunk_size += size
+        if chunk_size >= target_size or len(chunk) >= MAX_CHUNK_PATHS:
+            yield tuple(chunk)
+            chunk, chunk_size = [], 0
+    if chunk:
+        yield tuple(chunk)
 
 
 def _handle_result(
     stores: dict[core_model.FindingEnum, EphemeralStore],
-    result: tuple[core_model.FindingEnum, EphemeralStore],
+    result: ChunkResult,
 ) -> None:
-    stores[result[0]].store(result[1])
+    for finding, vulnerability in result.vulnerabilities:
+        stores[finding].store(vulnerability)
+    CTX.value_to_add.merge(result.value_to_add)
 
 
 def _handle_exception(
@@ -243,32 +334,29 @@ def analyze(
 
     all_paths = paths.get_all()
     unique_paths_count: int = len(all_paths)
+    workers: int = os.cpu_count() or 1
 
-    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
-        reactivex.of(*all_paths).pipe(
-            ops.flat_map_indexed(
-                lambda path, index: reactivex.from_future(  # type: ignore
+    # The path sets are sent once per worker instead of once per task
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(
+            get_snapshot(),
+            frozenset(paths.nu_paths),
+            frozenset(paths.nv_paths),
+        ),
+    ) as executor:
+        reactivex.from_iterable(_get_chunks(all_paths, workers)).pipe(
+            ops.flat_map(
+                lambda chunk: reactivex.from_future(  # type: ignore
                     executor.submit(  # type: ignore
-                        _analyze_one_path,
-                        index=index,
-                        path=path,
-                        unique_nu_paths=set(paths.nu_paths),
-                        unique_nv_paths=set(paths.nv_paths),
-                        unique_paths_count=unique_paths_count,
+                        _analyze_paths,
+                        chunk,
+                        unique_paths_count,
                     )
                 ).pipe(ops.catch(_handle_exception))
             ),
             ops.filter(lambda x: x is not None),  # type: ignore
-            ops.flat_map(
-                lambda res: reactivex.of(  # type: ignore
-                    *[
-                        (finding, vuln)
-                        for finding, vulns_list in res.items()  # type: ignore
-                        for vulns in vulns_list
-                        for vuln in vulns
-                    ]
-                )
-            ),
         ).subscribe(
             on_next=partial(_handle_result, stores),
             on_error=lambda e: log_blocking("exception", e),  # type: ignore
@@ -56,7 +56,6 @@ from sca import (
     get_vulnerabilities,
 )
 from serializers import (
-    make_snippet,
     SnippetViewport,
 )
 from typing import (
@@ -70,6 +69,9 @@ from utils.function import (
     shield,
     shield_blocking,
 )
+from utils.snippets import (
+    make_snippet,
+)
 from vulnerabilities import (
     build_lines_vuln,
     build_metadata,
@@ -370,51 +372,54 @@ async def _translate_dependencies_to_vulnerabilities(
     platform: core_model.Platform,
     method: core_model.MethodsEnum,
 ) -> core_model.Vulnerabilities:
+    all_dependencies: tuple[DependencyType, ...] = tuple(dependencies)
+    versions_by_product: dict[str, list[str]] = {}
+    for product, version in all_dependencies:
+        versions_by_product.setdefault(product["item"], []).append(
+            version["item"]
+        )
     try:
-        # pylint: disable=consider-using-generator
+        vulnerabilities: dict[str, dict[str, list[str]]] = {
+            product: await get_vulnerabilities(platform, product, versions)
+            for product, versions in versions_by_product.items()
+        }
         results: core_model.Vulnerabilities = tuple(
-            [
-                build_lines_vuln(
+            build_lines_vuln(
+                method=method,
+                what=" ".join(
+                    (
+                        path,
+                        f'({product["item"]} v{version["item"]})',
+                        f"[{', '.join(cve)}]",
+                    )
+                ),
+                where=str(product["line"]),
+                metadata=build_metadata(
                     method=method,
-                    what=" ".join(
-                        (
-                            path,
-                            f'({product["item"]} v{version["item"]})',
-                            f"[{', '.join(cve)}]",
+                    description=(
+                        t(
+                            key=(
+                                "src.lib_path.f011."
+                                "npm_package_json.description"
+                            ),
+                            product=product["item"],
+                            version=version["item"],
+                            cve=cve,
                         )
+                        + f" {t(key='words.in')} "
+                        f"{CTX.config.namespace}/{path}"
                     ),
-                    where=str(product["line"]),
-                    metadata=build_metadata(
-                        method=method,
-                        description=(
-                            t(
-                                key=(
-                                    "src.lib_path.f011."
-                                    "npm_package_json.description"
-                                ),
-                                product=product["item"],
-                                version=version["item"],
-                                cve=cve,
-                            )
-                            + f" {t(key='words.in')} "
-                            f"{CTX.config.namespace}/{path}"
+                    snippet=make_snippet(
+                        content=content,
+                        viewport=SnippetViewport(
+                            column=product["column"],
+                            line=product["line"],
                         ),
-                        snippet=make_snippet(
-                            content=content,
-                            viewport=SnippetViewport(
-                                column=product["column"],
-                                line=product["line"],
-                            ),
-                        ).content,
-                    ),
-                )
-                for product, version in dependencies
-                if (
-                    cve := await get_vulnerabilities(
-                        platform, product["item"], version["item"]
-                    )
-                )
-            ]
+                    ).content,
+                ),
+            )
+            for product, version in all_dependencies
+            if (cve := vulnerabilities[product["item"]][version["item"]])
         )
     finally:
         await dynamo_shutdown()
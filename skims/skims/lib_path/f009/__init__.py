@@ -25,9 +25,6 @@ from lib_path.f009.java import (
 from model.core_model import (
     Vulnerabilities,
 )
-from parse_cfn.loader import (
-    load_templates_blocking,
-)
 from typing import (
     Any,
 )
@@ -79,6 +76,7 @@ def analyze(
     file_extension: str,
     file_name: str,
     path: str,
+    templates_generator: Callable[[], tuple[Any, ...]],
     **_: None,
 ) -> tuple[Vulnerabilities, ...]:
 
@@ -114,9 +112,7 @@ def analyze(
             *results,
             *(
                 run_docker_compose_env_secrets(content, path, template)
-                for template in load_templates_blocking(
-                    content, fmt=file_extension
-                )
+                for template in templates_generator()
             ),
         )
 
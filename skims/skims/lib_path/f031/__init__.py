@@ -12,9 +12,6 @@ from lib_path.f031.cloudformation import (
 from model.core_model import (
     Vulnerabilities,
 )
-from parse_cfn.loader import (
-    load_templates_blocking,
-)
 from typing import (
     Any,
 )
@@ -51,13 +48,14 @@ def analyze(
     content_generator: Callable[[], str],
     file_extension: str,
     path: str,
+    templates_generator: Callable[[], tuple[Any, ...]],
     **_: None,
 ) -> tuple[Vulnerabilities, ...]:
     results: tuple[Vulnerabilities, ...] = ()
 
     content = content_generator()
     if file_extension in EXTENSIONS_CLOUDFORMATION:
-        for template in load_templates_blocking(content, fmt=file_extension):
+        for template in templates_generator():
             results = (
                 *results,
                 *(
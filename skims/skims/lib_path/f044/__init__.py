@@ -14,9 +14,6 @@ from lib_path.f044.conf_files import (
 from model.core_model import (
     Vulnerabilities,
 )
-from parse_cfn.loader import (
-    load_templates_blocking,
-)
 from typing import (
     Any,
 )
@@ -44,6 +41,7 @@ def analyze(
     content_generator: Callable[[], str],
     file_extension: str,
     path: str,
+    templates_generator: Callable[[], tuple[Any, ...]],
     **_: None,
 ) -> tuple[Vulnerabilities, ...]:
     results: tuple[Vulnerabilities, ...] = ()
@@ -51,7 +49,7 @@ def analyze(
     if file_extension in EXTENSIONS_CLOUDFORMATION:
         content = content_generator()
 
-        for template in load_templates_blocking(content, fmt=file_extension):
+        for template in templates_generator():
             results = (
                 *results,
                 run_severless_bucket_has_https_methos_enabled(
@@ -11,9 +11,6 @@ from lib_path.f099.cloudformation import (
 from model.core_model import (
     Vulnerabilities,
 )
-from parse_cfn.loader import (
-    load_templates_blocking,
-)
 from typing import (
     Any,
 )
@@ -33,13 +30,14 @@ def analyze(
     content_generator: Callable[[], str],
     file_extension: str,
     path: str,
+    templates_generator: Callable[[], tuple[Any, ...]],
     **_: None,
 ) -> tuple[Vulnerabilities, ...]:
     results: tuple[Vulnerabilities, ...] = ()
 
     if file_extension in EXTENSIONS_CLOUDFORMATION:
         content = content_generator()
-        for template in load_templates_blocking(content, fmt=file_extension):
+        for template in templates_generator():
             results = (
                 *results,
                 run_cfn_bucket_policy_has_server_side_encryption_disabled(
@@ -11,9 +11,6 @@ from lib_path.f134.serverless import (
 from model.core_model import (
     Vulnerabilities,
 )
-from parse_cfn.loader import (
-    load_templates_blocking,
-)
 from typing import (
     Any,
 )
@@ -33,13 +30,14 @@ def analyze(
     content_generator: Callable[[], str],
     file_extension: str,
     path: str,
+    templates_generator: Callable[[], tuple[Any, ...]],
     **_: None,
 ) -> tuple[Vulnerabilities, ...]:
     results: tuple[Vulnerabilities, ...] = ()
 
     if file_extension in EXTENSIONS_YAML:
         content = content_generator()
-        for template in load_templates_blocking(content, fmt=file_extension):
+        for template in templates_generator():
             results = (run_severless_cors_wildcard(content, path, template),)
 
     return results
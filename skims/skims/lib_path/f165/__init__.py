@@ -14,9 +14,6 @@ from lib_path.f165.cloudformation import (
 from model.core_model import (
     Vulnerabilities,
 )
-from parse_cfn.loader import (
-    load_templates_blocking,
-)
 from typing import (
     Any,
 )
@@ -63,6 +60,7 @@ def analyze(
     content_generator: Callable[[], str],
     file_extension: str,
     path: str,
+    templates_generator: Callable[[], tuple[Any, ...]],
     **_: None,
 ) -> tuple[Vulnerabilities, ...]:
     results: tuple[Vulnerabilities, ...] = ()
@@ -71,7 +69,7 @@ def analyze(
 
     if file_extension in EXTENSIONS_CLOUDFORMATION:
 
-        for template in load_templates_blocking(content, fmt=file_extension):
+        for template in templates_generator():
             results = (
                 *results,
                 run_cfn_iam_allow_not_principal_trust_policy(
@@ -19,9 +19,6 @@ from lib_path.f267.kubernetes import (
 from model.core_model import (
     Vulnerabilities,
 )
-from parse_cfn.loader import (
-    load_templates_blocking,
-)
 from typing import (
     Any,
 )
@@ -109,6 +106,7 @@ def analyze(
     content_generator: Callable[[], str],
     file_extension: str,
     path: str,
+    templates_generator: Callable[[], tuple[Any, ...]],
     **_: None,
 ) -> tuple[Vulnerabilities, ...]:
 
@@ -116,7 +114,7 @@ def analyze(
 
     if file_extension in EXTENSIONS_CLOUDFORMATION:
         content = content_generator()
-        for template in load_templates_blocking(content, fmt=file_extension):
+        for template in templates_generator():
             results = (
                 *results,
                 run_k8s_check_add_capability(content, path, template),
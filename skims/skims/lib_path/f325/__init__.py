@@ -17,9 +17,6 @@ from lib_path.f325.cloudformation import (
 from model.core_model import (
     Vulnerabilities,
 )
-from parse_cfn.loader import (
-    load_templates_blocking,
-)
 from typing import (
     Any,
 )
@@ -93,6 +90,7 @@ def analyze(
     content_generator: Callable[[], str],
     file_extension: str,
     path: str,
+    templates_generator: Callable[[], tuple[Any, ...]],
     **_: None,
 ) -> tuple[Vulnerabilities, ...]:
     results: tuple[Vulnerabilities, ...] = ()
@@ -101,7 +99,7 @@ def analyze(
 
     if file_extension in EXTENSIONS_CLOUDFORMATION:
 
-        for template in load_templates_blocking(content, fmt=file_extension):
+        for template in templates_generator():
             results = (
                 *results,
                 run_cfn_kms_key_has_master_keys_exposed_to_everyone(
@@ -11,9 +11,6 @@ from lib_path.f332.kubernetes import (
 from model.core_model import (
     Vulnerabilities,
 )
-from parse_cfn.loader import (
-    load_templates_blocking,
-)
 from typing import (
     Any,
 )
@@ -32,6 +29,7 @@ def analyze(
     content_generator: Callable[[], str],
     file_extension: str,
     path: str,
+    templates_generator: Callable[[], tuple[Any, ...]],
     **_: None,
 ) -> tuple[Vulnerabilities, ...]:
     results: tuple[Vulnerabilities, ...] = ()
@@ -43,9 +41,7 @@ def analyze(
             *results,
             *(
                 run_kubernetes_insecure_port(content, path, template)
-                for template in load_templates_blocking(
-                    content, fmt=file_extension
-                )
+                for template in templates_generator()
             ),
         )
     return results
@@ -11,9 +11,6 @@ from lib_path.f363.cloudformation import (
 from model.core_model import (
     Vulnerabilities,
 )
-from parse_cfn.loader import (
-    load_templates_blocking,
-)
 from typing import (
     Any,
 )
@@ -33,6 +30,7 @@ def analyze(
     content_generator: Callable[[], str],
     file_extension: str,
     path: str,
+    templates_generator: Callable[[], tuple[Any, ...]],
     **_: None,
 ) -> tuple[Vulnerabilities, ...]:
     results: tuple[Vulnerabilities, ...] = ()
@@ -44,9 +42,7 @@ def analyze(
                 run_cfn_insecure_generate_secret_string(
                     content, path, template
                 )
-                for template in load_templates_blocking(
-                    content, fmt=file_extension
-                )
+                for template in templates_generator()
             ),
         )
 
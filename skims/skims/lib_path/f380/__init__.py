@@ -20,9 +20,6 @@ from metaloaders.model import (
 from model.core_model import (
     Vulnerabilities,
 )
-from parse_cfn.loader import (
-    load_templates_blocking,
-)
 
 
 @SHIELD_BLOCKING
@@ -50,6 +47,7 @@ def analyze(
     file_extension: str,
     file_name: str,
     path: str,
+    templates_generator: Callable[[], tuple[Node, ...]],
     **_: None,
 ) -> tuple[Vulnerabilities, ...]:
     results: tuple[Vulnerabilities, ...] = ()
@@ -67,9 +65,7 @@ def analyze(
             *results,
             *(
                 run_docker_compose_image_has_digest(content, path, template)
-                for template in load_templates_blocking(
-                    content, fmt=file_extension
-                )
+                for template in templates_generator()
             ),
         )
     return results
@@ -13,9 +13,6 @@ from lib_path.f418.docker import (
 from model.core_model import (
     Vulnerabilities,
 )
-from parse_cfn.loader import (
-    load_templates_blocking,
-)
 from typing import (
     Any,
 )
@@ -47,6 +44,7 @@ def analyze(
     file_extension: str,
     file_name: str,
     path: str,
+    templates_generator: Callable[[], tuple[Any, ...]],
     **_: None,
 ) -> tuple[Vulnerabilities, ...]:
 
@@ -58,9 +56,7 @@ def analyze(
             *results,
             *(
                 run_docker_compose_read_only(content, path, template)
-                for template in load_templates_blocking(
-                    content, fmt=file_extension
-                )
+                for template in templates_generator()
             ),
         )
     elif file_name in NAMES_DOCKERFILE:
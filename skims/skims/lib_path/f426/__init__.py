@@ -14,9 +14,6 @@ from metaloaders.model import (
 from model.core_model import (
     Vulnerabilities,
 )
-from parse_cfn.loader import (
-    load_templates_blocking,
-)
 
 
 @SHIELD_BLOCKING
@@ -31,6 +28,7 @@ def analyze(
     content_generator: Callable[[], str],
     file_extension: str,
     path: str,
+    templates_generator: Callable[[], tuple[Node, ...]],
     **_: None,
 ) -> tuple[Vulnerabilities, ...]:
 
@@ -42,9 +40,7 @@ def analyze(
             *results,
             *(
                 run_k8s_image_has_digest(content, path, template)
-                for template in load_templates_blocking(
-                    content, fmt=file_extension
-                )
+                for template in templates_generator()
             ),
         )
     return results
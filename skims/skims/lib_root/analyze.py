@@ -1,4 +1,5 @@
 from concurrent.futures import (
+    FIRST_COMPLETED,
     Future,
     wait,
 )
@@ -10,6 +11,8 @@ from contextlib import (
 )
 from ctx import (
     CTX,
+    get_snapshot,
+    load_snapshot,
 )
 from functools import (
     partial,
@@ -121,17 +124,50 @@ from model import (
     core_model,
     graph_model,
 )
-from model.core_model import (
-    Vulnerability,
-)
+import json
 import os
 from sast.parse import (
     get_graph_db,
 )
+from sast.query import (
+    get_query_manifest,
+)
 from state.ephemeral import (
     EphemeralStore,
+    iterate_segment,
+    write_to_segment,
+)
+import tempfile
+import time
+from typing import (
+    NamedTuple,
+)
+from utils.budget import (
+    budget,
+    BudgetExceeded,
+)
+from utils.fs import (
+    decide_language,
+)
+from utils.graph import (
+    get_node_types,
+)
+from utils.logs import (
+    log_blocking,
+)
+from utils.timings import (
+    flush_timings,
+    timed,
 )
 
+# Constants
+# Seconds the workers are given past SHARD_TIMEOUT before being killed
+KILL_GRACE: float = 30.0
+QUERY_RSS_GROWTH: int = 1024**3
+QUERY_TIMEOUT: float = 30.0
+SHARD_TIMEOUT: float = 120.0
+# State of each worker process, set by its initializer
+WORKER: dict[str, str] = {}
 QUERIES: graph_model.Queries = (
     *f001.QUERIES,
     *f004.QUERIES,
@@ -234,16 +270,163 @@ QUERIES: graph_model.Queries = (
 )
 
 
-def _store_results_callback(
-    stores: dict[core_model.FindingEnum, EphemeralStore],
+class SkippedQuery(NamedTuple):
+    path: str
+    finding: str | None
+    query: str | None
+    reason: str
+
+
+def _get_queries_by_language(
+    queries: graph_model.Queries,
+) -> dict[graph_model.GraphShardMetadataLanguage, graph_model.Queries]:
+    return {
+        language: tuple(
+            (finding, query)
+            for finding, query in queries
+            if language in get_query_manifest(query).languages
+        )
+        for language in graph_model.GraphShardMetadataLanguage
+    }
+
+
+def _filter_by_node_types(
+    queries: graph_model.Queries,
+    graph_db: graph_model.GraphDB,
+) -> graph_model.Queries:
+    node_types: set[str] = set()
+    for shard in graph_db.shards:
+        if shard.syntax_graph is not None:
+            node_types.update(get_node_types(shard.syntax_graph))
+
+    return tuple(
+        (finding, query)
+        for finding, query in queries
+        if not (manifest := get_query_manifest(query)).node_types
+        or not manifest.node_types.isdisjoint(node_types)
+    )
+
+
+def _initialize_worker(snapshot: dict, results_folder: str) -> None:
+    load_snapshot(snapshot)
+    WORKER["segment"] = os.path.join(results_folder, f"{os.getpid()}")
+
+
+def _run_queries(
+    queries: graph_model.Queries,
+    graph_db: graph_model.GraphDB,
+    path: str,
+    deadline: float,
+) -> tuple[SkippedQuery, ...]:
+    skipped: list[SkippedQuery] = []
+    for finding, query in _filter_by_node_types(queries, graph_db):
+        name = f"{query.__module__}.{query.__name__}"
+        if (seconds := min(QUERY_TIMEOUT, deadline - time.monotonic())) <= 0:
+            skipped.append(
+                SkippedQuery(path, finding.name, name, "shard_timeout")
+            )
+            continue
+        try:
+            with timed(name), budget(seconds, QUERY_RSS_GROWTH):
+                results = query(graph_db)
+        except BudgetExceeded as exc:
+            log_blocking(
+                "warning",
+                "Query %s of %s went over its %s budget in %s",
+                query.__name__,
+                finding.name,
+                exc.reason,
+                path,
+            )
+            skipped.append(SkippedQuery(path, finding.name, name, exc.reason))
+            continue
+        except Exception as exc:  # pylint: disable=broad-except
+            log_blocking(
+                "warning",
+                "Query %s of %s failed: %s",
+                query.__name__,
+                finding.name,
+                exc,
+            )
+            continue
+        # Results leave the worker as soon as each query is done, so they
+        # survive the worker being killed over a later query
+        if results:
+            write_to_segment(WORKER["segment"], *results)
+    return tuple(skipped)
+
+
+def _analyze_path(
+    path: str,
+    queries: graph_model.Queries,
+) -> tuple[SkippedQuery, ...]:
+    """Parse `path` and run the queries that apply to it, in a worker.
+
+    Vulnerabilities are streamed to the results folder of the worker,
+    only the queries skipped for going over their budget are returned.
+    The syntax graphs never leave the worker that built them.
+    """
+    deadline = time.monotonic() + SHARD_TIMEOUT
+    try:
+        try:
+            with budget(SHARD_TIMEOUT, QUERY_RSS_GROWTH):
+                graph_db = get_graph_db(paths=(path,))
+        except BudgetExceeded as exc:
+            log_blocking(
+                "warning",
+                "Parsing went over its %s budget in %s",
+                exc.reason,
+                path,
+            )
+            return (SkippedQuery(path, None, None, exc.reason),)
+        if not graph_db.shards:
+            return ()
+        return _run_queries(queries, graph_db, path, deadline)
+    finally:
+        flush_timings()
+
+
+def _store_skipped_callback(
+    skipped: list[SkippedQuery],
     future: Future,
 ) -> None:
     with suppress(Exception):
-        results: tuple[Vulnerability, ...] = future.result()
-        for result in results:
+        skipped.extend(future.result())
+
+
+def _store_results(
+    stores: dict[core_model.FindingEnum, EphemeralStore],
+    results_folder: str,
+) -> None:
+    for name in sorted(os.listdir(results_folder)):
+        for result in iterate_segment(os.path.join(results_folder, name)):
             stores[result.finding].store(result)
 
 
+def _write_skipped_report(skipped: list[SkippedQuery]) -> None:
+    if not skipped:
+        return
+
+    log_blocking(
+        "warning",
+        "%s queries went over their budget and were skipped",
+        len(skipped),
+    )
+    if CTX.config.output is None:
+        return
+
+    file_path = (
+        f"{os.path.splitext(CTX.config.output.file_path)[0]}.skipped.json"
+    )
+    with open(file_path, "w", encoding="utf-8") as handle:
+        json.dump(
+            [item._asdict() for item in sorted(skipped, key=str)],
+            handle,
+            indent=2,
+        )
+    log_blocking("info", "The skipped queries were written to: %s", file_path)
+
+
 def analyze(
     *,
     stores: dict[core_model.FindingEnum, EphemeralStore],
@@ -254,26 +437,85 @@ def analyze(
         for finding, query in QUERIES
         if finding in CTX.config.checks
     )
-    has_failed = False
-    with ProcessPoolExecutor(
-        max_workers=os.cpu_count(),
-    ) as worker:
-        for path in paths.ok_paths:
-            _graph = get_graph_db(paths=(path,))
-            futures = []
-            for _, query in queries:
-                future = worker.submit(query, _graph)
-                future.add_done_callback(
-                    partial(_store_results_callback, stores)
+    if not queries:
+        return
+
+    queries_by_language = _get_queries_by_language(queries)
+    workers = os.cpu_count() or 1
+    skipped: list[SkippedQuery] = []
+    # Each task parses a single file in the worker and runs the queries of
+    # its language against it, so parsing is spread across all processes.
+    # Files no query can match are not even parsed
+    pending = (
+        (path, path_queries)
+        for path in paths.ok_paths
+        if (path_queries := queries_by_language[decide_language(path)])
+    )
+    running: dict[Future, tuple[str, float]] = {}
+    stuck: dict[Future, str] = {}
+    with tempfile.TemporaryDirectory() as results_folder:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_worker,
+            initargs=(get_snapshot(), results_folder),
+        ) as worker:
+            while True:
+                # A task is only submitted when a process is free to start
+                # it, so its deadline counts from the moment it starts
+                stuck = {
+                    future: path
+                    for future, path in stuck.items()
+                    if not future.done()
+                }
+                while len(running) + len(stuck) < workers and (
+                    task := next(pending, None)
+                ):
+                    future = worker.submit(_analyze_path, *task)
+                    future.add_done_callback(
+                        partial(_store_skipped_callback, skipped)
+                    )
+                    running[future] = (
+                        task[0],
+                        time.monotonic() + SHARD_TIMEOUT + KILL_GRACE,
+                    )
+                if not running:
+                    break
+
+                wait(
+                    running,
+                    max(
+                        min(deadline for _, deadline in running.values())
+                        - time.monotonic(),
+                        0,
+                    ),
+                    return_when=FIRST_COMPLETED,
                 )
-                futures.append(future)
-            _, f_failed = wait(futures, 60)
-            if f_failed and not has_failed:
-                has_failed = True
-        if has_failed:
-            for (
-                process
-            ) in (
-                worker._processes.values()  # pylint: disable=protected-access
-            ):
-                process.kill()
+                now = time.monotonic()
+                for future, (path, deadline) in tuple(running.items()):
+                    if future.done():
+                        del running[future]
+                    elif deadline <= now:
+                        # Budgets are enforced within the workers, this
+                        # only catches those stuck where a budget cannot
+                        # interrupt them. They keep their process busy
+                        # until every other task is done
+                        del running[future]
+                        stuck[future] = path
+            if stuck := {
+                future: path
+                for future, path in stuck.items()
+                if not future.done()
+            }:
+                for (
+                    process
+                ) in (
+                    worker._processes.values()  # pylint: disable=protected-access
+                ):
+                    process.kill()
+        # Files left when every process got stuck are never analyzed
+        skipped.extend(
+            SkippedQuery(path, None, None, "killed")
+            for path in (*stuck.values(), *(path for path, _ in pending))
+        )
+        _store_results(stores, results_folder)
+    _write_skipped_report(skipped)
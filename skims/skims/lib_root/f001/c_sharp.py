@@ -19,6 +19,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -61,6 +62,10 @@ def is_execute_danger(graph: Graph, n_id: str, method: MethodsEnum) -> bool:
     return False
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.CSHARP},
+    node_types={"MethodInvocation", "ObjectCreation"},
+)
 def sql_injection(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -90,6 +95,10 @@ def sql_injection(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.CSHARP},
+    node_types={"MemberAccess"},
+)
 def sql_user_params(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
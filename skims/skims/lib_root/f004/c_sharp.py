@@ -15,12 +15,17 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
 )
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"MethodInvocation"},
+)
 def remote_command_execution(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_REMOTE_COMMAND_EXECUTION
     danger_p1 = {"UserConnection", "UserParams"}
@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -58,6 +59,10 @@ def is_danger_expression(graph: Graph, n_id: NId, method: MethodsEnum) -> bool:
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.PYTHON},
+    node_types={"MethodInvocation"},
+)
 def python_remote_command_execution(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -12,12 +12,17 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
 )
 
 
+@query_manifest(
+    languages={GraphLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def csrf_protections_disabled(graph_db: GraphDB) -> Vulnerabilities:
     csrf_methods = {"disable", "ignoringAntMatchers"}
 
@@ -21,6 +21,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -40,6 +41,10 @@ def search_member_accessed(graph: Graph, members: Set[str]) -> Iterator[NId]:
             yield parent
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"MemberAccess", "MethodInvocation"},
+)
 def insec_addheader_write(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_INSEC_ADDHEADER_WRITE
     danger_methods = {"AddHeader", "Write"}
@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -45,6 +46,10 @@ def is_xss_content_creation(
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def unsafe_xss_content(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.JAVA_UNSAFE_XSS_CONTENT
     danger_methods = {"format", "write", "println", "printf", "print"}
@@ -17,9 +17,14 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(
+    languages={GraphLanguage.TYPESCRIPT},
+    node_types={"MethodInvocation"},
+)
 def unsafe_xss_content(
     graph_db: graph_model.GraphDB,
 ) -> core_model.Vulnerabilities:
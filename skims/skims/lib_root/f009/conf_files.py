@@ -19,6 +19,7 @@ from model.graph_model import (
 import re
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
@@ -79,6 +80,7 @@ def _sensitive_key_in_json(key_pair: str, value: str) -> bool:
     return False
 
 
+@query_manifest(languages={GraphLanguage.JSON}, node_types={"Pair"})
 def sensitive_key_in_json(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -103,6 +105,7 @@ def sensitive_key_in_json(
     )
 
 
+@query_manifest(languages={GraphLanguage.JSON}, node_types={"Pair"})
 def sensitive_info_in_dotnet(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -127,6 +130,7 @@ def sensitive_info_in_dotnet(
     )
 
 
+@query_manifest(languages={GraphLanguage.JSON}, node_types={"Pair"})
 def sensitive_info_json(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -15,6 +15,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.utils import (
     get_object_identifiers,
@@ -48,6 +49,10 @@ def is_insec_squema(
     return None
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"ObjectCreation"},
+)
 def xsl_transform_object(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -77,6 +82,10 @@ def xsl_transform_object(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"MethodInvocation"},
+)
 def schema_by_url(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
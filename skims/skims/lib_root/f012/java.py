@@ -15,6 +15,7 @@ from model.graph_model import (
 import re
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -101,6 +102,7 @@ def analyze_jpa_node(
     return False
 
 
+@query_manifest(languages={GraphLanguage.JAVA}, node_types={"Annotation"})
 def jpa_like(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -19,6 +19,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -40,6 +41,7 @@ def _azure_virtual_machine_insecure_authentication(
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_virtual_machine_insecure_authentication(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -67,6 +69,7 @@ def tfm_azure_virtual_machine_insecure_authentication(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_linux_vm_insecure_authentication(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -20,6 +20,7 @@ from model.graph_model import (
 from sast.query import (
     get_vulnerabilities_from_n_ids,
     get_vulnerabilities_from_n_ids_metadata,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -66,6 +67,7 @@ def is_insecure_protocol(
     return False
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def weak_protocol(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_WEAK_PROTOCOL
     weak_protocols = ["Ssl3", "Tls", "Tls11", "None"]
@@ -95,6 +97,7 @@ def weak_protocol(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def service_point_manager_disabled(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_SERVICE_POINT_MANAGER_DISABLED
 
@@ -120,6 +123,10 @@ def service_point_manager_disabled(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"MethodInvocation"},
+)
 def insecure_shared_access_protocol(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_INSECURE_SHARED_ACCESS_PROTOCOL
 
@@ -141,6 +148,10 @@ def insecure_shared_access_protocol(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"ObjectCreation"},
+)
 def httpclient_no_revocation_list(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_HTTPCLIENT_NO_REVOCATION_LIST
 
@@ -25,6 +25,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.graph import (
     adj_ast,
@@ -84,6 +85,10 @@ def _serves_content_over_insecure_protocols(
             yield from _helper_insecure_protocols(graph, origin_attr)
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_serves_content_over_insecure_protocols(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -114,6 +119,10 @@ def cfn_serves_content_over_insecure_protocols(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_elb_without_sslpolicy(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
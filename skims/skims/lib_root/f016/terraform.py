@@ -21,6 +21,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 VULNERABLE_ORIGIN_SSL_PROTOCOLS = ["SSLv3", "TLSv1", "TLSv1.1"]
@@ -81,6 +82,7 @@ def _aws_serves_content_over_insecure_protocols(
         yield ssl_prot[2]
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_aws_serves_content_over_insecure_protocols(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -106,6 +108,7 @@ def tfm_aws_serves_content_over_insecure_protocols(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_serves_content_over_insecure_protocols(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -131,6 +134,7 @@ def tfm_azure_serves_content_over_insecure_protocols(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_aws_elb_without_sslpolicy(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
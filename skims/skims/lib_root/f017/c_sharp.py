@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -63,6 +64,7 @@ def check_pred(graph: Graph, depth: int = 1, elem_jwt: str = "0") -> bool:
     return signed
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def verify_decoder(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_VERIFY_DECODER
 
@@ -84,6 +86,10 @@ def verify_decoder(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"MemberAccess", "ObjectCreation"},
+)
 def jwt_signed(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_JWT_SIGNED
     object_name = {"JwtBuilder"}
@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -27,6 +28,10 @@ from symbolic_eval.utils import (
 )
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"MethodInvocation"},
+)
 def xpath_injection(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_XPATH_INJECTION
     danger_meths = {"SelectSingleNode"}
@@ -55,6 +60,10 @@ def xpath_injection(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"MethodInvocation"},
+)
 def xpath_injection_evaluate(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_XPATH_INJECTION_EVALUATE
     danger_meths = {"Evaluate"}
@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
@@ -31,6 +32,10 @@ def is_unsafe_param(graph: Graph, n_id: NId) -> bool:
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.KOTLIN},
+    node_types={"MethodInvocation"},
+)
 def unencrypted_channel(graph_db: GraphDB) -> Vulnerabilities:
     danger_methods = {"FTPClient", "SMTPClient", "TelnetClient"}
 
@@ -31,6 +31,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -226,6 +227,10 @@ def _allows_anyone_to_admin_ports(graph: Graph, nid: NId) -> Iterator[NId]:
             yield to_port_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_allows_anyone_to_admin_ports(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -252,6 +257,10 @@ def cfn_allows_anyone_to_admin_ports(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_unrestricted_cidrs(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -278,6 +287,10 @@ def cfn_unrestricted_cidrs(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_ec2_has_security_groups_ip_ranges_in_rfc1918(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -310,6 +323,10 @@ def cfn_ec2_has_security_groups_ip_ranges_in_rfc1918(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_ec2_has_open_all_ports_to_the_public(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -340,6 +357,10 @@ def cfn_ec2_has_open_all_ports_to_the_public(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_ec2_has_unrestricted_dns_access(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -368,6 +389,10 @@ def cfn_ec2_has_unrestricted_dns_access(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_ec2_has_unrestricted_ftp_access(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -396,6 +421,10 @@ def cfn_ec2_has_unrestricted_ftp_access(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_ec2_has_unrestricted_ports(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -424,6 +453,10 @@ def cfn_ec2_has_unrestricted_ports(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_unrestricted_ip_protocols(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -452,6 +485,10 @@ def cfn_unrestricted_ip_protocols(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_groups_without_egress(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -478,6 +515,10 @@ def cfn_groups_without_egress(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_instances_without_profile(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
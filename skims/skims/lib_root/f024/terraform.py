@@ -36,6 +36,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -280,6 +281,7 @@ def _ec2_has_open_all_ports_to_the_public(
             yield from_port_id
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ec2_has_open_all_ports_to_the_public(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -310,6 +312,7 @@ def tfm_ec2_has_open_all_ports_to_the_public(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ec2_has_unrestricted_ftp_access(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -338,6 +341,7 @@ def tfm_ec2_has_unrestricted_ftp_access(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ec2_has_unrestricted_dns_access(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -366,6 +370,7 @@ def tfm_ec2_has_unrestricted_dns_access(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ec2_has_security_groups_ip_ranges_in_rfc1918(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -398,6 +403,7 @@ def tfm_ec2_has_security_groups_ip_ranges_in_rfc1918(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_aws_ec2_unrestricted_cidrs(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -424,6 +430,7 @@ def tfm_aws_ec2_unrestricted_cidrs(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_aws_ec2_cfn_unrestricted_ip_protocols(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -452,6 +459,7 @@ def tfm_aws_ec2_cfn_unrestricted_ip_protocols(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ec2_has_unrestricted_ports(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -478,6 +486,7 @@ def tfm_ec2_has_unrestricted_ports(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_aws_allows_anyone_to_admin_ports(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -505,6 +514,7 @@ def tfm_aws_allows_anyone_to_admin_ports(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ec2_instances_without_profile(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -528,6 +538,7 @@ def tfm_ec2_instances_without_profile(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_aws_ec2_allows_all_outbound_traffic(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -23,6 +23,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.graph import (
     adj_ast,
@@ -67,6 +68,10 @@ def _iam_has_full_access_to_ssm(graph: Graph, nid: NId) -> Iterator[NId]:
             yield action_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_iam_has_full_access_to_ssm(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -93,6 +98,10 @@ def cfn_iam_has_full_access_to_ssm(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_admin_policy_attached(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -119,6 +128,10 @@ def cfn_admin_policy_attached(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_iam_user_missing_role_based_security(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -39,6 +39,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.function import (
     get_dict_values,
@@ -450,6 +451,7 @@ def _iam_excessive_role_policy(
                 )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_iam_excessive_role_policy(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -484,6 +486,7 @@ def tfm_iam_excessive_role_policy(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_open_passrole(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -513,6 +516,7 @@ def tfm_open_passrole(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_negative_statement(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -542,6 +546,7 @@ def tfm_negative_statement(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_iam_has_full_access_to_ssm(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -571,6 +576,7 @@ def tfm_iam_has_full_access_to_ssm(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_bucket_policy_allows_public_access(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -600,6 +606,7 @@ def tfm_bucket_policy_allows_public_access(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_admin_policy_attached(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -628,6 +635,7 @@ def tfm_admin_policy_attached(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_iam_user_missing_role_based_security(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -651,6 +659,7 @@ def tfm_iam_user_missing_role_based_security(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_iam_excessive_privileges(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -67,6 +68,10 @@ def is_weak_random(
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def java_weak_random(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.JAVA_WEAK_RANDOM_COOKIE
     danger_methods = {"setAttribute", "addCookie"}
@@ -15,6 +15,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -102,6 +103,7 @@ def get_eval_danger(method: MethodsEnum, graph: Graph, n_id: NId) -> bool:
 
 
 # https://docs.microsoft.com/es-es/aspnet/core/security/authentication/identity-configuration
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def weak_credential_policy(graph_db: GraphDB) -> Vulnerabilities:
     def n_ids() -> Iterator[GraphShardNode]:
         for shard in graph_db.shards_by_language(GraphLanguage.CSHARP):
@@ -120,6 +122,7 @@ def weak_credential_policy(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def no_password(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_NO_PASSWORD
     bad_types = {"Microsoft", "EntityFrameworkCore", "DbContextOptionsBuilder"}
@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -49,6 +50,10 @@ def is_insecure_cookie_object(
     return None
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"ObjectCreation"},
+)
 def insecurely_generated_cookies(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_INSEC_COOKIES
     object_name = {"HttpCookie"}
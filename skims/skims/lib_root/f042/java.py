@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -58,6 +59,10 @@ def analyze_insecure_cookie(
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def java_insecure_cookie(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
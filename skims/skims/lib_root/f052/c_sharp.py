@@ -23,6 +23,7 @@ from model.graph_model import (
 from sast.query import (
     get_vulnerabilities_from_n_ids,
     get_vulnerabilities_from_n_ids_metadata,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -105,6 +106,10 @@ def is_managed_mode_insecure(graph: Graph, n_id: NId) -> NId | None:
     return None
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.CSHARP},
+    node_types={"ObjectCreation"},
+)
 def c_sharp_insecure_keys(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_INSECURE_KEYS
 
@@ -128,6 +133,10 @@ def c_sharp_insecure_keys(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.CSHARP},
+    node_types={"MemberAccess"},
+)
 def c_sharp_rsa_secure_mode(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_RSA_SECURE_MODE
 
@@ -164,6 +173,10 @@ def c_sharp_rsa_secure_mode(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.CSHARP},
+    node_types={"ObjectCreation"},
+)
 def c_sharp_managed_secure_mode(graph_db: GraphDB) -> Vulnerabilities:
     insecure_objects = {"AesManaged"}
 
@@ -189,6 +202,10 @@ def c_sharp_managed_secure_mode(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.CSHARP},
+    node_types={"MemberAccess", "ObjectCreation"},
+)
 def c_sharp_insecure_cipher(graph_db: GraphDB) -> Vulnerabilities:
     c_sharp = GraphShardMetadataLanguage.CSHARP
     insecure_ciphers = {
@@ -225,6 +242,10 @@ def c_sharp_insecure_cipher(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.CSHARP},
+    node_types={"MemberAccess", "ObjectCreation"},
+)
 def c_sharp_insecure_hash(graph_db: GraphDB) -> Vulnerabilities:
     c_sharp = GraphShardMetadataLanguage.CSHARP
 
@@ -264,6 +285,10 @@ def c_sharp_insecure_hash(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.CSHARP},
+    node_types={"MemberAccess"},
+)
 def c_sharp_disabled_strong_crypto(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_DISABLED_STRONG_CRYPTO
     c_sharp = GraphShardMetadataLanguage.CSHARP
@@ -294,6 +319,10 @@ def c_sharp_disabled_strong_crypto(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.CSHARP},
+    node_types={"MethodInvocation", "ObjectCreation"},
+)
 def c_sharp_obsolete_key_derivation(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_OBSOLETE_KEY_DERIVATION
     c_sharp = GraphShardMetadataLanguage.CSHARP
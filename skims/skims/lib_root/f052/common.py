@@ -228,7 +228,11 @@ def jwt_insec_sign_async(graph: Graph, method: MethodsEnum) -> list[NId]:
         graph, "jose"
     )
 
-    for n_id in g.filter_nodes(graph, nodes, match_predicate):
+    for n_id in g.filter_nodes(
+        graph,
+        g.matching_nodes(graph, label_type="MethodInvocation"),
+        match_predicate,
+    ):
         if (
             (args_n_id := nodes[n_id].get("arguments_id"))
             and (susp_n_id := next(iter(g.adj_ast(graph, args_n_id)), None))
@@ -251,7 +255,11 @@ def get_insec_auth_default_import(graph: Graph) -> tuple[NId, ...]:
             return node.get("expression") in danger_methods
         return False
 
-    return g.filter_nodes(graph, graph.nodes, match_predicate)
+    return g.filter_nodes(
+        graph,
+        g.matching_nodes(graph, label_type="MethodInvocation"),
+        match_predicate,
+    )
 
 
 def get_insec_auth_direct_import(graph: Graph) -> tuple[NId, ...]:
@@ -264,7 +272,11 @@ def get_insec_auth_direct_import(graph: Graph) -> tuple[NId, ...]:
             return node.get("expression") in {import_sha1, import_sha256}
         return False
 
-    return g.filter_nodes(graph, graph.nodes, match_predicate)
+    return g.filter_nodes(
+        graph,
+        g.matching_nodes(graph, label_type="MethodInvocation"),
+        match_predicate,
+    )
 
 
 def get_first_arg_eval(
@@ -290,9 +302,12 @@ def get_insec_auth_crypto_lib_named(
         )
 
     vuln_nodes: list[NId] = []
-    nodes = graph.nodes
 
-    for n_id in g.filter_nodes(graph, nodes, match_predicate):
+    for n_id in g.filter_nodes(
+        graph,
+        g.matching_nodes(graph, label_type="MethodInvocation"),
+        match_predicate,
+    ):
         if vuln_n_id := get_first_arg_eval(graph, n_id, method):
             vuln_nodes.append(vuln_n_id)
     return vuln_nodes
@@ -310,9 +325,12 @@ def get_insec_auth_crypto_lib(graph: Graph, method: MethodsEnum) -> list[NId]:
         )
 
     vuln_nodes: list[NId] = []
-    nodes = graph.nodes
 
-    for n_id in g.filter_nodes(graph, nodes, match_predicate):
+    for n_id in g.filter_nodes(
+        graph,
+        g.matching_nodes(graph, label_type="MethodInvocation"),
+        match_predicate,
+    ):
         if vuln_n_id := get_first_arg_eval(graph, n_id, method):
             vuln_nodes.append(vuln_n_id)
     return vuln_nodes
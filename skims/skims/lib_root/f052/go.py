@@ -12,10 +12,12 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 import utils.graph as g
 
 
+@query_manifest(languages={GraphLanguage.GO}, node_types={"MemberAccess"})
 def go_insecure_hash(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -46,6 +48,7 @@ def go_insecure_hash(
     )
 
 
+@query_manifest(languages={GraphLanguage.GO}, node_types={"MethodInvocation"})
 def go_insecure_cipher(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
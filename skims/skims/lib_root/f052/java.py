@@ -20,6 +20,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -41,6 +42,10 @@ def get_eval_danger(graph: Graph, n_id: NId, method: MethodsEnum) -> bool:
     return False
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVA},
+    node_types={"ObjectCreation"},
+)
 def java_insecure_pass(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -78,6 +83,10 @@ def java_insecure_pass(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVA},
+    node_types={"ObjectCreation"},
+)
 def java_insecure_key_rsa(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -112,6 +121,10 @@ def java_insecure_key_rsa(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVA},
+    node_types={"ObjectCreation"},
+)
 def java_insecure_key_ec(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -146,6 +159,10 @@ def java_insecure_key_ec(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVA},
+    node_types={"ObjectCreation"},
+)
 def java_insecure_key_secret(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -181,6 +198,10 @@ def java_insecure_key_secret(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def java_insecure_hash(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -230,6 +251,10 @@ def java_insecure_hash(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def java_insecure_hash_argument(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -264,6 +289,10 @@ def java_insecure_hash_argument(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def java_insecure_cipher(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -301,6 +330,10 @@ def java_insecure_cipher(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def java_insecure_cipher_ssl(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -335,6 +368,10 @@ def java_insecure_cipher_ssl(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def java_insecure_cipher_jmqi(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -371,6 +408,10 @@ def java_insecure_cipher_jmqi(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def java_insecure_connection(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
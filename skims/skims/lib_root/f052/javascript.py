@@ -24,9 +24,14 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVASCRIPT},
+    node_types={"MethodInvocation"},
+)
 def javascript_insecure_hash(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -51,6 +56,10 @@ def javascript_insecure_hash(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVASCRIPT},
+    node_types={"MethodInvocation"},
+)
 def javascript_insecure_create_cipher(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -74,6 +83,10 @@ def javascript_insecure_create_cipher(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVASCRIPT},
+    node_types={"MethodInvocation"},
+)
 def javascript_insecure_encrypt(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -97,6 +110,10 @@ def javascript_insecure_encrypt(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVASCRIPT},
+    node_types={"MethodInvocation"},
+)
 def javascript_insecure_ecdh_key(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -120,6 +137,10 @@ def javascript_insecure_ecdh_key(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVASCRIPT},
+    node_types={"MethodInvocation"},
+)
 def javascript_insecure_rsa_keypair(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -143,6 +164,10 @@ def javascript_insecure_rsa_keypair(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVASCRIPT},
+    node_types={"MethodInvocation"},
+)
 def javascript_insecure_ec_keypair(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -166,6 +191,10 @@ def javascript_insecure_ec_keypair(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVASCRIPT},
+    node_types={"MethodInvocation"},
+)
 def javascript_insecure_hash_library(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -190,6 +219,10 @@ def javascript_insecure_hash_library(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVASCRIPT},
+    node_types={"MethodInvocation"},
+)
 def javascript_jwt_insec_sign_algorithm(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -214,6 +247,7 @@ def javascript_jwt_insec_sign_algorithm(
     )
 
 
+@query_manifest(languages={GraphShardMetadataLanguage.JAVASCRIPT})
 def javascript_jwt_insec_sign_algo_async(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -238,6 +272,7 @@ def javascript_jwt_insec_sign_algo_async(
     )
 
 
+@query_manifest(languages={GraphShardMetadataLanguage.JAVASCRIPT})
 def javascript_insec_msg_auth_mechanism(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -17,6 +17,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -27,6 +28,10 @@ from utils.string import (
 )
 
 
+@query_manifest(
+    languages={GraphLanguage.KOTLIN},
+    node_types={"MethodInvocation"},
+)
 def kotlin_insecure_hash(graph_db: GraphDB) -> Vulnerabilities:
     danger_methods = complete_attrs_on_set(
         {
@@ -76,6 +81,10 @@ def kotlin_insecure_hash(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.KOTLIN},
+    node_types={"MethodInvocation"},
+)
 def kotlin_insecure_hash_instance(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.KT_INSECURE_HASH
     danger_methods = complete_attrs_on_set(
@@ -113,6 +122,10 @@ def kotlin_insecure_hash_instance(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.KOTLIN},
+    node_types={"MethodInvocation"},
+)
 def kotlin_insecure_cipher(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.KT_INSECURE_CIPHER
     danger_methods = complete_attrs_on_set(
@@ -152,6 +165,10 @@ def kotlin_insecure_cipher(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.KOTLIN},
+    node_types={"MethodInvocation"},
+)
 def kotlin_insecure_cipher_ssl(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.KT_INSECURE_CIPHER_SSL
     danger_methods = complete_attrs_on_set(
@@ -187,6 +204,10 @@ def kotlin_insecure_cipher_ssl(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.KOTLIN},
+    node_types={"MethodInvocation"},
+)
 def kotlin_insecure_cipher_http(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.KT_INSECURE_CIPHER_HTTP
     danger_methods = {"tlsVersions"}
@@ -220,6 +241,10 @@ def kotlin_insecure_cipher_http(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.KOTLIN},
+    node_types={"MethodInvocation"},
+)
 def kotlin_insecure_key_rsa(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.KT_INSECURE_KEY
     danger_methods = complete_attrs_on_set(
@@ -255,6 +280,10 @@ def kotlin_insecure_key_rsa(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.KOTLIN},
+    node_types={"MethodInvocation"},
+)
 def kotlin_insecure_key_ec(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.KT_INSECURE_KEY_EC
     danger_methods = complete_attrs_on_set(
@@ -290,6 +319,10 @@ def kotlin_insecure_key_ec(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.KOTLIN},
+    node_types={"MethodInvocation"},
+)
 def kotlin_insecure_init_vector(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.KT_INSECURE_INIT_VECTOR
     danger_methods = {"GCMParameterSpec"}
@@ -341,6 +374,10 @@ def search_host_verifier(graph: Graph, n_id: NId) -> str | None:
     return None
 
 
+@query_manifest(
+    languages={GraphLanguage.KOTLIN},
+    node_types={"MethodInvocation"},
+)
 def kotlin_insecure_hostname_ver(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.KT_INSECURE_HOST_VERIFICATION
     danger_methods = {"OkHttpClient.Builder"}
@@ -370,6 +407,7 @@ def kotlin_insecure_hostname_ver(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(languages={GraphLanguage.KOTLIN}, node_types={"MemberAccess"})
 def kotlin_insecure_certification(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.KT_INSECURE_CERTIFICATE_VALIDATION
     danger_set = {"TrustManager"}
@@ -402,6 +440,7 @@ def kotlin_insecure_certification(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(languages={GraphLanguage.KOTLIN}, node_types={"MemberAccess"})
 def kt_insecure_key_generator(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.KT_INSECURE_KEY_GEN
 
@@ -440,6 +479,10 @@ def kt_insecure_key_generator(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.KOTLIN},
+    node_types={"MethodInvocation"},
+)
 def kt_insecure_parameter_spec(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.KT_INSECURE_PARAMETER_SPEC
 
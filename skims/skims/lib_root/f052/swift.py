@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -45,6 +46,10 @@ def cc_algorithms(
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.SWIFT},
+    node_types={"MethodInvocation", "SymbolLookup"},
+)
 def swift_insecure_cipher(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -99,6 +104,10 @@ def uses_des_algorithm(graph: Graph, n_id: NId) -> bool:
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.SWIFT},
+    node_types={"MethodInvocation"},
+)
 def swift_insecure_crypto(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -127,6 +136,7 @@ def swift_insecure_crypto(
     )
 
 
+@query_manifest(languages={GraphLanguage.SWIFT}, node_types={"MemberAccess"})
 def swift_insecure_cryptalgo(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
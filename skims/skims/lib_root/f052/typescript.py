@@ -24,9 +24,14 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.TYPESCRIPT},
+    node_types={"MethodInvocation"},
+)
 def typescript_insecure_create_cipher(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -51,6 +56,10 @@ def typescript_insecure_create_cipher(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.TYPESCRIPT},
+    node_types={"MethodInvocation"},
+)
 def typescript_insecure_hash(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -75,6 +84,10 @@ def typescript_insecure_hash(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.TYPESCRIPT},
+    node_types={"MethodInvocation"},
+)
 def typescript_insecure_encrypt(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -98,6 +111,10 @@ def typescript_insecure_encrypt(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.TYPESCRIPT},
+    node_types={"MethodInvocation"},
+)
 def typescript_insecure_ecdh_key(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -121,6 +138,10 @@ def typescript_insecure_ecdh_key(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.TYPESCRIPT},
+    node_types={"MethodInvocation"},
+)
 def typescript_insecure_rsa_keypair(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -144,6 +165,10 @@ def typescript_insecure_rsa_keypair(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.TYPESCRIPT},
+    node_types={"MethodInvocation"},
+)
 def typescript_insecure_ec_keypair(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -167,6 +192,10 @@ def typescript_insecure_ec_keypair(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.TYPESCRIPT},
+    node_types={"MethodInvocation"},
+)
 def typescript_insecure_hash_library(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -191,6 +220,10 @@ def typescript_insecure_hash_library(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.TYPESCRIPT},
+    node_types={"MethodInvocation"},
+)
 def typescript_jwt_insec_sign_algorithm(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -215,6 +248,7 @@ def typescript_jwt_insec_sign_algorithm(
     )
 
 
+@query_manifest(languages={GraphShardMetadataLanguage.TYPESCRIPT})
 def typescript_jwt_insec_sign_algo_async(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -239,6 +273,7 @@ def typescript_jwt_insec_sign_algo_async(
     )
 
 
+@query_manifest(languages={GraphShardMetadataLanguage.TYPESCRIPT})
 def typescript_insec_msg_auth_mechanism(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -15,12 +15,17 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
 )
 
 
+@query_manifest(
+    languages={GraphLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def sensitive_log_info(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.JAVA_SENSITIVE_INFO_IN_LOGS
     danger_methods = {"logger.info", "log.debug", "log.info"}
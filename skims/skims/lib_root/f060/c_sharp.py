@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -46,6 +47,7 @@ def is_validation_dangerous(
     return False
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def insecure_certificate_validation(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_INSECURE_CERTIFICATE_VALIDATION
     danger_m = "ServerCertificateValidationCallback"
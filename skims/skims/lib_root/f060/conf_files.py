@@ -17,6 +17,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
@@ -36,6 +37,7 @@ def has_insecure_flag(graph: Graph, nid: NId, key: str) -> Iterator[NId]:
                 yield c_id
 
 
+@query_manifest(languages={GraphLanguage.JSON}, node_types={"Pair"})
 def allowed_hosts(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -60,6 +62,7 @@ def allowed_hosts(
     )
 
 
+@query_manifest(languages={GraphLanguage.JSON}, node_types={"Pair"})
 def disable_host_check(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -20,6 +20,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -47,6 +48,7 @@ def is_node_vuln(
     return False
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def open_redirect(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_OPEN_REDIRECT
 
@@ -74,6 +76,10 @@ def open_redirect(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"MethodInvocation"},
+)
 def unsafe_path_traversal(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_UNSAFE_PATH_TRAVERSAL
     danger_methods = {
@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -56,6 +57,10 @@ def is_argument_danger(graph: Graph, n_id: NId, method: MethodsEnum) -> bool:
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def zip_slip_injection(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.JAVA_ZIP_SLIP_PATH_INJECTION
     danger_methods = {"readFileToString"}
@@ -85,6 +90,7 @@ def zip_slip_injection(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(languages={GraphLanguage.JAVA}, node_types={"ObjectCreation"})
 def unsafe_path_traversal(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.JAVA_UNSAFE_PATH_TRAVERSAL
     danger_obj = {
@@ -99,11 +105,7 @@ def unsafe_path_traversal(graph_db: GraphDB) -> Vulnerabilities:
                 continue
             graph = shard.syntax_graph
 
-            for nid in g.filter_nodes(
-                graph,
-                nodes=graph.nodes,
-                predicate=g.pred_has_labels(label_type="ObjectCreation"),
-            ):
+            for nid in g.matching_nodes(graph, label_type="ObjectCreation"):
                 n_attrs = graph.nodes[nid]
                 if (
                     n_attrs.get("name") in danger_obj
@@ -19,9 +19,11 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(languages={GraphLanguage.JAVASCRIPT})
 def javascript_insecure_path_traversal(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.JS_PATH_TRAVERSAL
 
@@ -42,6 +44,10 @@ def javascript_insecure_path_traversal(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JAVASCRIPT},
+    node_types={"MethodInvocation"},
+)
 def zip_slip_injection(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.JS_ZIP_SLIP
     danger_methods = {"createWriteStream"}
@@ -19,9 +19,11 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(languages={GraphLanguage.TYPESCRIPT})
 def ts_insecure_path_traversal(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -46,6 +48,10 @@ def ts_insecure_path_traversal(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.TYPESCRIPT},
+    node_types={"MethodInvocation"},
+)
 def ts_zip_slip_injection(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -12,12 +12,14 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
 )
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def has_console_functions(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_HAS_CONSOLE_FUNCTIONS
 
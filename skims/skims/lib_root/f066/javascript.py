@@ -15,9 +15,14 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(
+    languages={GraphLanguage.JAVASCRIPT},
+    node_types={"MethodInvocation"},
+)
 def js_uses_console_log(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.JS_USES_CONSOLE_LOG
 
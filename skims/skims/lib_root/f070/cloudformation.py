@@ -25,6 +25,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -55,6 +56,10 @@ def _elb2_target_group_insecure_port(graph: Graph, nid: NId) -> Iterator[NId]:
             yield port_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_elb2_target_group_insecure_port(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -83,6 +88,10 @@ def cfn_elb2_target_group_insecure_port(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_elb2_uses_insecure_security_policy(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -22,6 +22,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -45,6 +46,7 @@ def _elb2_uses_insecure_security_policy(graph: Graph, nid: NId) -> NId | None:
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_lb_target_group_insecure_port(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -68,6 +70,7 @@ def tfm_lb_target_group_insecure_port(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_elb2_uses_insecure_security_policy(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
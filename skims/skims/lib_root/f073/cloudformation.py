@@ -24,6 +24,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -37,6 +38,10 @@ def _rds_is_publicly_accessible(graph: Graph, nid: NId) -> Iterator[NId]:
         yield public_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_rds_is_publicly_accessible(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -17,6 +17,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -78,6 +79,7 @@ def is_insecure_logging(graph: Graph, n_id: NId) -> bool:
     return False
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def insecure_logging(graph_db: GraphDB) -> Vulnerabilities:
     logging_methods = {
         "Info",
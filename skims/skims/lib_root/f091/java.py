@@ -16,6 +16,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -44,6 +45,10 @@ def is_logger_unsafe(graph: Graph, n_id: str) -> bool:
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def insecure_logging(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.JAVA_INSECURE_LOGGING
     danger_methods = {"logger.info", "log.debug", "log.info"}
@@ -19,6 +19,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -46,6 +47,10 @@ def is_type_handle_dangerous(
 
 
 # https://docs.microsoft.com/en-us/dotnet/standard/serialization/binaryformatter-security-guide
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"ObjectCreation"},
+)
 def insecure_deserialization(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_INSECURE_DESERIAL
     danger_objects = {
@@ -74,6 +79,10 @@ def insecure_deserialization(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"ObjectCreation"},
+)
 def check_xml_serializer(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_XML_SERIAL
     danger_set = {"Type.GetType", "HttpRequest"}
@@ -97,6 +106,10 @@ def check_xml_serializer(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"ObjectCreation"},
+)
 def js_deserialization(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_JS_DESERIALIZATION
     serializer = {"JavaScriptSerializer"}
@@ -119,6 +132,7 @@ def js_deserialization(graph_db: GraphDB) -> Vulnerabilities:
     )
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def type_name_handling(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_TYPE_NAME_HANDLING
     serializer = {"JsonSerializerSettings"}
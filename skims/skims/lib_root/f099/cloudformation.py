@@ -21,6 +21,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -32,6 +33,10 @@ def _unencrypted_buckets(graph: Graph, nid: NId) -> Iterator[NId]:
         yield prop_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_unencrypted_buckets(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -19,6 +19,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -38,6 +39,7 @@ def _unencrypted_buckets(graph: Graph, nid: NId) -> Iterator[NId]:
             yield nid
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_unencrypted_buckets(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
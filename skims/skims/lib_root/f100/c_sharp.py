@@ -15,6 +15,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -27,6 +28,10 @@ from utils.string import (
 )
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"MethodInvocation"},
+)
 def insec_create(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.CS_INSEC_CREATE
     paths = build_attr_paths("System", "Net", "WebRequest", "Create")
@@ -21,6 +21,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -34,6 +35,10 @@ def _rds_is_not_inside_a_db_subnet_group(
         yield prop_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_rds_is_not_inside_a_db_subnet_group(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -28,6 +29,7 @@ def _rds_instance_inside_subnet(graph: Graph, nid: NId) -> NId | None:
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_db_cluster_inside_subnet(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -51,6 +53,7 @@ def tfm_db_cluster_inside_subnet(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_rds_instance_inside_subnet(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -12,6 +12,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -21,6 +22,10 @@ from utils import (
 )
 
 
+@query_manifest(
+    languages={GraphLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def sql_injection(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.JAVA_SQL_INJECTION
     danger_methods = {"addBatch", "execute", "executeQuery", "executeUpdate"}
@@ -15,9 +15,11 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(languages={GraphLanguage.JAVASCRIPT})
 def unsafe_sql_injection(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.JS_SQL_API_INJECTION
 
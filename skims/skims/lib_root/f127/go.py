@@ -12,6 +12,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     get_node_evaluation_results,
@@ -21,6 +22,7 @@ from utils import (
 )
 
 
+@query_manifest(languages={GraphLanguage.GO}, node_types={"MethodInvocation"})
 def go_insecure_query_float(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.GO_INSECURE_QUERY_FLOAT
     danger_methods = {
@@ -15,9 +15,11 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(languages={GraphLanguage.TYPESCRIPT})
 def typescript_insecure_cookies(graph_db: GraphDB) -> Vulnerabilities:
     method = MethodsEnum.TS_INSECURE_COOKIE
 
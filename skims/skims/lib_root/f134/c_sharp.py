@@ -20,6 +20,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -142,6 +143,7 @@ def is_vulnerable_origin(graph: Graph, nid: NId, expr: str) -> bool:
     return False
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def insecure_cors(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -174,6 +176,10 @@ def insecure_cors(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"Attribute", "MethodInvocation"},
+)
 def insecure_cors_origin(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
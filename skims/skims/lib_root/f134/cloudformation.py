@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
@@ -42,6 +43,7 @@ def has_wildcard(graph: Graph, nid: NId, key_dict: str, value_id: NId) -> bool:
     return False
 
 
+@query_manifest(languages={GraphLanguage.JSON}, node_types={"Pair"})
 def wildcard_in_allowed_origins(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -17,6 +17,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
@@ -34,6 +35,7 @@ def is_in_path(graph: Graph, nid: NId, key_dict: str, value: str) -> bool:
     return False
 
 
+@query_manifest(languages={GraphLanguage.YAML}, node_types={"Pair"})
 def serverless_cors_true(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
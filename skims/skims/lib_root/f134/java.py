@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -59,6 +60,10 @@ def is_vulnerable_origin(graph: Graph, nid: NId, check: str) -> bool:
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def insecure_cors_origin(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -16,9 +16,14 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(
+    languages={GraphLanguage.TYPESCRIPT},
+    node_types={"MethodInvocation", "ObjectCreation"},
+)
 def uses_eval(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -12,12 +12,17 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
 )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.CSHARP},
+    node_types={"ObjectCreation"},
+)
 def cs_insecure_channel(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
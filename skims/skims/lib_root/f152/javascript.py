@@ -15,9 +15,14 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(
+    languages={GraphLanguage.JAVASCRIPT},
+    node_types={"ObjectCreation"},
+)
 def javascript_insecure_header_xframe_options(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -1,6 +1,9 @@
 from collections.abc import (
     Iterator,
 )
+from itertools import (
+    chain,
+)
 from model.core_model import (
     MethodsEnum,
     Vulnerabilities,
@@ -14,6 +17,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -69,7 +73,14 @@ def get_dang_instances(
     dang_instances: set[str] = set()
     dang_classes = {"HttpClient", "HttpRequestMessage", "WebClient"}
 
-    for n_id in g.filter_nodes(graph, nodes, predicate_matcher):
+    for n_id in g.filter_nodes(
+        graph,
+        chain(
+            g.matching_nodes(graph, label_type="VariableDeclaration"),
+            g.matching_nodes(graph, label_type="ObjectCreation"),
+        ),
+        predicate_matcher,
+    ):
         if (var_name := nodes[n_id].get("variable")) or (
             (p_id := g.pred_ast(graph, n_id))
             and (v_id := nodes[p_id[0]].get("variable_id"))
@@ -104,13 +115,18 @@ def get_vuln_nodes(graph: Graph, method: MethodsEnum) -> Iterator[NId]:
 
     nodes = graph.nodes
     dang_callings = get_dang_callings(graph)
-    for n_id in g.filter_nodes(graph, nodes, predicate_matcher):
+    for n_id in g.filter_nodes(
+        graph,
+        g.matching_nodes(graph, label_type="MethodInvocation"),
+        predicate_matcher,
+    ):
         if (args_id := nodes[n_id].get("arguments_id")) and is_vuln(
             graph, args_id, method
         ):
             yield n_id
 
 
+@query_manifest(languages={GraphShardMetadataLanguage.CSHARP})
 def c_sharp_accepts_any_mime_type(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -35,7 +36,11 @@ def get_suspicious_nodes(
             and (node.get("expression") in dang_invocations)
         )
 
-    for n_id in g.filter_nodes(graph, graph.nodes, predicate_matcher):
+    for n_id in g.filter_nodes(
+        graph,
+        g.matching_nodes(graph, label_type="MethodInvocation"),
+        predicate_matcher,
+    ):
         yield n_id
 
 
@@ -101,6 +106,7 @@ def get_vuln_nodes_chain(
             yield n_id
 
 
+@query_manifest(languages={GraphShardMetadataLanguage.JAVA})
 def java_http_accepts_any_mime_type(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -132,6 +138,7 @@ def java_http_accepts_any_mime_type(
     )
 
 
+@query_manifest(languages={GraphShardMetadataLanguage.JAVA})
 def java_accepts_any_mime_type_chain(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -22,6 +22,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.graph import (
     adj_ast,
@@ -95,6 +96,7 @@ def _azure_unrestricted_access_network_segments(
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_aws_acl_broad_network_access(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -118,6 +120,7 @@ def tfm_aws_acl_broad_network_access(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_kv_danger_bypass(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -141,6 +144,7 @@ def tfm_azure_kv_danger_bypass(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_kv_default_network_access(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -164,6 +168,7 @@ def tfm_azure_kv_default_network_access(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_unrestricted_access_network_segments(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -189,6 +194,7 @@ def tfm_azure_unrestricted_access_network_segments(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_sa_default_network_access(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -12,6 +12,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
@@ -21,6 +22,10 @@ from utils.string import (
 )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.CSHARP},
+    node_types={"MethodInvocation"},
+)
 def c_sharp_file_create_temp_file(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
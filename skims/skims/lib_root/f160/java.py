@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -72,6 +73,10 @@ def is_method_danger(graph: Graph, n_id: NId) -> bool:
     return False
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def java_file_create_temp_file(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -12,12 +12,14 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
 )
 
 
+@query_manifest(languages={GraphLanguage.PYTHON}, node_types={"MemberAccess"})
 def python_unsafe_temp_file(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
@@ -35,6 +36,7 @@ def is_in_path(graph: Graph, nid: NId, key_dict: str, value: str) -> bool:
     return False
 
 
+@query_manifest(languages={GraphLanguage.JSON}, node_types={"Pair"})
 def ssl_port_missing(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
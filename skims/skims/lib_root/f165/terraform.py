@@ -19,6 +19,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.function import (
     get_dict_values,
@@ -69,6 +70,7 @@ def _iam_role_is_over_privileged(graph: Graph, nid: NId) -> Iterator[NId]:
             )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_iam_role_is_over_privileged(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
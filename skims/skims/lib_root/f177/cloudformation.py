@@ -21,6 +21,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -42,6 +43,10 @@ def _ec2_use_default_security_group(graph: Graph, nid: NId) -> Iterator[NId]:
         yield report_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_ec2_use_default_security_group(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -21,6 +21,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -32,6 +33,7 @@ def _use_default_security_group(graph: Graph, nid: NId) -> NId | None:
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def ec2_use_default_security_group(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -17,6 +17,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -129,6 +130,7 @@ def eval_regex_injection(graph: Graph, n_id: NId) -> bool:
     return False
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def vuln_regular_expression(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -157,6 +159,7 @@ def vuln_regular_expression(
     )
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def regex_injection(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -50,6 +51,10 @@ def analyze_method_vuln(graph: Graph, method_id: NId) -> bool:
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def java_vuln_regular_expression(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -40,6 +41,7 @@ def get_eval_danger(
     return False
 
 
+@query_manifest(languages={GraphLanguage.PYTHON}, node_types={"MemberAccess"})
 def python_regex_dos(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
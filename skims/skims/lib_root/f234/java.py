@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
@@ -47,6 +48,7 @@ def get_vuln_nodes(graph: Graph) -> set[NId]:
     return vuln_nodes
 
 
+@query_manifest(languages={GraphLanguage.JAVA}, node_types={"CatchClause"})
 def info_leak_stacktrace(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
@@ -41,6 +42,7 @@ def _sourcemap_enabled(
     return False
 
 
+@query_manifest(languages={GraphLanguage.JSON}, node_types={"Pair"})
 def tsconfig_sourcemap_enabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
@@ -68,6 +69,7 @@ def n_expression(graph: Graph, n_id: NId) -> str:
     return n_expr
 
 
+@query_manifest(languages={GraphLanguage.DART}, node_types={"SymbolLookup"})
 def has_print_statements(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -7,12 +7,17 @@ from model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
 )
 
 
+@query_manifest(
+    languages={graph_model.GraphShardMetadataLanguage.PYTHON},
+    node_types={"MethodInvocation"},
+)
 def has_print_statements(
     graph_db: graph_model.GraphDB,
 ) -> core_model.Vulnerabilities:
@@ -17,6 +17,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -36,6 +37,10 @@ def is_node_danger(graph: Graph, n_id: NId) -> bool:
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"MethodInvocation"},
+)
 def info_leak_errors(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -24,6 +24,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -40,6 +41,10 @@ def _rds_has_unencrypted_storage(graph: Graph, nid: NId) -> Iterator[NId]:
         yield prop_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_rds_has_unencrypted_storage(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
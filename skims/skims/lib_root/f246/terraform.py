@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -30,6 +31,7 @@ def _has_unencrypted_storage(graph: Graph, nid: NId) -> NId | None:
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_rds_has_unencrypted_storage(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -53,6 +55,7 @@ def tfm_rds_has_unencrypted_storage(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_db_has_unencrypted_storage(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
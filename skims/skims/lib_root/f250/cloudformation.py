@@ -25,6 +25,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.graph import (
     adj_ast,
@@ -71,6 +72,10 @@ def _ec2_has_unencrypted_volumes(graph: Graph, nid: NId) -> Iterator[NId]:
                 yield prop_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_ec2_has_unencrypted_volumes(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -97,6 +102,10 @@ def cfn_ec2_has_unencrypted_volumes(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_ec2_instance_unencrypted_ebs_block_devices(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
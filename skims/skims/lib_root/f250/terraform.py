@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.graph import (
     adj_ast,
@@ -62,6 +63,7 @@ def _ec2_instance_unencrypted_ebs_block_devices(
             )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ec2_instance_unencrypted_ebs_block_devices(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -89,6 +91,7 @@ def tfm_ec2_instance_unencrypted_ebs_block_devices(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ebs_unencrypted_volumes(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -112,6 +115,7 @@ def tfm_ebs_unencrypted_volumes(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ebs_unencrypted_by_default(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -24,6 +24,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -51,6 +52,10 @@ def _rds_has_not_automated_backups(graph: Graph, nid: NId) -> Iterator[NId]:
         yield backup_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_rds_has_not_automated_backups(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -80,6 +85,10 @@ def cfn_rds_has_not_automated_backups(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_rds_has_not_termination_protection(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
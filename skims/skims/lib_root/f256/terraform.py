@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -39,6 +40,7 @@ def _no_deletion_protection(graph: Graph, nid: NId) -> NId | None:
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_db_no_deletion_protection(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -62,6 +64,7 @@ def tfm_db_no_deletion_protection(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_rds_no_deletion_protection(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -85,6 +88,7 @@ def tfm_rds_no_deletion_protection(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_rds_has_not_automated_backups(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -108,6 +112,7 @@ def tfm_rds_has_not_automated_backups(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_db_has_not_automated_backups(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
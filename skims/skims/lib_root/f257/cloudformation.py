@@ -24,6 +24,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -48,6 +49,10 @@ def _ec2_has_not_termination_protection(
         yield api_termination_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_ec2_has_not_termination_protection(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
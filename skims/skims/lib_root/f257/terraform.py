@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -32,6 +33,7 @@ def _has_not_termination_protection(graph: Graph, nid: NId) -> NId | None:
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ec2_has_not_termination_protection(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -24,6 +24,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.graph import (
     adj_ast,
@@ -52,6 +53,10 @@ def _elb2_has_not_deletion_protection(graph: Graph, nid: NId) -> Iterator[NId]:
             yield load_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_elb2_has_not_deletion_protection(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -24,6 +24,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -58,6 +59,10 @@ def _dynamo_has_not_deletion_protection(
         yield del_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_dynamo_has_not_deletion_protection(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -84,6 +89,10 @@ def cfn_dynamo_has_not_deletion_protection(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_has_not_point_in_time_recovery(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
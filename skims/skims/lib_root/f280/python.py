@@ -17,6 +17,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -88,6 +89,10 @@ def is_danger_access(graph: Graph, n_id: NId, method: MethodsEnum) -> bool:
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.PYTHON},
+    node_types={"ElementAccess", "MemberAccess"},
+)
 def python_xml_parser(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -24,6 +24,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.function import (
     get_dict_values,
@@ -86,6 +87,7 @@ def _bucket_policy_has_secure_transport(
             )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_bucket_policy_has_secure_transport(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -22,6 +22,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -48,6 +49,7 @@ def _azure_as_client_certificates_enabled(
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_as_client_certificates_enabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -71,6 +73,7 @@ def tfm_azure_as_client_certificates_enabled(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_app_authentication_off(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -17,6 +17,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -39,6 +40,7 @@ def is_node_danger(graph: Graph, nid: NId) -> bool:
     return False
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def cs_ldap_connections_authenticated(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -49,6 +50,7 @@ def is_danger_auth(graph: Graph, n_id: NId) -> bool:
     return n_attrs["label_type"] == "Literal" or n_attrs.get("value") == "None"
 
 
+@query_manifest(languages={GraphLanguage.PYTHON}, node_types={"MemberAccess"})
 def python_unsafe_ldap_connection(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
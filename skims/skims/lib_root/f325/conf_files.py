@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
@@ -40,6 +41,7 @@ def is_in_path(graph: Graph, nid: NId) -> Iterator[NId]:
         yield principal_id
 
 
+@query_manifest(languages={GraphLanguage.JSON}, node_types={"Object"})
 def principal_wildcard(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -35,6 +35,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.function import (
     get_dict_values,
@@ -236,6 +237,7 @@ def _permissive_policy(graph: Graph, nid: NId) -> Iterator[NId]:
                 yield from _permissive_policy_in_jsonencode(graph, value_id)
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_permissive_policy(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -265,6 +267,7 @@ def tfm_permissive_policy(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_iam_has_wildcard_resource_on_write_action(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -296,6 +299,7 @@ def tfm_iam_has_wildcard_resource_on_write_action(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_kms_key_has_master_keys_exposed_to_everyone(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
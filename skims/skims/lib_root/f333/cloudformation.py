@@ -24,6 +24,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.graph import (
     adj_ast,
@@ -90,6 +91,10 @@ def _ec2_associate_public_ip_address(graph: Graph, nid: NId) -> Iterator[NId]:
                 yield pi_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_ec2_associate_public_ip_address(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -119,6 +124,10 @@ def cfn_ec2_associate_public_ip_address(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_ec2_has_terminate_shutdown_behavior(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -145,6 +154,10 @@ def cfn_ec2_has_terminate_shutdown_behavior(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_ec2_has_not_an_iam_instance_profile(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -21,6 +21,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.graph import (
     adj_ast,
@@ -64,6 +65,7 @@ def _ec2_associate_public_ip_address(graph: Graph, nid: NId) -> NId | None:
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ec2_associate_public_ip_address(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -90,6 +92,7 @@ def tfm_ec2_associate_public_ip_address(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ec2_has_terminate_shutdown_behavior(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -113,6 +116,7 @@ def tfm_ec2_has_terminate_shutdown_behavior(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ec2_has_not_an_iam_instance_profile(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
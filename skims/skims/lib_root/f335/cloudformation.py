@@ -21,6 +21,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -41,6 +42,10 @@ def _s3_bucket_versioning_disabled(graph: Graph, nid: NId) -> Iterator[NId]:
         yield prop_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_s3_bucket_versioning_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -17,6 +17,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -35,6 +36,10 @@ def eval_hashes_salt(graph: Graph, n_id: NId) -> bool:
     return False
 
 
+@query_manifest(
+    languages={GraphLanguage.CSHARP},
+    node_types={"ObjectCreation"},
+)
 def check_hashes_salt(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
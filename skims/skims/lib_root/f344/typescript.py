@@ -16,9 +16,14 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(
+    languages={GraphLanguage.TYPESCRIPT},
+    node_types={"MethodInvocation"},
+)
 def ts_local_storage_with_sensitive_data(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -42,6 +47,10 @@ def ts_local_storage_with_sensitive_data(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.TYPESCRIPT},
+    node_types={"Assignment"},
+)
 def ts_local_storage_sens_data_assignment(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -14,9 +14,14 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.TYPESCRIPT},
+    node_types={"MemberAccess"},
+)
 def decode_insecure_jwt_token(
     graph_db: GraphDB,
 ) -> core_model.Vulnerabilities:
@@ -13,6 +13,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -66,6 +67,7 @@ def get_vuln_nodes(graph: Graph) -> list[str]:
     return vuln_nodes
 
 
+@query_manifest(languages={GraphLanguage.JAVA}, node_types={"ObjectCreation"})
 def insecure_file_upload_size(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.evaluate import (
     evaluate,
@@ -55,6 +56,7 @@ def get_vuln_nodes(graph: Graph, method: MethodsEnum) -> list[NId]:
     return vuln_nodes
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"MemberAccess"})
 def cert_validation_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
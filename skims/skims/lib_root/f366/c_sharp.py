@@ -14,6 +14,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.utils import (
     get_backward_paths,
@@ -60,6 +61,7 @@ def get_vuln_nodes(graph: Graph) -> set[NId]:
     return vuln_nodes
 
 
+@query_manifest(languages={GraphLanguage.CSHARP}, node_types={"Class"})
 def conflicting_annotations(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
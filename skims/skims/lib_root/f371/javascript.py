@@ -20,9 +20,14 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVASCRIPT},
+    node_types={"MemberAccess"},
+)
 def uses_innerhtml(
     graph_db: GraphDB,
 ) -> core_model.Vulnerabilities:
@@ -45,6 +50,10 @@ def uses_innerhtml(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVASCRIPT},
+    node_types={"MemberAccess"},
+)
 def js_bypass_security_trust_url(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -67,6 +76,10 @@ def js_bypass_security_trust_url(
     )
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVASCRIPT},
+    node_types={"JsxElement"},
+)
 def js_dangerously_set_innerhtml(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -21,6 +21,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.graph import (
     adj_ast,
@@ -81,6 +82,10 @@ def _serves_content_over_http(graph: Graph, nid: NId) -> Iterator[NId]:
         yield from _aux_serves_content_over_http(graph, dist_config_id)
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_serves_content_over_http(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -109,6 +114,10 @@ def cfn_serves_content_over_http(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_elb2_uses_insecure_protocol(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
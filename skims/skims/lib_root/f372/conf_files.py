@@ -17,6 +17,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
@@ -43,6 +44,7 @@ def have_insecure_http_server(
                 yield c_id
 
 
+@query_manifest(languages={GraphLanguage.JSON}, node_types={"Pair"})
 def https_flag_missing(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
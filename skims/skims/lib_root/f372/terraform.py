@@ -22,6 +22,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -91,6 +92,7 @@ def _serves_content_over_http(graph: Graph, nid: NId) -> Iterator[NId]:
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_serves_content_over_http(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -114,6 +116,7 @@ def tfm_serves_content_over_http(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_aws_sec_group_using_http(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -137,6 +140,7 @@ def tfm_aws_sec_group_using_http(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_elb2_uses_insecure_protocol(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -160,6 +164,7 @@ def tfm_elb2_uses_insecure_protocol(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_kv_only_accessible_over_https(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -186,6 +191,7 @@ def tfm_azure_kv_only_accessible_over_https(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_sa_insecure_transfer(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
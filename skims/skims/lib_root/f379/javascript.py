@@ -15,9 +15,11 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
+@query_manifest(languages={GraphLanguage.JAVASCRIPT})
 def js_import_is_never_used(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
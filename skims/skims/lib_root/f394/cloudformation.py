@@ -24,6 +24,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -39,6 +40,10 @@ def _log_files_not_validated(graph: Graph, nid: NId) -> Iterator[NId]:
         yield file_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_log_files_not_validated(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
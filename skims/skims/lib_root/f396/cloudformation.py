@@ -24,6 +24,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -44,6 +45,10 @@ def _kms_key_is_key_rotation_absent_or_disabled(
             yield key_rot_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_kms_key_is_key_rotation_absent_or_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -39,6 +40,7 @@ def _kms_key_is_key_rotation_absent_or_disabled(
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_kms_key_is_key_rotation_absent_or_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
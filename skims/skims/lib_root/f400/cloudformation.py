@@ -25,6 +25,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils.graph import (
     adj_ast,
@@ -119,6 +120,10 @@ def _elb_has_access_logging_disabled(graph: Graph, nid: NId) -> Iterator[NId]:
             yield enabled_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_elb_has_access_logging_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -147,6 +152,10 @@ def cfn_elb_has_access_logging_disabled(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_trails_not_multiregion(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -173,6 +182,10 @@ def cfn_trails_not_multiregion(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_ec2_monitoring_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -199,6 +212,10 @@ def cfn_ec2_monitoring_disabled(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_elb2_has_access_logs_s3_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -227,6 +244,10 @@ def cfn_elb2_has_access_logs_s3_disabled(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_cf_distribution_has_logging_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -257,6 +278,10 @@ def cfn_cf_distribution_has_logging_disabled(
     )
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_bucket_has_logging_conf_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
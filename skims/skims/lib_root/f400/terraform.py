@@ -19,6 +19,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -69,6 +70,7 @@ def _lambda_tracing_disabled(graph: Graph, nid: NId) -> NId | None:
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_lambda_tracing_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -92,6 +94,7 @@ def tfm_lambda_tracing_disabled(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_elb_logging_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -115,6 +118,7 @@ def tfm_elb_logging_disabled(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_trails_not_multiregion(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -138,6 +142,7 @@ def tfm_trails_not_multiregion(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_distribution_has_logging_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -161,6 +166,7 @@ def tfm_distribution_has_logging_disabled(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_ec2_monitoring_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
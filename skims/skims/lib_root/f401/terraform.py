@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -28,6 +29,7 @@ def _azure_kv_secret_no_expiration_date(graph: Graph, nid: NId) -> NId | None:
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_kv_secret_no_expiration_date(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -19,6 +19,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -76,6 +77,7 @@ def _azure_storage_logging_disabled(graph: Graph, nid: NId) -> NId | None:
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_storage_logging_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -99,6 +101,7 @@ def tfm_azure_storage_logging_disabled(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_sql_server_audit_log_retention(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -122,6 +125,7 @@ def tfm_azure_sql_server_audit_log_retention(
     )
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_app_service_logging_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -24,6 +24,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -39,6 +40,10 @@ def _aws_efs_unencrypted(graph: Graph, nid: NId) -> Iterator[NId]:
         yield encrypted_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_aws_efs_unencrypted(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
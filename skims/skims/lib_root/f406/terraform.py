@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -30,6 +31,7 @@ def _aws_efs_unencrypted(graph: Graph, nid: NId) -> NId | None:
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_aws_efs_unencrypted(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -21,6 +21,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -34,6 +35,10 @@ def _api_gateway_access_logging_disabled(
         yield prop_id
 
 
+@query_manifest(
+    languages={GraphLanguage.JSON, GraphLanguage.YAML},
+    node_types={"Object"},
+)
 def cfn_api_gateway_access_logging_disabled(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
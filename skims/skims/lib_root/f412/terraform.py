@@ -18,6 +18,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 
 
@@ -34,6 +35,7 @@ def _azure_key_vault_not_recoverable(graph: Graph, nid: NId) -> NId | None:
     return None
 
 
+@query_manifest(languages={GraphLanguage.HCL}, node_types={"Object"})
 def tfm_azure_key_vault_not_recoverable(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
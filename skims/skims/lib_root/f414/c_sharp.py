@@ -12,6 +12,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from symbolic_eval.utils import (
     get_object_identifiers,
@@ -19,6 +20,7 @@ from symbolic_eval.utils import (
 )
 
 
+@query_manifest(languages={GraphLanguage.CSHARP})
 def disabled_http_header_check(
     graph_db: GraphDB,
 ) -> Vulnerabilities:
@@ -15,6 +15,7 @@ from model.graph_model import (
 )
 from sast.query import (
     get_vulnerabilities_from_n_ids,
+    query_manifest,
 )
 from utils import (
     graph as g,
@@ -33,6 +34,10 @@ def get_parent_method_name(graph: Graph, n_id: str) -> str:
     return graph.nodes[parent]["name"]
 
 
+@query_manifest(
+    languages={GraphShardMetadataLanguage.JAVA},
+    node_types={"MethodInvocation"},
+)
 def uses_exit_method(
     graph_db: GraphDB,
 ) -> core_model.Vulnerabilities:
@@ -59,7 +59,14 @@ def get_namespace_alias(graph: Graph, module_name: str) -> str | None:
     nodes = graph.nodes
     if (
         import_n_id := next(
-            iter(g.filter_nodes(graph, nodes, predicate_matcher)), None
+            iter(
+                g.filter_nodes(
+                    graph,
+                    g.matching_nodes(graph, label_type="Import"),
+                    predicate_matcher,
+                )
+            ),
+            None,
         )
     ) and (alias := nodes[import_n_id].get("identifier")):
         return alias
@@ -76,7 +83,9 @@ def get_default_alias(graph: Graph, module_name: str) -> str | None:
 
     nodes = graph.nodes
 
-    for n_id in g.filter_nodes(graph, nodes, predicate_matcher):
+    for n_id in g.filter_nodes(
+        graph, g.matching_nodes(graph, label_type="Import"), predicate_matcher
+    ):
         if (nodes[n_id].get("import_type") == "default_import") and (
             alias := nodes[n_id].get("identifier")
         ):
@@ -109,7 +118,14 @@ def get_named_alias(
         )
 
     if n_id := next(
-        iter(g.filter_nodes(graph, graph.nodes, predicate_matcher)), None
+        iter(
+            g.filter_nodes(
+                graph,
+                g.matching_nodes(graph, label_type="Import"),
+                predicate_matcher,
+            )
+        ),
+        None,
     ):
         if alias := graph.nodes[n_id].get("label_alias"):
             return alias
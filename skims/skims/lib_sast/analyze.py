@@ -7,11 +7,17 @@ from lib_path.analyze import (
 from lib_root.analyze import (
     analyze as analyze_root,
 )
+from lib_sast.incremental import (
+    is_baseline_candidate,
+    load_baseline,
+    store_baseline,
+)
 from lib_sast.types import (
     Paths,
 )
 from model.core_model import (
     FindingEnum,
+    Vulnerability,
 )
 from state.ephemeral import (
     EphemeralStore,
@@ -21,9 +27,41 @@ from utils.logs import (
 )
 
 
+def _recording_stores(
+    stores: dict[FindingEnum, EphemeralStore],
+    results: list[Vulnerability],
+) -> dict[FindingEnum, EphemeralStore]:
+    def _store(store: EphemeralStore, result: Vulnerability) -> None:
+        results.append(result)
+        store.store(result)
+
+    return {
+        finding: store._replace(
+            store=lambda result, store=store: _store(store, result)
+        )
+        for finding, store in stores.items()
+    }
+
+
 def analyze(stores: dict[FindingEnum, EphemeralStore]) -> None:
     paths = Paths(CTX.config.path.include, CTX.config.path.exclude)
 
+    results: list[Vulnerability] | None = None
+    if CTX.config.path.record_baseline and is_baseline_candidate():
+        results = []
+        stores = _recording_stores(stores, results)
+
+    if baseline := load_baseline(paths.get_all()):
+        affected_paths, carried_results = baseline
+        paths.keep_only(affected_paths)
+        for result in carried_results:
+            stores[result.finding].store(result)
+        log_blocking(
+            "info",
+            "Incremental analysis, results carried forward: %s",
+            len(carried_results),
+        )
+
     log_blocking("info", "Files to be tested: %s", len(paths.ok_paths))
 
     if CTX.config.path.lib_path:
@@ -32,3 +70,6 @@ def analyze(stores: dict[FindingEnum, EphemeralStore]) -> None:
     if CTX.config.path.lib_root:
         paths.set_lang()
         analyze_root(paths=paths, stores=stores)
+
+    if results is not None:
+        store_baseline(tuple(results))
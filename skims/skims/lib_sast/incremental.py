@@ -0,0 +1,175 @@
+from collections.abc import (
+    Iterable,
+)
+from ctx import (
+    CTX,
+)
+from functools import (
+    cache,
+)
+from model.core_model import (
+    Vulnerability,
+)
+import os
+from state.cache import (
+    CacheStore,
+    get_cache_store,
+)
+from typing import (
+    Any,
+)
+from utils.fs import (
+    get_source_digest,
+)
+from utils.logs import (
+    log_blocking,
+)
+from utils.repositories import (
+    DEFAULT_COMMIT,
+    get_changed_paths,
+    get_repo_head_hash,
+)
+
+# Constants
+# Files whose analysis reads the file with this name in the same directory
+SIBLING_DEPENDENCIES: dict[str, str] = {
+    "yarn.lock": "package.json",
+}
+# Files whose analysis reads the files with the same name in parent folders
+PARENT_DEPENDENCIES: set[str] = {
+    "pom.xml",
+}
+# Root of the source code of skims, queries included
+SKIMS_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@cache
+def _get_results_cache() -> CacheStore:
+    return get_cache_store("sast_results")
+
+
+@cache
+def _get_skims_version() -> str:
+    """Digest of the whole source code of skims.
+
+    Results stored by a different version of skims may lack findings of
+    new or fixed queries, so they must never be carried forward.
+    """
+    return get_source_digest(SKIMS_ROOT)
+
+
+def _get_cache_key(commit: str) -> tuple[Any, ...]:
+    return (
+        _get_skims_version(),
+        CTX.config.namespace,
+        commit,
+        tuple(sorted(finding.name for finding in CTX.config.checks)),
+        CTX.config.path.include,
+        CTX.config.path.exclude,
+        CTX.config.path.lib_path,
+        CTX.config.path.lib_root,
+    )
+
+
+def _get_vulnerability_path(
+    vulnerability: Vulnerability,
+    paths: set[str],
+) -> str | None:
+    # Dependency results append the package to the path of the manifest,
+    # but the path itself may contain " (" too
+    what: str = vulnerability.what
+    index: int = len(what)
+    while index != -1:
+        if what[:index] in paths:
+            return what[:index]
+        index = what.rfind(" (", 0, index)
+    return None
+
+
+def _get_parent_directories(directory: str) -> Iterable[str]:
+    while directory:
+        directory = os.path.dirname(directory)
+        yield directory
+
+
+def get_affected_paths(
+    changed_paths: set[str],
+    all_paths: Iterable[str],
+) -> set[str]:
+    """Extend the changed paths with the paths whose results depend on them.
+
+    :param changed_paths: Paths modified since the base commit
+    :type changed_paths: set[str]
+    :param all_paths: Every path included in the analysis
+    :type all_paths: Iterable[str]
+    :return: The paths that must be analyzed again
+    :rtype: set[str]
+    """
+    affected_paths: set[str] = set(changed_paths)
+    for path in all_paths:
+        directory, name = os.path.split(path)
+        dependency = SIBLING_DEPENDENCIES.get(name)
+        if dependency and os.path.join(directory, dependency) in changed_paths:
+            affected_paths.add(path)
+        elif name in PARENT_DEPENDENCIES and any(
+            os.path.join(parent, name) in changed_paths
+            for parent in _get_parent_directories(directory)
+        ):
+            affected_paths.add(path)
+
+    return affected_paths
+
+
+def load_baseline(
+    all_paths: tuple[str, ...],
+) -> tuple[set[str], tuple[Vulnerability, ...]] | None:
+    """Compute what an incremental analysis against the base commit needs.
+
+    :return: The paths to analyze and the results of the base commit
+        to carry forward, or None if a full analysis is required
+    """
+    if not (base_commit := CTX.config.path.base_commit):
+        return None
+
+    changed_paths = get_changed_paths(CTX.config.working_dir, base_commit)
+    if changed_paths is None:
+        return None
+
+    results: tuple[Vulnerability, ...] | None = _get_results_cache().get(
+        _get_cache_key(base_commit)
+    )
+    if results is None:
+        log_blocking(
+            "warning",
+            "There are no results stored for %s by this version of skims, "
+            "or they were evicted from the cache, analyzing every path. "
+            "Analyze it with path.record_baseline to store them",
+            base_commit,
+        )
+        return None
+
+    affected_paths = get_affected_paths(changed_paths, all_paths)
+    unaffected_paths = set(all_paths) - affected_paths
+    return affected_paths, tuple(
+        result
+        for result in results
+        if _get_vulnerability_path(result, unaffected_paths) is not None
+    )
+
+
+def is_baseline_candidate() -> bool:
+    # Results only describe the commit if there are no local changes
+    commit: str = CTX.config.commit or get_repo_head_hash(
+        CTX.config.working_dir
+    )
+    return (
+        commit != DEFAULT_COMMIT
+        and get_changed_paths(CTX.config.working_dir, commit) == set()
+    )
+
+
+def store_baseline(results: tuple[Vulnerability, ...]) -> None:
+    commit: str = CTX.config.commit or get_repo_head_hash(
+        CTX.config.working_dir
+    )
+    _get_results_cache().store(_get_cache_key(commit), results)
@@ -22,6 +22,11 @@ class Paths:
     def get_all(self) -> tuple[str, ...]:
         return self.ok_paths + self.nu_paths + self.nv_paths
 
+    def keep_only(self, paths: set[str]) -> None:
+        self.ok_paths = tuple(path for path in self.ok_paths if path in paths)
+        self.nu_paths = tuple(path for path in self.nu_paths if path in paths)
+        self.nv_paths = tuple(path for path in self.nv_paths if path in paths)
+
     def set_lang(self) -> None:
         for path in self.ok_paths:
             lang = decide_language(path)
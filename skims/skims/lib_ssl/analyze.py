@@ -14,12 +14,11 @@ from ctx import (
 from lib_ssl import (
     analyze_protocol,
 )
-from lib_ssl.suites import (
-    SSLVersionId,
+from lib_ssl.probe import (
+    probe_tls_versions,
 )
 from lib_ssl.types import (
     SSLContext,
-    SSLServerResponse,
 )
 from model import (
     core_model,
@@ -87,41 +86,27 @@ def _get_ssl_targets(urls: set[str]) -> set[tuple[str, int, str]]:
     return targets
 
 
-def _get_ssl_context(
-    host: str,
-    port: int,
-    url: str | None,
-) -> SSLContext:
-    responses: list[SSLServerResponse] = []
-    for v_id in SSLVersionId:
-        with suppress(Exception):
-            if v_id != SSLVersionId.sslv3_0 and (
-                tls_response := analyze_protocol.tls_connect(
-                    host=host,
-                    port=port,
-                    v_id=v_id,
-                )
-            ):
-                responses = [*responses, tls_response]
-
-    return SSLContext(
-        host=host,
-        port=port,
-        original_url=url,
-        tls_responses=tuple(responses),
-    )
-
-
 async def get_ssl_contexts() -> set[SSLContext]:
-    ssl_contexts: set[SSLContext] = set()
-    for target in CTX.config.dast.ssl.include:
-        ssl_contexts.add(_get_ssl_context(target.host, target.port, None))
-
+    targets: set[tuple[str, int, str | None]] = {
+        (target.host, target.port, None)
+        for target in CTX.config.dast.ssl.include
+    }
     if CTX.config.dast.ssl_checks:
-        for host, port, url in _get_ssl_targets(set(CTX.config.dast.urls)):
-            ssl_contexts.add(_get_ssl_context(host, port, url))
+        targets.update(_get_ssl_targets(set(CTX.config.dast.urls)))
+
+    responses = await probe_tls_versions(
+        (host, port) for host, port, _ in targets
+    )
 
-    return ssl_contexts
+    return {
+        SSLContext(
+            host=host,
+            port=port,
+            original_url=url,
+            tls_responses=responses[(host, port)],
+        )
+        for host, port, url in targets
+    }
 
 
 async def analyze(
@@ -59,13 +59,17 @@ from zone import (
 
 
 def tls_connect(
-    host: str, port: int, v_id: SSLVersionId
+    host: str,
+    port: int,
+    v_id: SSLVersionId,
+    timeout: float | None = None,
 ) -> SSLServerResponse | None:
     intention_en = "verify if server supports " + ssl_id2ssl_name(v_id)
     ssl_settings = SSLSettings(
         context=SSLContext(host=host, port=port),
         tls_version=v_id,
         intention={core_model.LocalesEnum.EN: intention_en},
+        timeout=timeout,
     )
 
     with ssl_connect(ssl_settings) as ssl_socket:
@@ -0,0 +1,94 @@
+from aioextensions import (
+    collect,
+    in_thread,
+)
+import asyncio
+from collections.abc import (
+    Iterable,
+)
+from contextlib import (
+    suppress,
+)
+from lib_ssl import (
+    analyze_protocol,
+)
+from lib_ssl.suites import (
+    SSLVersionId,
+)
+from lib_ssl.types import (
+    SSLServerResponse,
+)
+
+# Constants
+CONNECT_TIMEOUT: float = 10.0
+HOST_CONCURRENCY: int = 4
+ProbeKey = tuple[str, int, SSLVersionId]
+PROBE_RESULTS: dict[ProbeKey, SSLServerResponse | None] = {}
+PROBED_VERSIONS: tuple[SSLVersionId, ...] = tuple(
+    v_id for v_id in SSLVersionId if v_id != SSLVersionId.sslv3_0
+)
+
+
+def _tls_connect(
+    host: str,
+    port: int,
+    v_id: SSLVersionId,
+    timeout: float,
+) -> SSLServerResponse | None:
+    with suppress(Exception):
+        return analyze_protocol.tls_connect(
+            host=host,
+            port=port,
+            v_id=v_id,
+            timeout=timeout,
+        )
+    return None
+
+
+async def probe_tls_versions(
+    targets: Iterable[tuple[str, int]],
+    *,
+    host_concurrency: int = HOST_CONCURRENCY,
+    timeout: float = CONNECT_TIMEOUT,
+) -> dict[tuple[str, int], tuple[SSLServerResponse, ...]]:
+    """Find the TLS versions each target accepts a handshake with.
+
+    Handshakes run concurrently in threads, at most `host_concurrency` at a
+    time against the same host. Results are cached by host, port and
+    version for the lifetime of the process.
+
+    :param targets: (host, port) pairs to probe
+    :param host_concurrency: Maximum simultaneous handshakes per host
+    :param timeout: Seconds to wait for each connection and handshake
+    :return: The server responses of every target, ordered by version
+    """
+    semaphores: dict[str, asyncio.Semaphore] = {}
+    unique_targets: tuple[tuple[str, int], ...] = tuple(sorted(set(targets)))
+
+    async def probe(key: ProbeKey) -> SSLServerResponse | None:
+        if key not in PROBE_RESULTS:
+            host, port, v_id = key
+            semaphore = semaphores.setdefault(
+                host, asyncio.Semaphore(host_concurrency)
+            )
+            async with semaphore:
+                PROBE_RESULTS[key] = await in_thread(
+                    _tls_connect, host, port, v_id, timeout
+                )
+        return PROBE_RESULTS[key]
+
+    keys: tuple[ProbeKey, ...] = tuple(
+        (host, port, v_id)
+        for host, port in unique_targets
+        for v_id in PROBED_VERSIONS
+    )
+    results = dict(zip(keys, await collect(map(probe, keys))))
+
+    return {
+        (host, port): tuple(
+            response
+            for v_id in PROBED_VERSIONS
+            if (response := results[(host, port, v_id)]) is not None
+        )
+        for host, port in unique_targets
+    }
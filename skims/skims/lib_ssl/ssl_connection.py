@@ -56,7 +56,9 @@ def ssl_connect(
     intention: str = ssl_settings.intention[LocalesEnum.EN]
     socket_has_errors = False
     try:
-        sock: socket.socket | None = tcp_connect(host, port, intention)
+        sock: socket.socket | None = tcp_connect(
+            host, port, intention, ssl_settings.timeout
+        )
 
         if sock is None:
             yield None
@@ -154,6 +154,7 @@ class SSLSettings(NamedTuple):
         LocalesEnum.EN: "establish SSL/TLS connection",
         LocalesEnum.ES: "establecer conexión SSL/TLS",
     }
+    timeout: float | None = None
 
     def __str__(self) -> str:
         return str(self.context)
@@ -1306,6 +1306,8 @@ class SkimsPathConfig(NamedTuple):
     include: tuple[str, ...]
     lib_path: bool
     lib_root: bool
+    base_commit: str | None = None
+    record_baseline: bool = False
 
 
 class SkimsSslTarget(NamedTuple):
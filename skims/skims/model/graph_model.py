@@ -22,6 +22,7 @@ NAttrs = dict[str, str]
 NAttrsPredicateFunction = Callable[[NAttrs], bool]
 NId = str
 NIdPredicateFunction = Callable[[str], bool]
+NodeIndex = dict[str, dict[str, tuple[NId, ...]]]
 GraphSyntax = dict[str, str]
 
 
@@ -94,3 +95,11 @@ GraphShardNodes = Iterable[GraphShardNode]
 
 Query = Callable[[GraphDB], core_model.Vulnerabilities]
 Queries = tuple[tuple[core_model.FindingEnum, Query], ...]
+
+
+class QueryManifest(NamedTuple):
+    # Languages of the shards the query reads
+    languages: set[GraphShardMetadataLanguage]
+    # Types of the nodes the query starts its search from, it reports
+    # nothing on a shard without any of them. Empty if any shard can match
+    node_types: set[str]
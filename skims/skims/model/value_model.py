@@ -11,8 +11,17 @@ class ValueToAdd(NamedTuple):
     data: dict[str, int]
 
     def add(self, element: str) -> None:
-        self.data.setdefault(element, 0)
-        self.data[element] += 1
+        self.data[element] = self.data.get(element, 0) + 1
+
+    def merge(self, data: dict[str, int]) -> None:
+        """Add the occurrences counted by a worker process."""
+        for element, occurrences in data.items():
+            self.data[element] = self.data.get(element, 0) + occurrences
+
+    def pop_all(self) -> dict[str, int]:
+        data = dict(self.data)
+        self.data.clear()
+        return data
 
     def __str__(self) -> str:
         data = [
@@ -14,7 +14,14 @@ import bs4
 from bs4 import (
     BeautifulSoup,
 )
+from collections.abc import (
+    Iterator,
+)
 import contextlib
+from functools import (
+    cache,
+)
+import hashlib
 import lxml.etree  # nosec
 from model import (
     core_model,
@@ -22,13 +29,21 @@ from model import (
 from model.core_model import (
     LocalesEnum,
 )
+from operator import (
+    attrgetter,
+)
 from parse_android_manifest.types import (
     APKContext,
+    APKIndex,
 )
 from serializers import (
     make_snippet,
     SnippetViewport,
 )
+from state.cache import (
+    CacheStore,
+    get_cache_store,
+)
 from typing import (
     Any,
     NamedTuple,
@@ -43,6 +58,59 @@ from zone import (
     t,
 )
 
+# Constants
+# Bump it whenever the contents of APKIndex change
+INDEX_VERSION: int = 1
+# Class name, method name and descriptor of the methods whose callers
+# are indexed
+INSPECTED_METHODS: tuple[tuple[str, str, str], ...] = (
+    ("Ljava/io/File;", "delete", "()Z"),
+    (
+        "Landroid/net/SSLCertificateSocketFactory;",
+        "getInsecure",
+        "(I Landroid/net/SSLSessionCache;)Ljavax/net/ssl/SSLSocketFactory;",
+    ),
+)
+NETWORK_SECURITY_CONFIG: str = "res/xml/network_security_config.xml"
+# Packages whose classes can be found unobfuscated in release builds
+UNOBFUSCATED_CLASS_PREFIXES: tuple[str, ...] = (
+    "androidx/annotation/",
+    "javax/inject/",
+    "androidx/browser/",
+    "androidx/viewpager2/",
+    "de/greenrobot/",
+    "androidx/savedstate/",
+    "androidx/media/",
+    "butterknife/internal/",
+    "androidx/activity/",
+    "me/leolin/",
+    "androidx/versionedparcelable/",
+    "io/nlopez/",
+    "butterknife/runtime/",
+    "org/unimodules/",
+    "androidx/cardview/",
+    "com/raizlabs/",
+    "androidx/coordinatorlayout/",
+    "androidx/viewpager/",
+    "androidx/lifecycle/",
+    "android/support/",
+    "net/openid/",
+    "com/amplitude/",
+    "androidx/biometric/",
+    "com/theartofdev/",
+    "androidx/core/",
+    "androidx/fragment/",
+    "okhttp3/internal/",
+    "androidx/recyclerview/",
+    "host/exp/",
+    "com/bumptech/",
+    "androidx/appcompat/",
+    "versioned/host/",
+    "expo/modules/",
+    "com/google/",
+    "com/facebook/",
+)
+
 
 class APKCheckCtx(NamedTuple):
     apk_ctx: APKContext
@@ -299,10 +367,131 @@ def _apk_exported_cp(
     )
 
 
+def _get_manifest(apk_obj: APK) -> str | None:
+    with contextlib.suppress(KeyError):
+        return BeautifulSoup(
+            # pylint: disable=c-extension-no-member
+            lxml.etree.tostring(apk_obj.xml["AndroidManifest.xml"]),
+            features="html.parser",
+        ).prettify()
+    return None
+
+
+def _get_analysis(apk_obj: APK) -> Analysis:
+    dalviks = []
+    analysis = Analysis()
+    for dex in apk_obj.get_all_dex():
+        dalvik = DalvikVMFormat(
+            dex,
+            using_api=apk_obj.get_target_sdk_version(),
+        )
+        analysis.add(dalvik)
+        dalviks.append(dalvik)
+        dalvik.set_decompiler(DecompilerDAD(dalviks, analysis))
+
+    analysis.create_xref()
+    return analysis
+
+
+def _get_method_callers(
+    analysis: Analysis, class_name: str, method: str, descriptor: str
+) -> tuple[str, ...]:
+    met_ana = analysis.get_method_analysis_by_name(
+        class_name=class_name, method_name=method, method_descriptor=descriptor
+    )
+
+    if not met_ana:
+        return ()
+
+    return tuple(
+        x.name for x, _, _ in met_ana.get_xref_from() if "Activity" in x.name
+    )
+
+
+def _get_unobfuscated_classes(
+    analysis: Analysis,
+) -> Iterator[tuple[str, str]]:
+    for dvm in analysis.vms:
+        for class_ in dvm.get_classes():
+            class_name: str = class_.get_name()[1:-1]
+            class_is_interface: bool = 0x200 & class_.get_access_flags()
+            if not class_is_interface and class_name.startswith(
+                UNOBFUSCATED_CLASS_PREFIXES
+            ):
+                yield class_name, class_.get_source()
+                break
+
+
+def _build_index(apk_obj: APK) -> APKIndex:
+    analysis: Analysis = _get_analysis(apk_obj)
+    network_security_config: bytes | None = None
+    with contextlib.suppress(KeyError):
+        network_security_config = apk_obj.zip.read(NETWORK_SECURITY_CONFIG)
+
+    return APKIndex(
+        activities_source="".join(
+            class_.get_source()
+            for dvm in analysis.vms
+            for class_ in dvm.get_classes()
+            if "Activity" in class_.name
+        ),
+        class_names=tuple(
+            sorted(set(map(attrgetter("name"), analysis.get_classes())))
+        ),
+        files=tuple(apk_obj.get_files()),
+        method_callers=tuple(
+            (method, _get_method_callers(analysis, *method))
+            for method in INSPECTED_METHODS
+        ),
+        method_names=tuple(
+            sorted(set(map(attrgetter("name"), analysis.get_methods())))
+        ),
+        network_security_config=network_security_config,
+        signature_names=tuple(apk_obj.get_signature_names()),
+        strings=tuple(string.get_value() for string in analysis.get_strings()),
+        target_sdk_version=apk_obj.get_target_sdk_version(),
+        unobfuscated_classes=tuple(_get_unobfuscated_classes(analysis)),
+    )
+
+
+@cache
+def _get_index_cache() -> CacheStore:
+    return get_cache_store("apk_index")
+
+
+def _get_file_hash(path: str) -> str:
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1048576), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _load_apk(path: str) -> tuple[str | None, APKIndex | None]:
+    """Decode the manifest and index the bytecode of the APK at `path`.
+
+    Results are cached on disk by the SHA-256 of the APK, so analyzing
+    the same build again does not decompile it.
+    """
+    key = (INDEX_VERSION, _get_file_hash(path))
+    if cached := _get_index_cache().get(key):
+        manifest, index_fields = cached
+        return manifest, index_fields and APKIndex(**index_fields)
+
+    manifest = None
+    index: APKIndex | None = None
+    with contextlib.suppress(zipfile.BadZipFile):
+        apk_obj = APK(path)
+        manifest = _get_manifest(apk_obj)
+        index = _build_index(apk_obj)
+
+    _get_index_cache().store(key, (manifest, index and index._asdict()))
+    return manifest, index
+
+
 def get_apk_context(path: str) -> APKContext:
-    apk_obj: APK | None = None
     apk_manifest: BeautifulSoup | None = None
-    analysis: Analysis | None = None
+    index: APKIndex | None = None
     if path.endswith("AndroidManifest.xml"):
         # pylint: disable=c-extension-no-member
         apk_manifest_data = lxml.etree.parse(path)  # nosec
@@ -317,37 +506,13 @@ def get_apk_context(path: str) -> APKContext:
                 features="html.parser",
             )
     else:
-        with contextlib.suppress(zipfile.BadZipFile):
-            apk_obj = APK(path)
-
-            with contextlib.suppress(KeyError):
-                apk_manifest_data = apk_obj.xml["AndroidManifest.xml"]
-                apk_manifest = BeautifulSoup(
-                    BeautifulSoup(
-                        # pylint: disable=c-extension-no-member
-                        lxml.etree.tostring(apk_manifest_data),
-                        features="html.parser",
-                    ).prettify(),
-                    features="html.parser",
-                )
-
-            dalviks = []
-            analysis = Analysis()
-            for dex in apk_obj.get_all_dex():
-                dalvik = DalvikVMFormat(
-                    dex,
-                    using_api=apk_obj.get_target_sdk_version(),
-                )
-                analysis.add(dalvik)
-                dalviks.append(dalvik)
-                dalvik.set_decompiler(DecompilerDAD(dalviks, analysis))
-
-            analysis.create_xref()
+        manifest, index = _load_apk(path)
+        if manifest is not None:
+            apk_manifest = BeautifulSoup(manifest, features="html.parser")
 
     return APKContext(
-        analysis=analysis,
         apk_manifest=apk_manifest,
-        apk_obj=apk_obj,
+        index=index,
         path=path,
     )
 
@@ -1,13 +1,34 @@
-import androguard.core.analysis.analysis
-import androguard.core.bytecodes.apk
 import bs4
 from typing import (
     NamedTuple,
 )
 
 
+class APKIndex(NamedTuple):
+    # Concatenated source code of the classes named like an Activity
+    activities_source: str
+    class_names: tuple[str, ...]
+    files: tuple[str, ...]
+    # Names of the Activity classes calling each inspected method
+    method_callers: tuple[tuple[tuple[str, str, str], tuple[str, ...]], ...]
+    method_names: tuple[str, ...]
+    network_security_config: bytes | None
+    signature_names: tuple[str, ...]
+    strings: tuple[str, ...]
+    target_sdk_version: str | None
+    # Name and source code of the first unobfuscated class of each dex
+    unobfuscated_classes: tuple[tuple[str, str], ...]
+
+    def get_method_callers(
+        self, class_name: str, method: str, descriptor: str
+    ) -> tuple[str, ...]:
+        for key, callers in self.method_callers:
+            if key == (class_name, method, descriptor):
+                return callers
+        return ()
+
+
 class APKContext(NamedTuple):
-    analysis: androguard.core.analysis.analysis.Analysis | None
     apk_manifest: bs4.BeautifulSoup | None
-    apk_obj: androguard.core.bytecodes.apk.APK | None
+    index: APKIndex | None
     path: str
@@ -5,7 +5,14 @@ import ast
 from frozendict import (
     frozendict,
 )
+from functools import (
+    cache,
+)
 import lark
+import re
+from typing import (
+    Any,
+)
 
 # Constants
 GRAMMAR = r"""
@@ -35,12 +42,142 @@ GRAMMAR = r"""
 """
 
 
-def loads_blocking(
-    stream: str,
-    *,
-    default: frozendict | None = None,
-) -> frozendict:
-    json_parser = lark.Lark(
+# Same tokens the grammar accepts: whitespace, then a string, a number, a
+# literal or a punctuation sign. Strings never span several lines
+TOKEN = re.compile(
+    r"([ \t\f\r\n]*)(?:"
+    r'("(?:[^"\\\n]|\\.)*")'
+    r"|([+-]?(?:[0-9]+\.[0-9]*|\.[0-9]+|[0-9]+)(?:[eE][+-]?[0-9]+)?)"
+    r"|(false|null|true)"
+    r"|([{}\[\],:])"
+    r")"
+)
+TOKEN_STRING: int = 2
+TOKEN_NUMBER: int = 3
+TOKEN_SINGLE: int = 4
+INT = re.compile(r"-?(?:0|[1-9][0-9]*)")
+FLOAT = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+SINGLES: dict[str, bool | None] = {
+    "false": False,
+    "null": None,
+    "true": True,
+}
+WHITESPACE: str = " \t\f\r\n"
+
+
+class _ScanError(Exception):
+    pass
+
+
+class _Scanner:
+    """Single pass parser that builds the same tree as `JSONBuilder`.
+
+    Lines and columns are 1-based and tracked incrementally, only
+    whitespace may contain new lines.
+    """
+
+    def __init__(self, stream: str) -> None:
+        self.stream = stream
+        self.pos = 0
+        self.line = 1
+        self.line_start = 0
+
+    def next_token(self) -> tuple[int, str, int, int]:
+        match = TOKEN.match(self.stream, self.pos)
+        if match is None:
+            raise _ScanError(self.pos)
+
+        whitespace: str = match.group(1)
+        if "\n" in whitespace:
+            self.line += whitespace.count("\n")
+            self.line_start = self.pos + whitespace.rindex("\n") + 1
+
+        kind: int = match.lastindex or 0
+        start: int = match.start(kind)
+        self.pos = match.end()
+        return (
+            kind,
+            match.group(kind),
+            self.line,
+            start - self.line_start + 1,
+        )
+
+    def scan(self) -> Any:
+        value = self.value(self.next_token())
+        if self.stream[self.pos :].strip(WHITESPACE):
+            raise _ScanError(self.pos)
+        return value
+
+    def value(self, token: tuple[int, str, int, int]) -> Any:
+        kind, text, line, column = token
+        if kind == TOKEN_STRING:
+            return self.string(token)
+        if kind == TOKEN_NUMBER:
+            if INT.fullmatch(text):
+                item: Any = int(text)
+            elif FLOAT.fullmatch(text):
+                item = float(text)
+            else:
+                item = ast.literal_eval(text)
+            return frozendict({"column": column, "item": item, "line": line})
+        if kind == TOKEN_SINGLE:
+            return frozendict(
+                {"column": column, "item": SINGLES[text], "line": line}
+            )
+        if text == "{":
+            return self.object()
+        if text == "[":
+            return self.array()
+        raise _ScanError(self.pos)
+
+    @staticmethod
+    def string(token: tuple[int, str, int, int]) -> frozendict:
+        kind, text, line, column = token
+        if kind != TOKEN_STRING:
+            raise _ScanError(text)
+        return frozendict(
+            {
+                "column": column,
+                "item": ast.literal_eval(text) if "\\" in text else text[1:-1],
+                "line": line,
+            }
+        )
+
+    def object(self) -> frozendict:
+        pairs: list[tuple[frozendict, Any]] = []
+        token = self.next_token()
+        if token[1] == "}":
+            return frozendict(pairs)
+        while True:
+            key = self.string(token)
+            if self.next_token()[1] != ":":
+                raise _ScanError(self.pos)
+            pairs.append((key, self.value(self.next_token())))
+            token = self.next_token()
+            if token[1] == "}":
+                return frozendict(pairs)
+            if token[1] != ",":
+                raise _ScanError(self.pos)
+            token = self.next_token()
+
+    def array(self) -> frozendict:
+        values: list[Any] = []
+        token = self.next_token()
+        if token[1] != "]":
+            while True:
+                values.append(self.value(token))
+                token = self.next_token()
+                if token[1] == "]":
+                    break
+                if token[1] != ",":
+                    raise _ScanError(self.pos)
+                token = self.next_token()
+        return frozendict({"column": 0, "item": tuple(values), "line": 0})
+
+
+@cache
+def _get_json_parser() -> lark.Lark:
+    return lark.Lark(
         grammar=GRAMMAR,
         parser="lalr",
         lexer="standard",
@@ -49,8 +186,21 @@ def loads_blocking(
         transformer=JSONBuilder(),
     )
 
+
+def loads_blocking(
+    stream: str,
+    *,
+    default: frozendict | None = None,
+) -> frozendict:
+    try:
+        return _Scanner(stream).scan()
+    except Exception:  # pylint: disable=broad-except
+        # Let the grammar decide on anything the scanner does not handle,
+        # like invalid literals or very deeply nested documents
+        pass
+
     try:
-        return json_parser.parse(stream)
+        return _get_json_parser().parse(stream)
     except lark.exceptions.LarkError:
         if default is None:
             raise
@@ -67,7 +217,6 @@ async def loads(
 
 
 class JSONBuilder(lark.Transformer):
-
     pair = tuple
     object = frozendict
     single_map = {
@@ -1,14 +1,25 @@
+from collections import (
+    OrderedDict,
+)
 from collections.abc import (
+    Callable,
     Iterator,
 )
 from ctx import (
     CTX,
     TREE_SITTER_PARSERS,
 )
+from functools import (
+    cache,
+)
+import hashlib
 from itertools import (
     count,
 )
 import json
+from model import (
+    graph_model,
+)
 from model.graph_model import (
     Graph,
     GraphDB,
@@ -19,9 +30,16 @@ from model.graph_model import (
     GraphSyntax,
 )
 import os
+import serialization
+from state.cache import (
+    CacheStore,
+    get_cache_store,
+)
+import syntax_cfg
 from syntax_cfg.generate import (
     add_syntax_cfg,
 )
+import syntax_graph
 from syntax_graph.generate import (
     build_syntax_graph,
 )
@@ -31,30 +49,48 @@ from tree_sitter import (
     Parser,
     Tree,
 )
+from utils import (
+    graph as g,
+)
 from utils.encodings import (
     json_dump,
 )
 from utils.fs import (
     decide_language,
+    get_source_digest,
     safe_sync_get_file_raw_content,
 )
 from utils.graph import (
+    build_node_index,
     copy_ast,
+    PATH,
     styles,
     to_svg,
 )
+from utils.graph.compact import (
+    to_compact_graph,
+)
 from utils.logs import (
     log_blocking,
 )
 from utils.string import (
     get_debug_path,
 )
+from utils.timings import (
+    timed,
+)
 
 
 class ParsingError(Exception):
     pass
 
 
+# Last trees parsed by this process, to re-parse them incrementally
+PARSED_TREES: OrderedDict[
+    tuple[str, GraphShardMetadataLanguage], tuple[bytes, Tree]
+] = OrderedDict()
+PARSED_TREES_MAX_SIZE: int = 16
+
 FIELDS_BY_LANGUAGE: dict[
     GraphShardMetadataLanguage, dict[str, tuple[str, ...]]
 ] = {}
@@ -197,88 +233,243 @@ def _build_ast_graph(
     node: Node,
     counter: Iterator[str],
     graph: Graph,
-    *,
-    _edge_index: str | None = None,
-    _parent: str | None = None,
-    _parent_fields: dict[int, str] | None = None,
 ) -> Graph:
-    if not isinstance(node, Node):
-        raise NotImplementedError()
+    # Pre-order walk with an explicit stack of
+    # (node, parent id, edge index, parent fields), so deeply nested sources
+    # do not recurse once per level
+    stack: list[tuple[Node, str | None, str | None, dict[int, str]]] = [
+        (node, None, None, {})
+    ]
+    while stack:
+        node, parent, edge_index, parent_fields = stack.pop()
+        if not isinstance(node, Node):
+            raise NotImplementedError()
 
-    if node.has_error:
-        raise ParsingError()
+        if node.has_error:
+            raise ParsingError()
 
-    n_id = next(counter)
-    raw_l, raw_c = node.start_point
+        n_id = next(counter)
+        raw_l, raw_c = node.start_point
 
-    graph.add_node(
-        n_id, label_l=raw_l + 1, label_c=raw_c + 1, label_type=node.type
-    )
+        graph.add_node(
+            n_id, label_l=raw_l + 1, label_c=raw_c + 1, label_type=node.type
+        )
+
+        if parent is not None:
+            graph.add_edge(
+                parent, n_id, label_ast="AST", label_index=edge_index
+            )
 
-    if _parent is not None:
-        graph.add_edge(_parent, n_id, label_ast="AST", label_index=_edge_index)
-
-        # if the node is a parent field acording node_type file, associate id
-        # example node-types files at https://github.com/
-        # tree-sitter/tree-sitter-c-sharp/blob/master/src/node-types.json
-        # tree-sitter/tree-sitter-java/blob/master/src/node-types.json
-        if field := (_parent_fields or {}).get(hash_node(node)):
-            graph.nodes[_parent][f"label_field_{field}"] = n_id
-
-    if not node.children or _is_final_node(node, language):
-        # Consider it a final node, extract the text from it
-        node_content = content[node.start_byte : node.end_byte]
-        graph.nodes[n_id]["label_text"] = node_content.decode("latin-1")
-
-    elif language != GraphShardMetadataLanguage.NOT_SUPPORTED:
-        # It's not a final node, recurse
-        for edge_index, child in enumerate(node.children):
-            _build_ast_graph(
-                content,
-                language,
-                child,
-                counter,
-                graph,
-                _edge_index=str(edge_index),
-                _parent=n_id,
-                _parent_fields={
-                    hash_node(child): fld
-                    for fld in FIELDS_BY_LANGUAGE[language].get(node.type, ())
-                    for child in [node.child_by_field_name(fld)]
-                    if child
-                },
+            # if the node is a parent field acording node_type file,
+            # associate id example node-types files at https://github.com/
+            # tree-sitter/tree-sitter-c-sharp/blob/master/src/node-types.json
+            # tree-sitter/tree-sitter-java/blob/master/src/node-types.json
+            if field := parent_fields.get(hash_node(node)):
+                graph.nodes[parent][f"label_field_{field}"] = n_id
+
+        if not node.children or _is_final_node(node, language):
+            # Consider it a final node, extract the text from it
+            node_content = content[node.start_byte : node.end_byte]
+            graph.nodes[n_id]["label_text"] = node_content.decode("latin-1")
+
+        elif language != GraphShardMetadataLanguage.NOT_SUPPORTED:
+            # It's not a final node, visit its children in order
+            fields = {
+                hash_node(child): fld
+                for fld in FIELDS_BY_LANGUAGE[language].get(node.type, ())
+                for child in [node.child_by_field_name(fld)]
+                if child
+            }
+            stack.extend(
+                (child, n_id, str(index), fields)
+                for index, child in reversed(tuple(enumerate(node.children)))
             )
 
     return graph
 
 
+@cache
+def _get_language(language: GraphShardMetadataLanguage) -> Language:
+    path: str = os.path.join(TREE_SITTER_PARSERS, f"{language.value}.so")
+    return Language(path, language.value)
+
+
+@cache
+def _get_parser(language: GraphShardMetadataLanguage) -> Parser:
+    parser: Parser = Parser()
+    parser.set_language(_get_language(language))
+    return parser
+
+
+def _get_point(content: bytes, offset: int) -> tuple[int, int]:
+    row: int = content.count(b"\n", 0, offset)
+    column: int = offset - (content.rfind(b"\n", 0, offset) + 1)
+    return row, column
+
+
+def _bisect_length(limit: int, matches: Callable[[int], bool]) -> int:
+    """Return the greatest size in [0, limit] for which `matches` holds."""
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if matches(middle):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _edit_tree(tree: Tree, old_content: bytes, content: bytes) -> Tree:
+    """Describe the change between both contents as a single edit on `tree`.
+
+    Tree-sitter then reuses every subtree outside the edited range when
+    parsing `content` with `tree` as the old tree.
+    """
+    limit: int = min(len(old_content), len(content))
+    prefix: int = _bisect_length(
+        limit, lambda size: old_content[:size] == content[:size]
+    )
+    suffix: int = _bisect_length(
+        limit - prefix,
+        lambda size: old_content[len(old_content) - size :]
+        == content[len(content) - size :],
+    )
+
+    old_end_byte: int = len(old_content) - suffix
+    new_end_byte: int = len(content) - suffix
+    tree.edit(
+        start_byte=prefix,
+        old_end_byte=old_end_byte,
+        new_end_byte=new_end_byte,
+        start_point=_get_point(content, prefix),
+        old_end_point=_get_point(old_content, old_end_byte),
+        new_end_point=_get_point(content, new_end_byte),
+    )
+    return tree
+
+
 def parse_content(
     content: bytes,
     language: GraphShardMetadataLanguage,
+    path: str | None = None,
 ) -> Tree:
+    parser: Parser = _get_parser(language)
+
+    if path is None:
+        return parser.parse(content)
+
+    old_tree: Tree | None = None
+    if previous := PARSED_TREES.pop((path, language), None):
+        old_content, old_tree = previous
+        if old_content == content:
+            PARSED_TREES[(path, language)] = previous
+            return old_tree
+        old_tree = _edit_tree(old_tree, old_content, content)
+
+    tree: Tree = (
+        parser.parse(content)
+        if old_tree is None
+        else parser.parse(content, old_tree)
+    )
+
+    PARSED_TREES[(path, language)] = (content, tree)
+    while len(PARSED_TREES) > PARSED_TREES_MAX_SIZE:
+        PARSED_TREES.popitem(last=False)
+
+    return tree
+
+
+@cache
+def _get_graph_cache() -> CacheStore:
+    return get_cache_store("graphs")
+
+
+@cache
+def _get_grammar_version(language: GraphShardMetadataLanguage) -> str:
     path: str = os.path.join(TREE_SITTER_PARSERS, f"{language.value}.so")
-    parser: Parser = Parser()
-    parser.set_language(Language(path, language.value))
-    return parser.parse(content)
+    with open(path, "rb") as handle:
+        return hashlib.sha256(handle.read()).hexdigest()
+
+
+@cache
+def _get_skims_version() -> str:
+    """Digest of the source code involved in building a graph shard.
+
+    Any change to the parser, the syntax graph or the CFG builders, or to
+    the graph types and how they are serialized, produces a new version,
+    invalidating the previously cached shards.
+    """
+    return get_source_digest(
+        __file__,
+        graph_model.__file__,
+        *g.__path__,
+        *serialization.__path__,
+        *syntax_cfg.__path__,
+        *syntax_graph.__path__,
+    )
 
 
-def _parse_one_cached(
+def _get_cache_key(
+    content: bytes,
+    language: GraphShardMetadataLanguage,
+) -> tuple[str, str, str, str]:
+    return (
+        hashlib.sha256(content).hexdigest(),
+        language.value,
+        _get_grammar_version(language),
+        _get_skims_version(),
+    )
+
+
+def _parse_one(
     *,
     content: bytes,
     path: str,
     language: GraphShardMetadataLanguage,
 ) -> GraphShardCacheable | None:
-    raw_tree: Tree = parse_content(content, language)
+    if CTX.debug:
+        # Cached shards do not carry the styles needed for debugging
+        return _parse_one_cached(content=content, path=path, language=language)
+
+    cache_store = _get_graph_cache()
+    cache_key = _get_cache_key(content, language)
+    with timed("graph_cache"):
+        cached = cache_store.get(cache_key)
+    if cached:
+        return cached
+
+    graph = _parse_one_cached(content=content, path=path, language=language)
+    if graph:
+        cache_store.store(cache_key, graph)
+    return graph
+
+
+def build_ast_graph(
+    content: bytes,
+    language: GraphShardMetadataLanguage,
+    path: str,
+) -> Graph | None:
+    raw_tree: Tree = parse_content(content, language, path)
     node: Node = raw_tree.root_node
 
     counter = map(str, count(1))
     try:
-        graph: Graph = _build_ast_graph(
-            content, language, node, counter, Graph()
-        )
+        return _build_ast_graph(content, language, node, counter, Graph())
     except ParsingError:
         return None
 
+
+def _parse_one_cached(
+    *,
+    content: bytes,
+    path: str,
+    language: GraphShardMetadataLanguage,
+) -> GraphShardCacheable | None:
+    with timed("parse"):
+        graph = build_ast_graph(content, language, path)
+    if graph is None:
+        return None
+
     syntax_support = {
         GraphShardMetadataLanguage.CSHARP,
         GraphShardMetadataLanguage.DART,
@@ -295,8 +486,9 @@ def _parse_one_cached(
     }
 
     if language in syntax_support:
-        if syntax_graph := build_syntax_graph(path, language, graph):
-            syntax_graph = add_syntax_cfg(syntax_graph)
+        with timed("syntax_graph"):
+            if syntax_graph := build_syntax_graph(path, language, graph):
+                syntax_graph = add_syntax_cfg(syntax_graph)
     else:
         syntax_graph = None
 
@@ -310,6 +502,10 @@ def _parse_one_cached(
         if syntax_graph:
             styles.add(syntax_graph)
 
+    if syntax_graph:
+        with timed("compact_graph"):
+            syntax_graph = to_compact_graph(syntax_graph)
+
     return GraphShardCacheable(
         graph=graph,
         metadata=metadata,
@@ -326,7 +522,7 @@ def parse_one(
     if not content:
         return None
     try:
-        graph = _parse_one_cached(
+        graph = _parse_one(
             content=content,
             path=path,
             language=language,
@@ -359,6 +555,10 @@ def parse_one(
         if graph.syntax_graph:
             to_svg(graph.syntax_graph, f"{output}.syntax_graph")
 
+    if graph.syntax_graph:
+        build_node_index(graph.syntax_graph)
+        graph.syntax_graph.graph[PATH] = path
+
     return GraphShard(
         graph=graph.graph,
         metadata=graph.metadata,
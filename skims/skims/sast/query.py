@@ -1,3 +1,6 @@
+from collections.abc import (
+    Callable,
+)
 from ctx import (
     CTX,
 )
@@ -7,12 +10,14 @@ from model import (
 )
 import os
 from serializers import (
-    make_snippet,
     SnippetViewport,
 )
 from typing import (
     Any,
 )
+from utils.snippets import (
+    make_file_snippet,
+)
 from vulnerabilities import (
     build_lines_vuln,
     build_metadata,
@@ -21,6 +26,40 @@ from zone import (
     t,
 )
 
+# Constants
+QUERY_MANIFESTS: dict[graph_model.Query, graph_model.QueryManifest] = {}
+
+
+def query_manifest(
+    *,
+    languages: set[graph_model.GraphShardMetadataLanguage],
+    node_types: set[str] | None = None,
+) -> Callable[[graph_model.Query], graph_model.Query]:
+    """Declare the shards the decorated query can report on.
+
+    The engine uses the manifest to skip the query on any other shard,
+    queries without one run on every shard.
+    """
+
+    def decorator(query: graph_model.Query) -> graph_model.Query:
+        QUERY_MANIFESTS[query] = graph_model.QueryManifest(
+            languages=languages,
+            node_types=node_types or set(),
+        )
+        return query
+
+    return decorator
+
+
+def get_query_manifest(query: graph_model.Query) -> graph_model.QueryManifest:
+    return QUERY_MANIFESTS.get(
+        query,
+        graph_model.QueryManifest(
+            languages=set(graph_model.GraphShardMetadataLanguage),
+            node_types=set(),
+        ),
+    )
+
 
 def get_vulnerability_from_n_id(
     *,
@@ -38,12 +77,6 @@ def get_vulnerability_from_n_id(
     n_attrs_label_column = n_attrs["label_c"]
     n_attrs_label_line = n_attrs["label_l"]
 
-    with open(
-        file=os.path.join(CTX.config.working_dir, meta_attrs_label_path),
-        encoding="latin-1",
-    ) as handle:
-        content: str = handle.read()
-
     if metadata:
         what_data = (
             f"{meta_attrs_label_path} ({meta_what})"
@@ -66,8 +99,10 @@ def get_vulnerability_from_n_id(
                 f"{t(key=desc_key, **desc_params)} {t(key='words.in')} "
                 f"{CTX.config.namespace}/{meta_attrs_label_path}"
             ),
-            snippet=make_snippet(
-                content=content,
+            snippet=make_file_snippet(
+                path=os.path.join(
+                    CTX.config.working_dir, meta_attrs_label_path
+                ),
                 viewport=SnippetViewport(
                     column=int(n_attrs_label_column),
                     line=int(n_attrs_label_line),
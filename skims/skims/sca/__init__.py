@@ -24,12 +24,19 @@ from s3.resource import (
     s3_shutdown,
     s3_start_resource,
 )
+from sca.index import (
+    get_advisories_from_index,
+)
 from utils.function import (
     semver_match,
 )
 from utils.logs import (
     log_blocking,
 )
+from utils.semver import (
+    InvalidSemver,
+    match_versions,
+)
 
 Database = dict[str, dict[str, dict[str, str]]] | None
 
@@ -97,6 +104,15 @@ async def get_advisories_from_dynamodb(
 async def get_remote_advisories(
     pkg_name: str, platform: str
 ) -> list[tuple[str, str]]:
+    if platform.lower() in SUPPORTED_PLATFORMS and (
+        (
+            indexed_advisories := get_advisories_from_index(
+                pkg_name, platform.lower()
+            )
+        )
+        is not None
+    ):
+        return sorted(indexed_advisories)
     if (
         DATABASE is None
         and (
@@ -116,24 +132,51 @@ async def get_remote_advisories(
     return []
 
 
+def _match_advisories(
+    versions: tuple[str, ...],
+    advisories: Iterable[tuple[str, str]],
+) -> tuple[list[str], ...]:
+    vulnerabilities: tuple[list[str], ...] = tuple([] for _ in versions)
+    for ref, constraints in advisories:
+        try:
+            matches = match_versions(versions, constraints)
+        except InvalidSemver:
+            # Match one by one, so a single invalid version is logged and
+            # the rest are still matched
+            matches = tuple(
+                semver_match(version, constraints) for version in versions
+            )
+        for version_vulnerabilities, matched in zip(vulnerabilities, matches):
+            if matched:
+                version_vulnerabilities.append(ref)
+    return vulnerabilities
+
+
 async def get_vulnerabilities(
     platform: core_model.Platform,
     product: str,
-    version: str,
-) -> list[str]:
-    product = product.lower()
-    version = version.lower()
+    versions: Iterable[str],
+) -> dict[str, list[str]]:
+    """Find the advisories that affect each version of `product`.
 
-    advisories = await get_remote_advisories(product, platform.value)
+    Advisories are fetched once, and each constraint is compiled once for
+    the whole batch of versions.
 
-    if advisories:
-        vulnerabilities: list[str] = [
-            ref
-            for ref, constraints in advisories
-            if semver_match(version, constraints)
-        ]
+    :return: The advisory references, by version
+    """
+    unique_versions: tuple[str, ...] = tuple(dict.fromkeys(versions))
+    advisories = await get_remote_advisories(product.lower(), platform.value)
 
-        return vulnerabilities
+    if advisories:
+        return dict(
+            zip(
+                unique_versions,
+                _match_advisories(
+                    tuple(version.lower() for version in unique_versions),
+                    advisories,
+                ),
+            )
+        )
 
-    CTX.value_to_add.add(f"{platform.name} - {product}")
-    return []
+    CTX.value_to_add.add(f"{platform.name} - {product.lower()}")
+    return {version: [] for version in unique_versions}
@@ -0,0 +1,210 @@
+from botocore.exceptions import (
+    BotoCoreError,
+    ClientError,
+)
+from collections.abc import (
+    Iterable,
+)
+from contextlib import (
+    closing,
+    suppress,
+)
+from ctx import (
+    STATE_FOLDER,
+)
+from db_model.advisories.constants import (
+    SUPPORTED_PLATFORMS,
+)
+from functools import (
+    cache,
+)
+import os
+from s3.operations import (
+    download_advisories,
+)
+from s3.resource import (
+    get_s3_resource,
+    s3_shutdown,
+    s3_start_resource,
+)
+import sqlite3
+from tempfile import (
+    mkstemp,
+)
+import time
+from typing import (
+    Any,
+)
+from utils.logs import (
+    log_blocking,
+)
+
+# Constants
+INDEX_BUCKET: str = "skims.sca"
+INDEX_FILE_NAME: str = "advisories.sqlite"
+INDEX_FOLDER: str = os.path.join(STATE_FOLDER, "sca")
+INDEX_PATH: str = os.path.join(INDEX_FOLDER, INDEX_FILE_NAME)
+INDEX_TTL: int = 86400
+
+Database = dict[str, dict[str, dict[str, str]]]
+
+
+def build_index(
+    advisories: Database,
+    patch_advisories: Database,
+    path: str = INDEX_PATH,
+) -> None:
+    """Compile the advisories of every platform into a SQLite file.
+
+    Patch advisories take precedence over regular ones, GMS advisories are
+    excluded. The file is written aside and then renamed, so processes
+    reading the previous index are never affected.
+    """
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    file_descriptor, tmp_path = mkstemp(dir=os.path.dirname(path))
+    os.close(file_descriptor)
+    try:
+        with closing(sqlite3.connect(tmp_path)) as connection:
+            connection.execute(
+                """
+                CREATE TABLE advisories (
+                    platform TEXT NOT NULL,
+                    package TEXT NOT NULL,
+                    advisory TEXT NOT NULL,
+                    vulnerable_version TEXT NOT NULL,
+                    PRIMARY KEY (platform, package, advisory)
+                ) WITHOUT ROWID
+                """
+            )
+            for database in (advisories, patch_advisories):
+                connection.executemany(
+                    "INSERT OR REPLACE INTO advisories VALUES (?, ?, ?, ?)",
+                    (
+                        (platform, package, advisory, vulnerable_version)
+                        for platform, packages in database.items()
+                        for package, package_ads in packages.items()
+                        for advisory, vulnerable_version in package_ads.items()
+                        if not advisory.startswith("GMS")
+                    ),
+                )
+            connection.commit()
+        os.replace(tmp_path, path)
+    finally:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+
+
+def is_index_fresh(path: str = INDEX_PATH) -> bool:
+    with suppress(FileNotFoundError):
+        return time.time() - os.path.getmtime(path) < INDEX_TTL
+    return False
+
+
+async def _download_platforms() -> tuple[Database, Database]:
+    # A failed download comes back empty, it must not look like a platform
+    # without advisories
+    advisories, patch_advisories = await download_advisories(
+        needed_platforms=SUPPORTED_PLATFORMS
+    )
+    if missing := [
+        platform
+        for platform in SUPPORTED_PLATFORMS
+        if not advisories.get(platform)
+    ]:
+        raise ValueError(f"No advisories for {', '.join(missing)}")
+    return advisories, patch_advisories
+
+
+async def _download_index(path: str) -> bool:
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    file_descriptor, tmp_path = mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(file_descriptor, "wb") as handle:
+            client = await get_s3_resource()
+            await client.download_fileobj(
+                INDEX_BUCKET, INDEX_FILE_NAME, handle
+            )
+        os.replace(tmp_path, path)
+        return True
+    except (BotoCoreError, ClientError, OSError):
+        return False
+    finally:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+
+
+async def ensure_index(path: str = INDEX_PATH) -> bool:
+    """Make sure a fresh advisories index exists on `path`.
+
+    It downloads the index compiled by the scheduler and, if it is not
+    available, compiles it locally from the per-platform advisories.
+    The current index is kept as is if any platform fails to download.
+    Must run once in the parent process, before spawning the workers.
+    """
+    if is_index_fresh(path):
+        return True
+
+    await s3_start_resource(is_public=True)
+    try:
+        if await _download_index(path):
+            return True
+        advisories, patch_advisories = await _download_platforms()
+        build_index(advisories, patch_advisories, path)
+        return True
+    except (BotoCoreError, ClientError, OSError, ValueError) as exc:
+        log_blocking("warning", "Couldn't build the advisories index: %s", exc)
+        return False
+    finally:
+        await s3_shutdown()
+
+
+async def refresh_index() -> None:
+    """Compile the advisories stored on S3 and upload the index."""
+    advisories, patch_advisories = await _download_platforms()
+    file_descriptor, tmp_path = mkstemp(suffix=".sqlite")
+    os.close(file_descriptor)
+    try:
+        build_index(advisories, patch_advisories, tmp_path)
+        client = await get_s3_resource()
+        with open(tmp_path, "rb") as handle:
+            await client.upload_fileobj(handle, INDEX_BUCKET, INDEX_FILE_NAME)
+    finally:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+
+
+@cache
+def _get_connection(path: str) -> sqlite3.Connection | None:
+    # One read-only connection per process, shared by every query
+    if not os.path.exists(path):
+        return None
+    return sqlite3.connect(
+        f"file:{path}?mode=ro&immutable=1",
+        check_same_thread=False,
+        uri=True,
+    )
+
+
+def get_advisories_from_index(
+    pkg_name: str,
+    platform: str,
+    path: str = INDEX_PATH,
+) -> Iterable[tuple[str, str]] | None:
+    if (connection := _get_connection(path)) is None:
+        return None
+
+    try:
+        rows: list[Any] = connection.execute(
+            """
+            SELECT advisory, vulnerable_version FROM advisories
+            WHERE platform = ? AND package = ?
+            """,
+            (platform, pkg_name),
+        ).fetchall()
+    except sqlite3.Error as exc:
+        log_blocking("error", "Couldn't query the advisories index: %s", exc)
+        return None
+
+    return [
+        (advisory, vulnerable_version) for advisory, vulnerable_version in rows
+    ]
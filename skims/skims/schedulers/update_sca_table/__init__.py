@@ -28,6 +28,9 @@ from s3.resource import (
     s3_shutdown,
     s3_start_resource,
 )
+from sca.index import (
+    refresh_index,
+)
 from tempfile import (
     TemporaryDirectory,
 )
@@ -94,6 +97,8 @@ async def update_sca() -> None:
     log_blocking("info", "Adding advisories to skims.sca bucket")
     await s3_start_resource()
     await upload_advisories(to_storage)
+    log_blocking("info", "Compiling the advisories index")
+    await refresh_index()
     await s3_shutdown()
 
 
@@ -28,6 +28,10 @@ from utils.graph import (
     export_graph_as_json,
     import_graph_from_json,
 )
+from utils.graph.compact import (
+    CompactGraph,
+    get_compact_state,
+)
 
 
 def _dump_graph(instance: graph_model.Graph) -> safe_pickle.Serialized:
@@ -39,6 +43,14 @@ def _load_graph(graph_as_json: Any) -> graph_model.Graph:
     return import_graph_from_json(graph_as_json)
 
 
+def _dump_compact_graph(instance: CompactGraph) -> safe_pickle.Serialized:
+    return safe_pickle.serialize(instance, get_compact_state(instance))
+
+
+def _load_compact_graph(state: Any) -> CompactGraph:
+    return CompactGraph(state)
+
+
 def _dump_lark_meta(meta: LarkMeta) -> safe_pickle.Serialized:
     return safe_pickle.serialize(
         meta,
@@ -129,6 +141,7 @@ def _side_effects() -> None:
 
     for factory, dumper, loader in (
         (graph_model.Graph, _dump_graph, _load_graph),
+        (CompactGraph, _dump_compact_graph, _load_compact_graph),
         (LarkMeta, _dump_lark_meta, _load_lark_meta),
         (LarkTree, _dump_lark_tree, _load_lark_tree),
         (ListToken, safe_pickle.tuple_dump, safe_pickle.list_load),
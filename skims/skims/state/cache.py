@@ -0,0 +1,124 @@
+from collections.abc import (
+    Callable,
+)
+from contextlib import (
+    suppress,
+)
+from ctx import (
+    STATE_FOLDER,
+)
+import os
+from os.path import (
+    join,
+)
+from serialization import (
+    dump as py_dumps,
+)
+from state.common import (
+    get_obj_id,
+    read_blob,
+)
+from tempfile import (
+    mkstemp,
+)
+from typing import (
+    Any,
+    NamedTuple,
+)
+
+# Constants
+CACHE: str = join(STATE_FOLDER, "cache")
+GIBIBYTE: int = 1073741824
+EVICT_EVERY: int = 64
+EVICT_TARGET_RATIO: float = 0.8
+CacheGetFunction = Callable[[Any], Any | None]
+CacheStoreFunction = Callable[[Any, Any], None]
+
+
+class CacheStore(NamedTuple):
+    get: CacheGetFunction
+    store: CacheStoreFunction
+
+
+def _evict(folder: str, max_size: int) -> None:
+    """Remove the least recently used entries until `folder` fits.
+
+    Entries are touched on every hit, so their modification time
+    works as the last access time.
+    """
+    entries: list[tuple[float, int, str]] = []
+    with os.scandir(folder) as iterator:
+        for entry in iterator:
+            with suppress(OSError):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total_size: int = sum(size for _, size, _ in entries)
+    if total_size <= max_size:
+        return
+
+    target_size: int = int(max_size * EVICT_TARGET_RATIO)
+    for _, size, path in sorted(entries):
+        if total_size <= target_size:
+            break
+        with suppress(OSError):
+            os.unlink(path)
+            total_size -= size
+
+
+def get_cache_store(
+    namespace: str,
+    max_size: int = 2 * GIBIBYTE,
+) -> CacheStore:
+    """Create a persistent, size-bounded store of Python objects on-disk.
+
+    Unlike the ephemeral store, entries survive across executions and
+    are evicted in least-recently-used order once `max_size` bytes are
+    exceeded.
+
+    :param namespace: Sub-folder of the cache to store data into
+    :type namespace: str
+    :param max_size: Maximum size in bytes of the namespace
+    :type max_size: int
+    :return: An object with get/store methods
+    :rtype: CacheStore
+    """
+    folder: str = join(CACHE, namespace)
+    os.makedirs(folder, mode=0o700, exist_ok=True)
+    stores_count: list[int] = [0]
+
+    def _location(key: Any) -> str:
+        return join(folder, get_obj_id(key).hex())
+
+    def get(key: Any) -> Any | None:
+        location: str = _location(key)
+        with suppress(Exception):
+            value = read_blob(location)
+            os.utime(location)
+            return value
+
+        return None
+
+    def store(key: Any, value: Any) -> None:
+        # Write to a temporary file and rename it, so concurrent readers
+        # in other processes never see a partially written entry
+        file_descriptor, tmp_location = mkstemp(dir=folder, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as obj_store:
+                obj_store.write(py_dumps(value))
+            os.replace(tmp_location, _location(key))
+        except BaseException as exc:
+            # Neither errors nor interruptions may leave the file behind
+            with suppress(OSError):
+                os.unlink(tmp_location)
+            if isinstance(exc, OSError):
+                return
+            raise
+
+        stores_count[0] += 1
+        if stores_count[0] % EVICT_EVERY == 0:
+            _evict(folder, max_size)
+
+    _evict(folder, max_size)
+
+    return CacheStore(get=get, store=store)
@@ -6,9 +6,6 @@ from collections.abc import (
     Callable,
     Iterator,
 )
-from concurrent.futures.thread import (
-    ThreadPoolExecutor,
-)
 from ctx import (
     STATE_FOLDER,
 )
@@ -16,29 +13,35 @@ from model.core_model import (
     Vulnerability,
 )
 from os import (
-    cpu_count,
     makedirs,
 )
 from os.path import (
+    exists,
     join,
 )
+from serialization import (
+    dump as py_dumps,
+    load as py_loads,
+)
 from shutil import (
     rmtree,
 )
-from state.common import (
-    read_blob,
-    store_object,
-)
+import struct
 from tempfile import (
     mkdtemp,
 )
+from threading import (
+    Lock,
+)
 from typing import (
     Any,
     NamedTuple,
 )
+from utils.crypto import (
+    get_hash,
+)
 from utils.fs import (
     mkdir,
-    recurse_dir,
 )
 from uuid import (
     uuid4 as uuid,
@@ -46,6 +49,7 @@ from uuid import (
 
 # Constants
 EPHEMERAL: str = join(STATE_FOLDER, "ephemeral", uuid().hex)
+SEGMENT_HEADER: struct.Struct = struct.Struct(">Q")
 ClearFunction = Callable[[], Awaitable[None]]
 GetAFewFunction = Callable[[int], Awaitable[tuple[Any, ...]]]
 StoreFunction = Callable[[Any], None]
@@ -65,26 +69,77 @@ class EphemeralStore(NamedTuple):
     has_errors: bool | None = False
 
 
+def _write_streams(segment: str, obj_streams: tuple[bytes, ...]) -> None:
+    with open(segment, "ab") as obj_store:
+        obj_store.write(
+            b"".join(
+                SEGMENT_HEADER.pack(len(obj_stream)) + obj_stream
+                for obj_stream in obj_streams
+            )
+        )
+
+
+def write_to_segment(segment: str, *objs: Any) -> None:
+    """Append `objs` to `segment` as length-prefixed blobs, in one write."""
+    _write_streams(segment, tuple(map(py_dumps, objs)))
+
+
+def iterate_segment(segment: str) -> Iterator[Any]:
+    if not exists(segment):
+        return
+
+    with open(segment, "rb") as obj_store:
+        # A truncated entry is still being appended, or its writer died,
+        # either way it ends the stream
+        while (
+            len(header := obj_store.read(SEGMENT_HEADER.size))
+            == SEGMENT_HEADER.size
+        ):
+            (size,) = SEGMENT_HEADER.unpack(header)
+            obj_stream: bytes = obj_store.read(size)
+            if len(obj_stream) < size:
+                break
+            yield py_loads(obj_stream)
+
+
 def get_ephemeral_store() -> EphemeralStore:
     """Create an ephemeral store of Python objects on-disk.
 
+    Objects are appended to a single segment file as length-prefixed
+    blobs. Storing an object whose digest was already stored is a no-op.
+
     :return: An object with read/write methods
     :rtype: EphemeralStore
     """
     folder: str = mkdtemp(dir=EPHEMERAL)
+    segment: str = join(folder, "segment")
+    digests: set[Any] = set()
+    lock = Lock()
 
     async def clear() -> None:
+        with lock:
+            digests.clear()
         await in_thread(rmtree, folder)
 
     def length() -> int:
-        return len(recurse_dir(folder))
+        return len(digests)
 
     def store(obj: Any) -> None:
-        store_object(folder, obj, obj)
+        # Objects are identified by their whole content, like the files of
+        # the cache, so results of different methods are never merged
+        obj_stream: bytes = py_dumps(obj)
+        digest: bytes = get_hash(obj_stream)
+        if digest in digests:
+            return
+
+        with lock:
+            if digest in digests:
+                return
+            _write_streams(segment, (obj_stream,))
+            digests.add(digest)
 
     def iterate() -> Iterator[Any]:
-        with ThreadPoolExecutor(max_workers=cpu_count()) as worker:
-            yield from worker.map(read_blob, recurse_dir(folder))
+        return iterate_segment(segment)
 
     async def get_a_few(count: int) -> tuple[Any, ...]:
         results = []
@@ -68,6 +68,7 @@ from utils import (
     logs,
 )
 
+EVALUATION_RESULTS: str = "evaluation_results"
 EVALUATORS: dict[str, Evaluator] = {
     "Argument": argument.evaluate,
     "ArgumentList": argument_list.evaluate,
@@ -156,12 +157,12 @@ def evaluate(
         return None
 
 
-def get_node_evaluation_results(
+def _find_evaluation_result(
     method: MethodsEnum,
     graph: Graph,
     n_id: NId,
     triggers_goal: set[str],
-    danger_goal: bool = True,
+    danger_goal: bool,
 ) -> bool:
     for path in get_backward_paths(graph, n_id):
         evaluation = evaluate(method, graph, path, n_id)
@@ -172,3 +173,22 @@ def get_node_evaluation_results(
         ):
             return True
     return False
+
+
+def get_node_evaluation_results(
+    method: MethodsEnum,
+    graph: Graph,
+    n_id: NId,
+    triggers_goal: set[str],
+    danger_goal: bool = True,
+) -> bool:
+    # Results only depend on the shard graph, so they are memoized on it
+    # and shared by every query asking the same question about the node
+    results: dict[tuple[MethodsEnum, NId, frozenset[str], bool], bool]
+    results = graph.graph.setdefault(EVALUATION_RESULTS, {})
+    key = (method, n_id, frozenset(triggers_goal), danger_goal)
+    if key not in results:
+        results[key] = _find_evaluation_result(
+            method, graph, n_id, triggers_goal, danger_goal
+        )
+    return results[key]
@@ -12,6 +12,13 @@ from symbolic_eval.types import (
 from utils import (
     graph as g,
 )
+from utils.logs import (
+    log_blocking,
+)
+
+# Constants
+CFG_PARENTS: str = "cfg_parents"
+MAX_BACKWARD_PATHS: int = 4096
 
 
 def iter_ast(graph: Graph, n_id: NId, strict: bool = False) -> Iterator[NId]:
@@ -24,16 +31,46 @@ def iter_ast(graph: Graph, n_id: NId, strict: bool = False) -> Iterator[NId]:
         yield from iter_ast(graph, c_id)
 
 
-def iter_backward_paths(graph: Graph, cfg_n_id: NId) -> Iterator[Path]:
-    path = [cfg_n_id]
-    parents = g.pred_cfg(graph, cfg_n_id)
+def _get_cfg_parents(graph: Graph, cfg_n_id: NId) -> tuple[NId, ...]:
+    # The CFG does not change once built, memoize it on the shard graph
+    parents: dict[NId, tuple[NId, ...]] = graph.graph.setdefault(
+        CFG_PARENTS, {}
+    )
+    if cfg_n_id not in parents:
+        parents[cfg_n_id] = g.pred_cfg(graph, cfg_n_id)
+    return parents[cfg_n_id]
+
+
+def iter_backward_paths(
+    graph: Graph,
+    cfg_n_id: NId,
+    max_paths: int | None = MAX_BACKWARD_PATHS,
+) -> Iterator[Path]:
+    """Yield every CFG path from `cfg_n_id` back to the method entry.
+
+    Paths are yielded depth first, following the parents in order.
+    Branch-heavy methods have exponentially many paths, so at most
+    `max_paths` are yielded, None means no limit.
+    """
+    stack: list[Path] = [[cfg_n_id]]
+    yielded: int = 0
+    while stack:
+        path = stack.pop()
+        if parents := _get_cfg_parents(graph, path[-1]):
+            stack.extend(path + [parent] for parent in reversed(parents))
+            continue
 
-    if not parents:
         yield path
-
-    for parent in parents:
-        for sub_path in iter_backward_paths(graph, parent):
-            yield path + sub_path
+        yielded += 1
+        if max_paths is not None and yielded >= max_paths:
+            log_blocking(
+                "warning",
+                "Backward paths of node %s in %s truncated to %s",
+                cfg_n_id,
+                graph.graph.get(g.PATH),
+                max_paths,
+            )
+            return
 
 
 def get_backward_paths(graph: Graph, n_id: NId) -> Iterator[Path]:
@@ -99,14 +136,11 @@ def get_value_member_access(
     graph: Graph, expression: str, member: str
 ) -> str | None:
     possible_types = {"Literal"}
-    for nid in g.filter_nodes(
+    for nid in g.matching_nodes(
         graph,
-        nodes=graph.nodes,
-        predicate=g.pred_has_labels(
-            label_type="MemberAccess",
-            expression=expression,
-            member=member,
-        ),
+        label_type="MemberAccess",
+        expression=expression,
+        member=member,
     ):
         if (
             (pred := g.pred_ast(graph, nid)[0])
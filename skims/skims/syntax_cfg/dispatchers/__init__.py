@@ -10,6 +10,7 @@ from syntax_cfg.dispatchers import (
     variable_declaration_node,
 )
 from syntax_cfg.types import (
+    CfgBuilders,
     Dispatcher,
     Dispatchers,
 )
@@ -139,3 +140,16 @@ DISPATCHERS: Dispatchers = (
         cfg_builder=end_node.build,
     ),
 )
+
+
+def _get_cfg_builders(dispatchers: Dispatchers) -> CfgBuilders:
+    # The first dispatcher listing a node type wins, as in a linear scan
+    cfg_builders: CfgBuilders = {}
+    for dispatcher in reversed(dispatchers):
+        cfg_builders.update(
+            dict.fromkeys(dispatcher.applicable_types, dispatcher.cfg_builder)
+        )
+    return cfg_builders
+
+
+CFG_BUILDERS: CfgBuilders = _get_cfg_builders(DISPATCHERS)
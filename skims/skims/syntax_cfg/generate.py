@@ -3,7 +3,7 @@ from model.graph_model import (
     NId,
 )
 from syntax_cfg.dispatchers import (
-    DISPATCHERS,
+    CFG_BUILDERS,
 )
 from syntax_cfg.types import (
     MissingCfgBuilder,
@@ -20,9 +20,8 @@ from utils import (
 def generic(args: SyntaxCfgArgs) -> NId:
     node_type = args.graph.nodes[args.n_id]["label_type"]
 
-    for dispatcher in DISPATCHERS:
-        if node_type in dispatcher.applicable_types:
-            return dispatcher.cfg_builder(args)
+    if cfg_builder := CFG_BUILDERS.get(node_type):
+        return cfg_builder(args)
 
     raise MissingCfgBuilder(f"Missing cfg builder for {node_type}")
 
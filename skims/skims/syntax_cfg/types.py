@@ -38,6 +38,8 @@ class Dispatcher(NamedTuple):
 
 Dispatchers = tuple[Dispatcher, ...]
 
+CfgBuilders = dict[str, CfgBuilder]
+
 
 class MissingCfgBuilder(Exception):
     pass
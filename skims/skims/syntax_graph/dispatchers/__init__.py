@@ -39,6 +39,7 @@ from syntax_graph.dispatchers.yaml import (
 )
 from syntax_graph.types import (
     Dispatchers,
+    SyntaxReaders,
 )
 
 DISPATCHERS_BY_LANG: dict[GraphLanguage, Dispatchers] = {
@@ -55,3 +56,21 @@ DISPATCHERS_BY_LANG: dict[GraphLanguage, Dispatchers] = {
     GraphLanguage.TYPESCRIPT: TYPESCRIPT_DISPATCHERS,
     GraphLanguage.YAML: YAML_DISPATCHERS,
 }
+
+
+def _get_syntax_readers(dispatchers: Dispatchers) -> SyntaxReaders:
+    # The first dispatcher listing a node type wins, as in a linear scan
+    syntax_readers: SyntaxReaders = {}
+    for dispatcher in reversed(dispatchers):
+        syntax_readers.update(
+            dict.fromkeys(
+                dispatcher.applicable_types, dispatcher.syntax_reader
+            )
+        )
+    return syntax_readers
+
+
+SYNTAX_READERS_BY_LANG: dict[GraphLanguage, SyntaxReaders] = {
+    language: _get_syntax_readers(dispatchers)
+    for language, dispatchers in DISPATCHERS_BY_LANG.items()
+}
@@ -3,7 +3,7 @@ from model.graph_model import (
     GraphShardMetadataLanguage as GraphLanguage,
 )
 from syntax_graph.dispatchers import (
-    DISPATCHERS_BY_LANG,
+    SYNTAX_READERS_BY_LANG,
 )
 from syntax_graph.syntax_readers.common.missing_node import (
     reader as missing_node_reader,
@@ -24,10 +24,9 @@ from utils.logs import (
 def generic(args: SyntaxGraphArgs) -> str:
     node_type = args.ast_graph.nodes[args.n_id]["label_type"]
 
-    if lang_dispatchers := DISPATCHERS_BY_LANG.get(args.language):
-        for dispatcher in lang_dispatchers:
-            if node_type in dispatcher.applicable_types:
-                return dispatcher.syntax_reader(args)
+    if lang_readers := SYNTAX_READERS_BY_LANG.get(args.language):
+        if syntax_reader := lang_readers.get(node_type):
+            return syntax_reader(args)
 
     log_blocking(
         "debug",
@@ -43,6 +43,8 @@ class Dispatcher(NamedTuple):
 
 Dispatchers = tuple[Dispatcher, ...]
 
+SyntaxReaders = dict[str, SyntaxReader]
+
 
 class MissingSyntaxReader(Exception):
     pass
@@ -0,0 +1,68 @@
+from collections.abc import (
+    Iterator,
+)
+from contextlib import (
+    contextmanager,
+)
+from functools import (
+    cache,
+)
+import os
+import psutil
+import signal
+import time
+from typing import (
+    Any,
+)
+
+# Constants
+# Seconds between two checks of the budget of the running block
+CHECK_INTERVAL: float = 0.1
+
+
+class BudgetExceeded(BaseException):
+    """The block went over its time or memory budget.
+
+    It does not derive from Exception, so the broad `except Exception`
+    clauses of the code under budget cannot swallow it.
+    """
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+@cache
+def _get_process(pid: int) -> psutil.Process:
+    return psutil.Process(pid)
+
+
+@contextmanager
+def budget(seconds: float, rss_growth: int) -> Iterator[None]:
+    """Interrupt the block after `seconds`, or once it grows the RSS of this
+    process by more than `rss_growth` bytes.
+
+    Checks run on SIGALRM, so this only works in the main thread, and a
+    long call into C is interrupted only after it returns.
+    """
+    process = _get_process(os.getpid())
+    deadline = time.monotonic() + seconds
+    max_rss = process.memory_info().rss + rss_growth
+
+    def _check(*_: Any) -> None:
+        if time.monotonic() >= deadline:
+            raise BudgetExceeded("timeout")
+        if process.memory_info().rss > max_rss:
+            raise BudgetExceeded("memory")
+
+    previous = signal.signal(signal.SIGALRM, _check)
+    signal.setitimer(
+        signal.ITIMER_REAL,
+        min(seconds, CHECK_INTERVAL),
+        CHECK_INTERVAL,
+    )
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
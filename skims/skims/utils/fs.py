@@ -4,34 +4,20 @@ from collections.abc import (
     Callable,
     Iterator,
 )
-from concurrent.futures import (
-    ThreadPoolExecutor,
-)
 from fnmatch import (
-    fnmatch as matches_glob,
+    translate as translate_glob,
 )
 from glob import (
     iglob as glob,
 )
-from itertools import (
-    chain,
-)
+import hashlib
 from model.graph_model import (
     GraphShardMetadataLanguage,
 )
-from more_itertools import (
-    collapse,
-)
-from multiprocessing import (
-    cpu_count,
-)
-from operator import (
-    attrgetter,
-    methodcaller,
-)
 import os
-from pyparsing import (
-    Regex,
+import re
+from typing import (
+    NamedTuple,
 )
 from utils.logs import (
     log_blocking,
@@ -63,12 +49,73 @@ language_extensions_map: dict[GraphShardMetadataLanguage, list[str]] = {
 }
 
 
+LANGUAGE_BY_EXTENSION: dict[str, GraphShardMetadataLanguage] = {
+    extension: language
+    for language, extensions in language_extensions_map.items()
+    for extension in extensions
+}
+# Vendored files of web projects, matched against "/" + path
+NON_UPGRADABLE_GLOBS: tuple[str, ...] = (
+    "*/Assets*/vendor/*",
+    "*/Assets*/lib/*",
+    "*/Assets*/js/*",
+    "*/Content*/jquery*",
+    "*/GoogleMapping*.js",
+    "*/Scripts*/bootstrap*",
+    "*/Scripts*/modernizr*",
+    "*/Scripts*/jquery*",
+    "*/Scripts*/popper*",
+    "*/Scripts*/vue*",
+    "*/wwwroot/lib*",
+)
+NON_UPGRADABLE_PATTERN: re.Pattern[str] = re.compile(
+    "|".join(map(translate_glob, NON_UPGRADABLE_GLOBS))
+)
+DEPENDENCY_CODE_PATTERN: re.Pattern[str] = re.compile(
+    "|".join(
+        (
+            r"jQuery(.)*[Cc]opyright(.)*[Ll]icen",
+            r"[Cc]opyright(.)*[Ll]icen(.)*[Jj][Qq]uery",
+            r"[Aa]ngular[Jj][Ss](.)*[Gg]oogle(.)*[Ll]icen",
+        )
+    )
+)
+NON_VERIFIABLE_EXTENSIONS: set[str] = {
+    "aar",
+    "apk",
+    "bin",
+    "class",
+    "dll",
+    "DS_Store",
+    "exec",
+    "hprof",
+    "jar",
+    "jasper",
+    "pdb",
+    "pyc",
+    "exe",
+}
+NON_VERIFIABLE_NAMES: set[tuple[str, str]] = {
+    ("debug", "log"),
+    (".classpath", ""),
+    (".project", ""),
+    (".vscode", ""),
+}
+NON_VERIFIABLE_SUFFIXES: tuple[str, ...] = (
+    ".cs.bak",
+    ".csproj.bak",
+    ".min.js",
+)
+NON_VERIFIABLE_FOLDERS: tuple[str, ...] = (
+    "/.serverless_plugins/",
+    "/.settings/",
+)
+
+
 def decide_language(path: str) -> GraphShardMetadataLanguage:
-    for language, extensions in language_extensions_map.items():
-        for extension in extensions:
-            if path.endswith(extension):
-                return language
-    return GraphShardMetadataLanguage.NOT_SUPPORTED
+    return LANGUAGE_BY_EXTENSION.get(
+        path[path.rfind(".") :], GraphShardMetadataLanguage.NOT_SUPPORTED
+    )
 
 
 def generate_file_content(
@@ -195,151 +242,81 @@ def safe_sync_get_file_raw_content(
         return None
 
 
+def get_source_digest(*paths: str) -> str:
+    """Digest the Python source code of the given files and packages.
+
+    Packages are walked recursively, so any change to a module under
+    them produces a different digest.
+    """
+    digestor = hashlib.sha256()
+    for path in paths:
+        if os.path.isfile(path):
+            files = [path]
+        else:
+            files = sorted(
+                os.path.join(root, name)
+                for root, _, names in os.walk(path)
+                for name in names
+                if name.endswith(".py")
+            )
+        for file in files:
+            digestor.update(os.path.relpath(file, path).encode())
+            with open(file, "rb") as handle:
+                digestor.update(handle.read())
+    return digestor.hexdigest()
+
+
 def check_dependency_code(path: str) -> bool:
     language: GraphShardMetadataLanguage = decide_language(path)
-
-    if language == GraphShardMetadataLanguage.JAVASCRIPT:
-        regex_exp = [
-            Regex(r"jQuery(.)*[Cc]opyright(.)*[Ll]icen"),
-            Regex(r"[Cc]opyright(.)*[Ll]icen(.)*[Jj][Qq]uery"),
-            Regex(r"[Aa]ngular[Jj][Ss](.)*[Gg]oogle(.)*[Ll]icen"),
-        ]
-    else:
+    if language != GraphShardMetadataLanguage.JAVASCRIPT:
         return False
 
     file_content = generate_file_content(path, size=200)
-    raw_content = file_content()
-    content = raw_content.replace("\n", " ")
-
-    for regex in regex_exp:
-        for _ in regex.scanString(content):
-            return True
-    return False
-
+    content = file_content().replace("\n", " ")
+    return DEPENDENCY_CODE_PATTERN.search(content) is not None
 
-def get_non_upgradable_paths(paths: set[str]) -> set[str]:
-    nu_paths: set[str] = set()
 
+def _get_intellisense_pattern(paths: set[str]) -> re.Pattern[str] | None:
     intellisense_refs = {
         os.path.dirname(path)
         for path in paths
         if path.endswith("Scripts/_references.js")
     }
+    if not intellisense_refs:
+        return None
+    return re.compile("|".join(map(re.escape, sorted(intellisense_refs))))
 
-    for path in paths:
-        if (
-            any(
-                path.startswith(intellisense_ref)
-                for intellisense_ref in intellisense_refs
-            )
-            or any(
-                matches_glob(f"/{path}", glob)
-                for glob in (
-                    "*/Assets*/vendor/*",
-                    "*/Assets*/lib/*",
-                    "*/Assets*/js/*",
-                    "*/Content*/jquery*",
-                    "*/GoogleMapping*.js",
-                    "*/Scripts*/bootstrap*",
-                    "*/Scripts*/modernizr*",
-                    "*/Scripts*/jquery*",
-                    "*/Scripts*/popper*",
-                    "*/Scripts*/vue*",
-                    "*/wwwroot/lib*",
-                )
-            )
-            or check_dependency_code(path)
-        ):
-            nu_paths.add(path)
-
-    return nu_paths
 
+def _is_non_upgradable(
+    path: str, intellisense_pattern: re.Pattern[str] | None
+) -> bool:
+    return (
+        (
+            intellisense_pattern is not None
+            and bool(intellisense_pattern.match(path))
+        )
+        or NON_UPGRADABLE_PATTERN.match(f"/{path}") is not None
+        or check_dependency_code(path)
+    )
 
-def get_non_verifiable_paths(paths: set[str]) -> set[str]:
-    nv_paths: set[str] = set()
 
-    for path in paths:
-        _, file_info = os.path.split(path)
-        file_name, file_extension = os.path.splitext(file_info)
-        file_extension = file_extension[1:]
-
-        if (
-            file_extension
-            in {
-                "aar",
-                "apk",
-                "bin",
-                "class",
-                "dll",
-                "DS_Store",
-                "exec",
-                "hprof",
-                "jar",
-                "jasper",
-                "pdb",
-                "pyc",
-                "exe",
-            }
-            or (file_name, file_extension)
-            in {
-                ("debug", "log"),
-                ("org.eclipse.buildship.core.prefs"),
-                (".classpath", ""),
-                (".project", ""),
-                (".vscode", ""),
-            }
-            or any(
-                path.endswith(end)
-                for end in (
-                    ".cs.bak",
-                    ".csproj.bak",
-                    ".min.js",
-                )
-            )
-            or any(
-                string in path
-                for string in (
-                    "/.serverless_plugins/",
-                    "/.settings/",
-                )
-            )
-        ):
-            nv_paths.add(path)
+def _is_non_verifiable(path: str) -> bool:
+    _, file_info = os.path.split(path)
+    file_name, file_extension = os.path.splitext(file_info)
+    file_extension = file_extension[1:]
 
-    return nv_paths
+    return (
+        file_extension in NON_VERIFIABLE_EXTENSIONS
+        or (file_name, file_extension) in NON_VERIFIABLE_NAMES
+        or path.endswith(NON_VERIFIABLE_SUFFIXES)
+        or any(folder in path for folder in NON_VERIFIABLE_FOLDERS)
+    )
 
 
 def mkdir(name: str, mode: int = 0o777, exist_ok: bool = False) -> None:
     return os.makedirs(name, mode=mode, exist_ok=exist_ok)
 
 
-def recurse_dir(path: str) -> tuple[str, ...]:
-    try:
-        scanner = tuple(os.scandir(path))
-    except FileNotFoundError:
-        scanner = tuple()
-
-    dirs = tuple(
-        map(attrgetter("path"), filter(methodcaller("is_dir"), scanner))
-    )
-    files = tuple(
-        map(attrgetter("path"), filter(methodcaller("is_file"), scanner))
-    )
-    with ThreadPoolExecutor(max_workers=cpu_count()) as _worker:
-        tree = tuple(
-            chain(
-                files,
-                _worker.map(recurse_dir, dirs),
-            )
-        )
-
-    return tree
-
-
-def recurse_path(path: str) -> tuple[str, ...]:
-    return (path,) if os.path.isfile(path) else recurse_dir(path)
-
-
 def iter_glob_path(path: str) -> Iterator[str]:
     if path.startswith("glob(") and path.endswith(")"):
         yield from glob(path[5:-1], recursive=True)
@@ -347,54 +324,166 @@ def iter_glob_path(path: str) -> Iterator[str]:
         yield path
 
 
-def list_paths(include: tuple[str, ...], exclude: tuple[str, ...]) -> set[str]:
-    def evaluate(wkr: ThreadPoolExecutor, paths: tuple[str, ...]) -> set[str]:
-        return {
-            os.path.normpath(path)
-            for path in collapse(
-                wkr.map(
-                    recurse_path,
-                    chain.from_iterable(map(iter_glob_path, paths)),
-                ),
-                base_type=str,
-            )
-        }
+def _translate_glob_part(part: str) -> str:
+    if not re.search(r"[*?[]", part):
+        return re.escape(part)
+
+    # Like glob, wildcards match non empty names and skip the names
+    # starting with a dot unless the pattern does too
+    regex = "" if part.startswith(".") else r"(?=[^./])"
+    index = 0
+    while index < len(part):
+        char = part[index]
+        index += 1
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "[" and (end := part.find("]", index + 1)) != -1:
+            chars = part[index:end].replace("\\", "\\\\")
+            if chars.startswith("!"):
+                chars = "^" + chars[1:]
+            elif chars.startswith("^"):
+                chars = "\\" + chars
+            regex += f"[{chars}]"
+            index = end + 1
+        else:
+            regex += re.escape(char)
+    return regex
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a recursive glob into a regex over normalized paths.
+
+    The regex is matched against folders followed by a "/" and against
+    files as they are. Like glob, every part but the last one consumes a
+    folder and its separator, "**" consumes any number of folders, and a
+    trailing "**" also matches the files below them.
+    """
+    any_folders: str = r"(?:(?!\.)[^/]+/)*"
+    *parts, last = os.path.normpath(pattern).split("/")
+    regex: str = "".join(
+        any_folders if part == "**" else _translate_glob_part(part) + "/"
+        for part in parts
+    )
+    only_folders: bool = pattern.endswith("/")
+    if last == "**":
+        return (
+            regex + any_folders + ("" if only_folders else r"(?:(?!\.)[^/]+)?")
+        )
+    return regex + _translate_glob_part(last) + ("/" if only_folders else "/?")
+
+
+class PathFilter(NamedTuple):
+    # Excluded paths, matched as they are or as any of their parents
+    paths: set[str]
+    # Every excluded glob compiled into a single alternation
+    pattern: re.Pattern[str] | None
+
+    def excludes(self, path: str, is_folder: bool) -> bool:
+        # Globs never expand to the current folder itself
+        return path in self.paths or (
+            self.pattern is not None
+            and path != os.curdir
+            and self.pattern.fullmatch(f"{path}/" if is_folder else path)
+            is not None
+        )
 
-    try:
+    def excludes_any_parent(self, path: str) -> bool:
+        parent = os.path.dirname(path)
+        while parent and parent != path:
+            if self.excludes(parent, is_folder=True):
+                return True
+            path, parent = parent, os.path.dirname(parent)
+        return (
+            not os.path.isabs(path)
+            and path != os.curdir
+            and os.curdir in self.paths
+        )
 
-        with ThreadPoolExecutor(max_workers=cpu_count()) as worker:
-            all_paths = evaluate(worker, include) - evaluate(worker, exclude)
-        return all_paths
 
-    except FileNotFoundError as exc:
-        raise SystemExit(f"File does not exist: {exc.filename}") from exc
+def _get_path_filter(exclude: tuple[str, ...]) -> PathFilter:
+    globs = tuple(
+        path[5:-1]
+        for path in exclude
+        if path.startswith("glob(") and path.endswith(")")
+    )
+    return PathFilter(
+        paths={
+            os.path.normpath(path)
+            for path in exclude
+            if not (path.startswith("glob(") and path.endswith(")"))
+        },
+        pattern=re.compile("|".join(map(_translate_glob, globs)))
+        if globs
+        else None,
+    )
 
 
-def split_by_upgradable(paths: set[str]) -> tuple[set[str], set[str]]:
-    try:
+def _walk(root: str, path_filter: PathFilter) -> Iterator[str]:
+    """Yield the files under `root`, pruning excluded folders on the way."""
+    root = os.path.normpath(root)
+    if path_filter.excludes(
+        root, is_folder=os.path.isdir(root)
+    ) or path_filter.excludes_any_parent(root):
+        return
+    if os.path.isfile(root):
+        yield root
+        return
+
+    stack: list[str] = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    path = os.path.normpath(os.path.join(folder, entry.name))
+                    is_folder = entry.is_dir()
+                    if path_filter.excludes(path, is_folder):
+                        continue
+                    if is_folder:
+                        stack.append(path)
+                    elif entry.is_file():
+                        yield path
+        except FileNotFoundError:
+            continue
 
-        nu_paths = get_non_upgradable_paths(paths)
-        return nu_paths, paths - nu_paths
 
+def list_paths(include: tuple[str, ...], exclude: tuple[str, ...]) -> set[str]:
+    path_filter = _get_path_filter(exclude)
+    try:
+        return {
+            path
+            for include_path in include
+            for root in iter_glob_path(include_path)
+            for path in _walk(root, path_filter)
+        }
     except FileNotFoundError as exc:
         raise SystemExit(f"File does not exist: {exc.filename}") from exc
 
 
-def split_by_verifiable(paths: set[str]) -> tuple[set[str], set[str]]:
+def classify_paths(
+    paths: set[str],
+) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """Split `paths` in one pass into ok, non-upgradable and non-verifiable.
+
+    Non-upgradable paths are never reported as non-verifiable.
+    """
+    intellisense_pattern = _get_intellisense_pattern(paths)
+    ok_paths: list[str] = []
+    nu_paths: list[str] = []
+    nv_paths: list[str] = []
     try:
-
-        nv_paths = get_non_verifiable_paths(paths)
-        return nv_paths, paths - nv_paths
-
+        for path in sorted(paths):
+            if _is_non_upgradable(path, intellisense_pattern):
+                nu_paths.append(path)
+            elif _is_non_verifiable(path):
+                nv_paths.append(path)
+            else:
+                ok_paths.append(path)
     except FileNotFoundError as exc:
         raise SystemExit(f"File does not exist: {exc.filename}") from exc
 
-
-def split_by_upgradable_and_veriable(
-    paths: set[str],
-) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
-    nu_paths, up_paths = split_by_upgradable(paths)
-    nv_paths, ok_paths = split_by_verifiable(up_paths)
     return tuple(ok_paths), tuple(nu_paths), tuple(nv_paths)
 
 
@@ -402,4 +491,4 @@ def resolve_paths(
     include: tuple[str, ...],
     exclude: tuple[str, ...],
 ) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
-    return split_by_upgradable_and_veriable(list_paths(include, exclude))
+    return classify_paths(list_paths(include, exclude))
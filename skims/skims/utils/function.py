@@ -8,15 +8,11 @@ from collections.abc import (
 from contextlib import (
     suppress,
 )
-from ctx import (
-    TOOLS_SEMVER_MATCH,
-)
 from custom_exceptions import (
     InvalidVulnerableVersion,
 )
 import functools
 import inspect
-import json
 from metaloaders.model import (
     Node,
 )
@@ -36,15 +32,15 @@ from typing import (
 from utils.env import (
     guess_environment,
 )
+from utils import (
+    semver,
+)
 from utils.logs import (
     log,
     log_blocking,
     log_to_remote,
     log_to_remote_blocking,
 )
-from utils.system import (
-    read_blocking,
-)
 
 # Constants
 RAISE = object()
@@ -120,25 +116,18 @@ def get_dict_values(dict_val: dict, *keys: str) -> Any | None:
 
 
 def semver_match(left: str, right: str, exc: bool = False) -> bool:
-    code, out, _ = read_blocking(TOOLS_SEMVER_MATCH, left, right)
-
-    if code == 0:
-        data = json.loads(out)
-        if data["success"]:
-            return data["match"]
+    try:
+        return semver.match(left, right)
+    except semver.InvalidSemver as error:
         if exc:
-            raise InvalidVulnerableVersion()
+            raise InvalidVulnerableVersion() from error
         log_blocking(
             "error",
             "Semver match %s to %s: %s",
             left,
             right,
-            data["error"],
+            error,
         )
-    elif exc:
-        raise InvalidVulnerableVersion()
-    else:
-        log_blocking("error", "Semver match %s to %s", left, right)
 
     return False
 
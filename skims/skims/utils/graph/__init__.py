@@ -18,12 +18,17 @@ from model.graph_model import (
     NAttrsPredicateFunction,
     NId,
     NIdPredicateFunction,
+    NodeIndex,
 )
 import networkx as nx
 import os
 from typing import (
     Any,
 )
+from utils.graph.compact import (
+    CompactGraph,
+    EdgeAttrs,
+)
 from utils.logs import (
     log_blocking,
 )
@@ -40,6 +45,9 @@ FALSE = dict(**CFG, label_cfg_false="cfg_false")
 MAYBE = dict(**CFG, label_cfg_maybe="cfg_maybe")
 TRUE = dict(**CFG, label_cfg_true="cfg_true")
 GRAPH_STYLE_ATTRS = {"arrowhead", "color", "fillcolor", "label", "style"}
+INDEXED_ATTRS: tuple[str, ...] = ("label_type", "name", "expression", "member")
+NODE_INDEX: str = "node_index"
+PATH: str = "path"
 ROOT_NODE: str = "1"
 
 
@@ -82,8 +90,96 @@ def filter_nodes(
     return result
 
 
+def build_node_index(graph: Graph) -> NodeIndex:
+    """Index the nodes of `graph` by the value of their `INDEXED_ATTRS`.
+
+    The index is stored in the graph attributes and used by
+    `matching_nodes`, so it must be built once the graph is complete.
+    Nodes are listed in the same order they have in `graph.nodes`.
+    """
+    index: dict[str, dict[str, list[NId]]] = {
+        attr: {} for attr in INDEXED_ATTRS
+    }
+    for n_id, n_attrs in graph.nodes.items():
+        for attr, values in index.items():
+            if isinstance(value := n_attrs.get(attr), str):
+                values.setdefault(value, []).append(n_id)
+
+    graph.graph[NODE_INDEX] = {
+        attr: {value: tuple(n_ids) for value, n_ids in values.items()}
+        for attr, values in index.items()
+    }
+    return graph.graph[NODE_INDEX]
+
+
+def _indexed_nodes(
+    graph: Graph,
+    expected_attrs: dict[str, str],
+) -> Iterable[NId] | None:
+    index: NodeIndex | None = graph.graph.get(NODE_INDEX)
+    if index is None:
+        return None
+
+    candidates: tuple[NId, ...] | None = None
+    for attr, value in expected_attrs.items():
+        if attr not in index or not isinstance(value, str):
+            continue
+        n_ids = index[attr].get(value, ())
+        if candidates is None or len(n_ids) < len(candidates):
+            candidates = n_ids
+
+    return candidates
+
+
+def get_node_types(graph: Graph) -> set[str]:
+    index: NodeIndex | None = graph.graph.get(NODE_INDEX)
+    if index is not None:
+        return set(index["label_type"])
+    return {
+        label_type
+        for _, label_type in graph.nodes(data="label_type")
+        if isinstance(label_type, str)
+    }
+
+
 def matching_nodes(graph: Graph, **expected_attrs: str) -> tuple[str, ...]:
-    return filter_nodes(graph, graph.nodes, pred_has_labels(**expected_attrs))
+    nodes = _indexed_nodes(graph, expected_attrs)
+    if isinstance(graph, CompactGraph):
+        return graph.match_labels(
+            graph.nodes if nodes is None else nodes, expected_attrs
+        )
+    return filter_nodes(
+        graph,
+        graph.nodes if nodes is None else nodes,
+        pred_has_labels(**expected_attrs),
+    )
+
+
+def sorted_succ(graph: Graph, n_id: NId) -> list[tuple[NId, EdgeAttrs]]:
+    """Successors of `n_id` with the attributes of their edge, by id."""
+    if isinstance(graph, CompactGraph):
+        return graph.sorted_succ(n_id)
+    return sorted(graph.adj[n_id].items(), key=lambda item: int(item[0]))
+
+
+def sorted_pred(graph: Graph, n_id: NId) -> list[tuple[NId, EdgeAttrs]]:
+    """Predecessors of `n_id` with the attributes of their edge, by id."""
+    if isinstance(graph, CompactGraph):
+        return graph.sorted_pred(n_id)
+    return sorted(graph.pred[n_id].items(), key=lambda item: int(item[0]))
+
+
+def _has_edge_labels(
+    e_attrs: EdgeAttrs,
+    strict: bool,
+    edge_attrs: dict[str, str],
+) -> bool:
+    if not has_labels(e_attrs, **edge_attrs):  # type: ignore
+        return False
+    if not strict:
+        return True
+    difference = set(e_attrs).difference(edge_attrs)
+    return not difference or difference == {"label_index"}
 
 
 def adj_lazy(
@@ -113,37 +209,26 @@ def adj_lazy(
 
     processed_n_ids.add(n_id)
 
-    childs: list[str] = sorted(graph.adj[n_id], key=int)
-
-    edge_keys = set(edge_attrs.keys())
+    childs = [
+        c_id
+        for c_id, e_attrs in sorted_succ(graph, n_id)
+        if _has_edge_labels(e_attrs, strict, edge_attrs)
+    ]
 
     # Append direct childs
-    for c_id in childs:
-        process = has_labels(graph[n_id][c_id], **edge_attrs)
-        if strict and process:
-            graph_edge_keys = set(graph[n_id][c_id].keys())
-            difference = graph_edge_keys.difference(edge_keys)
-            process = not bool(difference) or difference == {"label_index"}
-        if process:
-            yield c_id
+    yield from childs
 
     # Recurse into childs
     if depth < 0 or depth > 1:
         for c_id in childs:
-            process = has_labels(graph[n_id][c_id], **edge_attrs)
-            if process and strict:
-                graph_edge_keys = set(graph[n_id][c_id].keys())
-                difference = graph_edge_keys.difference(edge_keys)
-                process = not bool(difference) or difference == {"label_index"}
-            if process:
-                yield from adj_lazy(
-                    graph,
-                    c_id,
-                    depth=depth - 1,
-                    strict=strict,
-                    _processed_n_ids=processed_n_ids,
-                    **edge_attrs,
-                )
+            yield from adj_lazy(
+                graph,
+                c_id,
+                depth=depth - 1,
+                strict=strict,
+                _processed_n_ids=processed_n_ids,
+                **edge_attrs,
+            )
 
 
 def adj(
@@ -240,24 +325,25 @@ def pred_lazy(
 
     processed_n_ids.add(n_id)
 
-    p_ids: list[str] = sorted(graph.pred[n_id], key=int)
+    p_ids = [
+        p_id
+        for p_id, e_attrs in sorted_pred(graph, n_id)
+        if has_labels(e_attrs, **edge_attrs)
+    ]
 
     # Append direct parents
-    for p_id in p_ids:
-        if has_labels(graph[p_id][n_id], **edge_attrs):
-            yield p_id
+    yield from p_ids
 
     # Recurse into parents
     if depth < 0 or depth > 1:
         for p_id in p_ids:
-            if has_labels(graph[p_id][n_id], **edge_attrs):
-                yield from pred_lazy(
-                    graph,
-                    p_id,
-                    depth=depth - 1,
-                    _processed_n_ids=processed_n_ids,
-                    **edge_attrs,
-                )
+            yield from pred_lazy(
+                graph,
+                p_id,
+                depth=depth - 1,
+                _processed_n_ids=processed_n_ids,
+                **edge_attrs,
+            )
 
 
 def pred(
@@ -0,0 +1,474 @@
+from array import (
+    array,
+)
+from collections.abc import (
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+)
+from functools import (
+    cached_property,
+)
+from model.graph_model import (
+    Graph,
+    NId,
+)
+from more_itertools import (
+    chunked,
+)
+from networkx.classes.reportviews import (
+    NodeView,
+)
+import sys
+from types import (
+    MappingProxyType,
+)
+from typing import (
+    Any,
+)
+
+# Constants
+# Attributes set on more than one in DENSE_RATIO nodes get a slot per node,
+# the rest are keyed by node index, an entry costs about DENSE_RATIO slots
+DENSE_RATIO: int = 8
+# Attributes holding sets, stored as comma separated values
+CSV_ATTRS: tuple[str, ...] = ("label_input_type", "label_sink_type")
+MISSING: Any = object()
+Column = list[Any] | dict[int, Any]
+EdgeAttrs = Mapping[str, Any]
+
+
+def _by_id(item: tuple[NId, Any]) -> int:
+    return int(item[0])
+
+
+class _NodeAttrs(MutableMapping):
+    """Attributes of the node at `index`, read from the columns."""
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns: dict[str, Column], index: int) -> None:
+        self._columns = columns
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        column = self._columns[key]
+        if column.__class__ is list:
+            value = column[self._index]
+        else:
+            value = column.get(self._index, MISSING)  # type: ignore
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if (column := self._columns.get(key)) is None:
+            return default
+        if column.__class__ is list:
+            value = column[self._index]
+        else:
+            value = column.get(self._index, MISSING)  # type: ignore
+        return default if value is MISSING else value
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, MISSING) is not MISSING  # type: ignore
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._columns.setdefault(key, {})[self._index] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        column = self._columns[key]
+        if isinstance(column, list):
+            column[self._index] = MISSING
+        else:
+            del column[self._index]
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in tuple(self._columns) if key in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+    def copy(self) -> dict[str, Any]:
+        return dict(self.items())
+
+
+class _NodeStore(Mapping):
+    """Node attribute views, created the first time each node is read."""
+
+    __slots__ = ("_columns", "_ids", "_index", "views")
+
+    def __init__(
+        self,
+        columns: dict[str, Column],
+        ids: list[NId],
+        index: dict[NId, int],
+    ) -> None:
+        self._columns = columns
+        self._ids = ids
+        self._index = index
+        self.views: list[_NodeAttrs | None] = [None] * len(ids)
+
+    def __getitem__(self, n_id: NId) -> _NodeAttrs:
+        index = self._index[n_id]
+        if (n_attrs := self.views[index]) is None:
+            n_attrs = self.views[index] = _NodeAttrs(self._columns, index)
+        return n_attrs
+
+    def __contains__(self, n_id: object) -> bool:
+        return n_id in self._index
+
+    def __iter__(self) -> Iterator[NId]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class _AdjStore(Mapping):
+    """One direction of the adjacency, in CSR form.
+
+    The neighbors of the i-th node are `targets[ptr[i]:ptr[i + 1]]`, sorted
+    by id, and the attributes of those edges are indexes into `edge_attrs`,
+    which holds each distinct set of edge attributes once. Rows changed
+    after compaction move to `changed`, as plain dicts.
+    """
+
+    __slots__ = (
+        "changed",
+        "data",
+        "edge_attrs",
+        "ids",
+        "index",
+        "ptr",
+        "targets",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        ids: list[NId],
+        index: dict[NId, int],
+        ptr: array,
+        targets: array,
+        data: array,
+        edge_attrs: list[EdgeAttrs],
+    ) -> None:
+        self.changed: dict[int, dict[NId, EdgeAttrs]] = {}
+        self.data = data
+        self.edge_attrs = edge_attrs
+        self.ids = ids
+        self.index = index
+        self.ptr = ptr
+        self.targets = targets
+
+    def __getitem__(self, n_id: NId) -> MutableMapping:
+        index = self.index[n_id]
+        if (row := self.changed.get(index)) is not None:
+            return row
+        return _Row(self, index)
+
+    def __contains__(self, n_id: object) -> bool:
+        return n_id in self.index
+
+    def __iter__(self) -> Iterator[NId]:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def change(self, index: int) -> dict[NId, EdgeAttrs]:
+        if (row := self.changed.get(index)) is None:
+            row = self.changed[index] = dict(self.sorted_row(index))
+        return row
+
+    def sorted_row(self, index: int) -> list[tuple[NId, EdgeAttrs]]:
+        if (row := self.changed.get(index)) is not None:
+            return sorted(row.items(), key=_by_id)
+        ids = self.ids
+        edge_attrs = self.edge_attrs
+        targets = self.targets
+        data = self.data
+        return [
+            (ids[targets[position]], edge_attrs[data[position]])
+            for position in range(self.ptr[index], self.ptr[index + 1])
+        ]
+
+
+class _Row(MutableMapping):
+    __slots__ = ("_index", "_store")
+
+    def __init__(self, store: _AdjStore, index: int) -> None:
+        self._index = index
+        self._store = store
+
+    def __getitem__(self, n_id: NId) -> EdgeAttrs:
+        store = self._store
+        target = store.index[n_id]
+        for position in range(
+            store.ptr[self._index], store.ptr[self._index + 1]
+        ):
+            if store.targets[position] == target:
+                return store.edge_attrs[store.data[position]]
+        raise KeyError(n_id)
+
+    def __setitem__(self, n_id: NId, edge_attrs: EdgeAttrs) -> None:
+        self._store.change(self._index)[n_id] = edge_attrs
+
+    def __delitem__(self, n_id: NId) -> None:
+        del self._store.change(self._index)[n_id]
+
+    def __iter__(self) -> Iterator[NId]:
+        store = self._store
+        for position in range(
+            store.ptr[self._index], store.ptr[self._index + 1]
+        ):
+            yield store.ids[store.targets[position]]
+
+    def __len__(self) -> int:
+        return self._store.ptr[self._index + 1] - self._store.ptr[self._index]
+
+
+def _get_csr(
+    ids: list[NId],
+    edges: Iterable[tuple[int, int, int]],
+) -> tuple[array, array, array]:
+    rows: list[list[tuple[int, int, int]]] = [[] for _ in ids]
+    for source, target, attrs in edges:
+        rows[source].append((int(ids[target]), target, attrs))
+
+    ptr = array("I", [0])
+    targets = array("I")
+    data = array("I")
+    for row in rows:
+        row.sort()
+        targets.extend(target for _, target, _ in row)
+        data.extend(attrs for _, _, attrs in row)
+        ptr.append(len(targets))
+    return ptr, targets, data
+
+
+def _load_columns(
+    columns: dict[str, list[list[Any]]],
+    length: int,
+) -> dict[str, Column]:
+    loaded: dict[str, Column] = {}
+    for attr, (indexes, values) in columns.items():
+        if attr in CSV_ATTRS:
+            values = [set(value.split(",")) for value in values]
+        else:
+            values = [
+                sys.intern(value) if isinstance(value, str) else value
+                for value in values
+            ]
+
+        if len(indexes) * DENSE_RATIO > length:
+            dense = [MISSING] * length
+            for index, value in zip(indexes, values):
+                dense[index] = value
+            loaded[attr] = dense
+        else:
+            loaded[attr] = dict(zip(indexes, values))
+    return loaded
+
+
+class _NodeView(NodeView):
+    __slots__ = ()
+
+    def __getitem__(self, n_id: NId) -> _NodeAttrs:
+        return self._nodes[n_id]
+
+
+class CompactGraph(Graph):
+    """A DiGraph with integer node indexes and columnar attribute storage.
+
+    Nodes keep their string ids, mapped to indexes in insertion order, and
+    each node attribute is a column. The adjacency is held in CSR arrays
+    with the neighbors of each node sorted by id, so ordered access to them
+    needs no sorting, and edges share their attribute dicts, which are
+    read-only.
+
+    It is built once the graph is complete, with `to_compact_graph`, but
+    queries may still add nodes and edges, remove edges and set node
+    attributes: changed rows are kept as plain dicts. Unlike networkx,
+    neighbors are iterated in ascending id order.
+    """
+
+    def __init__(
+        self,
+        state: dict[str, Any] | None = None,
+        **attr: Any,
+    ) -> None:
+        super().__init__(**attr)
+        state = state or get_compact_state(Graph())
+        ids: list[NId] = list(map(sys.intern, state["ids"]))
+        index = {n_id: position for position, n_id in enumerate(ids)}
+        columns = _load_columns(state["columns"], len(ids))
+        edge_attrs: list[EdgeAttrs] = [
+            MappingProxyType(attrs) for attrs in state["edge_attrs"]
+        ]
+        edges = tuple(map(tuple, chunked(state["edges"], 3)))
+
+        self._columns = columns
+        self._ids = ids
+        self._index = index
+        self._node = _NodeStore(columns, ids, index)
+        self._adj = self._succ = _AdjStore(
+            ids,
+            index,
+            *_get_csr(ids, edges),
+            edge_attrs,
+        )
+        self._pred = _AdjStore(
+            ids,
+            index,
+            *_get_csr(
+                ids,
+                ((target, source, attrs) for source, target, attrs in edges),
+            ),
+            edge_attrs,
+        )
+
+    @cached_property
+    def nodes(self) -> _NodeView:  # type: ignore
+        return _NodeView(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_load_compact_graph, (get_compact_state(self), self.graph))
+
+    def add_node(self, node_for_adding: NId, **attr: Any) -> None:
+        if node_for_adding not in self._index:
+            self._index[node_for_adding] = len(self._ids)
+            self._ids.append(node_for_adding)
+            self._node.views.append(None)
+            for column in self._columns.values():
+                if isinstance(column, list):
+                    column.append(MISSING)
+            for store in (self._succ, self._pred):
+                store.changed[self._index[node_for_adding]] = {}
+        self._node[node_for_adding].update(attr)
+
+    def add_nodes_from(self, nodes_for_adding: Iterable, **attr: Any) -> None:
+        for node in nodes_for_adding:
+            if isinstance(node, tuple):
+                self.add_node(node[0], **{**attr, **node[1]})
+            else:
+                self.add_node(node, **attr)
+
+    def add_edge(self, u_of_edge: NId, v_of_edge: NId, **attr: Any) -> None:
+        for n_id in (u_of_edge, v_of_edge):
+            if n_id not in self._index:
+                self.add_node(n_id)
+        # Edge attributes are shared, never update them in place
+        edge_attrs = dict(self._succ[u_of_edge].get(v_of_edge, {}))
+        edge_attrs.update(attr)
+        self._succ[u_of_edge][v_of_edge] = edge_attrs
+        self._pred[v_of_edge][u_of_edge] = edge_attrs
+
+    def add_edges_from(self, ebunch_to_add: Iterable, **attr: Any) -> None:
+        for u_id, v_id, *data in ebunch_to_add:
+            self.add_edge(u_id, v_id, **{**attr, **(data[0] if data else {})})
+
+    def iter_attrs(self) -> Iterator[tuple[str, int, Any]]:
+        """Attribute, node index and value of every node attribute."""
+        for attr, column in self._columns.items():
+            for position, value in (
+                enumerate(column)
+                if isinstance(column, list)
+                else column.items()
+            ):
+                if value is not MISSING:
+                    yield attr, position, value
+
+    def match_labels(
+        self,
+        n_ids: Iterable[NId],
+        expected_attrs: Mapping[str, Any],
+    ) -> tuple[NId, ...]:
+        """Nodes among `n_ids` whose attributes have the expected values.
+
+        Same as `utils.graph.has_labels`, reading the columns directly.
+        """
+        checks = [
+            (self._columns.get(attr, {}), value)
+            for attr, value in expected_attrs.items()
+        ]
+        index = self._index
+        matching: list[NId] = []
+        for n_id in n_ids:
+            position = index[n_id]
+            for column, value in checks:
+                if column.__class__ is list:
+                    found = column[position]
+                else:
+                    found = column.get(position)  # type: ignore
+                if (None if found is MISSING else found) != value:
+                    break
+            else:
+                matching.append(n_id)
+        return tuple(matching)
+
+    def sorted_succ(self, n_id: NId) -> list[tuple[NId, EdgeAttrs]]:
+        """Successors of `n_id` and their edge attributes, by id."""
+        return self._succ.sorted_row(self._index[n_id])
+
+    def sorted_pred(self, n_id: NId) -> list[tuple[NId, EdgeAttrs]]:
+        """Predecessors of `n_id` and their edge attributes, by id."""
+        return self._pred.sorted_row(self._index[n_id])
+
+
+def _load_compact_graph(
+    state: dict[str, Any],
+    attrs: dict[str, Any],
+) -> CompactGraph:
+    return CompactGraph(state, **attrs)
+
+
+def get_compact_state(graph: Graph) -> dict[str, Any]:
+    """Describe `graph` with JSON types only, as `CompactGraph` loads it."""
+    ids: list[NId] = list(graph.nodes)
+    index = {n_id: position for position, n_id in enumerate(ids)}
+
+    columns: dict[str, list[list[Any]]] = {}
+    for attr, position, value in (
+        graph.iter_attrs()
+        if isinstance(graph, CompactGraph)
+        else (
+            (attr, position, value)
+            for position, n_attrs in enumerate(graph.nodes.values())
+            for attr, value in n_attrs.items()
+        )
+    ):
+        if attr in CSV_ATTRS:
+            value = ",".join(sorted(value))
+        column = columns.setdefault(attr, [[], []])
+        column[0].append(position)
+        column[1].append(value)
+
+    edge_attrs_index: dict[tuple[tuple[str, Any], ...], int] = {}
+    edges: list[int] = []
+    for u_id, v_id, e_attrs in graph.edges(data=True):
+        key = tuple(e_attrs.items())
+        edges.extend(
+            (
+                index[u_id],
+                index[v_id],
+                edge_attrs_index.setdefault(key, len(edge_attrs_index)),
+            )
+        )
+
+    return {
+        "columns": columns,
+        "edge_attrs": [dict(key) for key in edge_attrs_index],
+        "edges": edges,
+        "ids": ids,
+    }
+
+
+def to_compact_graph(graph: Graph) -> CompactGraph:
+    return CompactGraph(get_compact_state(graph), **graph.graph)
@@ -5,9 +5,6 @@ from collections.abc import (
 from model.graph_model import (
     Graph,
 )
-from utils.graph import (
-    adj_ast,
-)
 
 
 def get_node_text(graph: Graph, n_id: str) -> str:
@@ -15,9 +12,25 @@ def get_node_text(graph: Graph, n_id: str) -> str:
 
 
 def iter_childs(graph: Graph, n_id: str) -> Iterator[str]:
-    for c_id in adj_ast(graph, n_id):
-        yield from iter_childs(graph, c_id)
-    yield n_id
+    # Post-order walk with an explicit stack, nesting one generator per
+    # level made deep trees quadratic and could overflow the C stack
+    stack: list[tuple[str, bool]] = [(n_id, False)]
+    while stack:
+        c_id, visited = stack.pop()
+        if visited:
+            yield c_id
+        else:
+            stack.append((c_id, True))
+            ast_childs = sorted(
+                (
+                    g_id
+                    for g_id, edge_attrs in graph.adj[c_id].items()
+                    if edge_attrs.get("label_ast") == "AST"
+                ),
+                key=int,
+                reverse=True,
+            )
+            stack.extend((g_id, False) for g_id in ast_childs)
 
 
 def lazy_text_childs(graph: Graph, n_id: str) -> Iterator[str]:
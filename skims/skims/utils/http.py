@@ -1,10 +1,23 @@
 import aiohttp
+import asyncio
+from collections.abc import (
+    AsyncIterator,
+)
 from contextlib import (
     asynccontextmanager,
 )
+from multidict import (
+    CIMultiDictProxy,
+)
 import requests
+from time import (
+    monotonic,
+)
 from typing import (
-    Any,
+    NamedTuple,
+)
+from urllib.parse import (
+    urlsplit,
 )
 from urllib3.exceptions import (
     InsecureRequestWarning,
@@ -14,23 +27,76 @@ from utils.function import (
 )
 import warnings
 
+# Constants
+HOST_CONNECTIONS: int = 4
+HOST_REQUESTS_PER_SECOND: float = 10.0
+MAX_CONTENT_SIZE: int = 1048576
 RETRY = shield(
     on_error_return=None,
     retries=3,
     sleep_between_retries=3,
 )
+RequestKey = tuple[str, str, tuple[tuple[str, str], ...]]
+
+
+class TokenBucket:
+    """Allow `rate` acquisitions per second, in bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.capacity = capacity
+        self.lock = asyncio.Lock()
+        self.rate = rate
+        self.timestamp = monotonic()
+        self.tokens = capacity
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.timestamp) * self.rate
+        )
+        self.timestamp = now
+
+    async def acquire(self) -> None:
+        async with self.lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+class HTTPResponse(NamedTuple):
+    content: bytes
+    headers: CIMultiDictProxy[str]
+    status: int
+    url: str
+
 
+class HTTPClient(NamedTuple):
+    limiters: dict[str, TokenBucket]
+    requests_per_second: float
+    responses: dict[RequestKey, HTTPResponse | None]
+    session: aiohttp.ClientSession
 
-@asynccontextmanager  # type: ignore
-async def create_session(  # type: ignore
-    *args: Any,
-    **kwargs: Any,
-) -> aiohttp.ClientSession:
+
+@asynccontextmanager
+async def create_client(
+    *,
+    connections_per_host: int = HOST_CONNECTIONS,
+    requests_per_second: float = HOST_REQUESTS_PER_SECOND,
+) -> AsyncIterator[HTTPClient]:
+    """Create a client that shares keep-alive connections between requests.
+
+    :param connections_per_host: Size of the connection pool of each host
+    :param requests_per_second: Sustained request rate allowed per host
+    :return: A client to use with `fetch`
+    """
     async with aiohttp.ClientSession(
         connector=aiohttp.TCPConnector(
-            # The server might be timing out the connection
-            # since it's being used for multiple requests
-            force_close=True,
+            # Connections are kept alive and shared between requests. The
+            # server might be timing out a connection since it's being used
+            # for multiple requests, `fetch` retries the failed request
+            limit_per_host=connections_per_host,
             ssl=False,
         ),
         timeout=aiohttp.ClientTimeout(
@@ -40,21 +106,55 @@ async def create_session(  # type: ignore
             sock_connect=None,
         ),
         trust_env=True,
-        *args,
-        **kwargs,
     ) as session:
-        yield session
+        yield HTTPClient(
+            limiters={},
+            requests_per_second=requests_per_second,
+            responses={},
+            session=session,
+        )
 
 
 @RETRY
-async def request(
+async def _fetch(
     session: aiohttp.ClientSession,
     method: str,
     url: str,
-    *args: Any,
-    **kwargs: Any,
-) -> aiohttp.ClientResponse | None:
-    return await session.request(method, url, *args, **kwargs)
+    headers: dict[str, str] | None,
+) -> HTTPResponse:
+    async with session.request(method, url, headers=headers) as response:
+        return HTTPResponse(
+            content=await response.content.read(MAX_CONTENT_SIZE),
+            headers=response.headers,
+            status=response.status,
+            url=str(response.url),
+        )
+
+
+async def fetch(
+    client: HTTPClient,
+    method: str,
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+) -> HTTPResponse | None:
+    """Request `url`, reusing the response of an identical earlier request.
+
+    At most `MAX_CONTENT_SIZE` bytes of the body are read.
+
+    :return: The response, or None if the request failed
+    """
+    key: RequestKey = (method, url, tuple(sorted((headers or {}).items())))
+    if key not in client.responses:
+        host: str = urlsplit(url).netloc
+        if host not in client.limiters:
+            client.limiters[host] = TokenBucket(client.requests_per_second)
+        await client.limiters[host].acquire()
+        client.responses[key] = await _fetch(
+            client.session, method, url, headers
+        )
+
+    return client.responses[key]
 
 
 def request_blocking(
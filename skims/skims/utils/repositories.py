@@ -4,6 +4,7 @@ from git.exc import (
 from git.repo import (
     Repo,
 )
+import os
 from utils.logs import (
     log_blocking,
 )
@@ -52,3 +53,27 @@ def get_repo_remote(path: str) -> str | None:
         log_blocking("error", "Computing active branch: %s ", exc)
 
     return url
+
+
+def get_changed_paths(path: str, base_commit: str) -> set[str] | None:
+    """List the files changed since `base_commit`, relative to `path`.
+
+    Uncommitted changes and untracked files are included, as well as the
+    previous name of renamed files.
+    """
+    try:
+        repo: Repo = get_repo(path)
+        names: list[str] = repo.git.diff(
+            "--name-only", "--no-renames", "-z", base_commit, "--"
+        ).split("\0")
+        names.extend(repo.untracked_files)
+    except GitError as exc:
+        log_blocking("error", "Computing changed paths: %s ", exc)
+        return None
+
+    root: str = os.path.realpath(str(repo.working_tree_dir))
+    return {
+        os.path.relpath(os.path.join(root, name), os.path.realpath(path))
+        for name in names
+        if name
+    }
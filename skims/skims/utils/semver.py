@@ -0,0 +1,522 @@
+"""In-process port of the range intersection used by `tools/semver-match`.
+
+It mirrors `semver/ranges/intersects` of the npm `semver` package, in its
+default (strict) mode, plus the constraint coercion done by the tool, so
+results are the same as the ones of the external binary.
+"""
+from collections.abc import (
+    Callable,
+    Iterable,
+)
+from functools import (
+    lru_cache,
+)
+import re
+from typing import (
+    NamedTuple,
+)
+
+# Constants
+MAX_LENGTH: int = 256
+MAX_SAFE_INTEGER: int = 9007199254740991
+
+_NUMERIC_IDENTIFIER = r"0|[1-9]\d*"
+_NON_NUMERIC_IDENTIFIER = r"\d*[a-zA-Z-][a-zA-Z0-9-]*"
+_MAIN_VERSION = (
+    rf"({_NUMERIC_IDENTIFIER})\."
+    rf"({_NUMERIC_IDENTIFIER})\."
+    rf"({_NUMERIC_IDENTIFIER})"
+)
+_PRERELEASE_IDENTIFIER = (
+    rf"(?:{_NUMERIC_IDENTIFIER}|{_NON_NUMERIC_IDENTIFIER})"
+)
+_PRERELEASE = (
+    rf"(?:-({_PRERELEASE_IDENTIFIER}(?:\.{_PRERELEASE_IDENTIFIER})*))"
+)
+_BUILD_IDENTIFIER = r"[0-9A-Za-z-]+"
+_BUILD = rf"(?:\+({_BUILD_IDENTIFIER}(?:\.{_BUILD_IDENTIFIER})*))"
+_FULL_PLAIN = rf"v?{_MAIN_VERSION}{_PRERELEASE}?{_BUILD}?"
+_LOOSE_PLAIN = (
+    r"[v=\s]*([0-9]+)\.([0-9]+)\.([0-9]+)"
+    r"(?:-?((?:[0-9]+|\d*[a-zA-Z-][a-zA-Z0-9-]*)"
+    r"(?:\.(?:[0-9]+|\d*[a-zA-Z-][a-zA-Z0-9-]*))*))?"
+    rf"{_BUILD}?"
+)
+_GTLT = r"((?:<|>)?=?)"
+_XRANGE_IDENTIFIER = rf"{_NUMERIC_IDENTIFIER}|x|X|\*"
+_XRANGE_PLAIN = (
+    rf"[v=\s]*({_XRANGE_IDENTIFIER})"
+    rf"(?:\.({_XRANGE_IDENTIFIER})"
+    rf"(?:\.({_XRANGE_IDENTIFIER})"
+    rf"(?:{_PRERELEASE})?{_BUILD}?"
+    r")?)?"
+)
+
+RE_FULL = re.compile(rf"^{_FULL_PLAIN}\Z", re.ASCII)
+RE_XRANGE = re.compile(rf"^{_GTLT}\s*{_XRANGE_PLAIN}\Z", re.ASCII)
+RE_TILDE_TRIM = re.compile(r"(\s*)(?:~>?)\s+", re.ASCII)
+RE_TILDE = re.compile(rf"^(?:~>?){_XRANGE_PLAIN}\Z", re.ASCII)
+RE_CARET_TRIM = re.compile(r"(\s*)(?:\^)\s+", re.ASCII)
+RE_CARET = re.compile(rf"^(?:\^){_XRANGE_PLAIN}\Z", re.ASCII)
+RE_COMPARATOR = re.compile(rf"^{_GTLT}\s*({_FULL_PLAIN})\Z|^\Z", re.ASCII)
+RE_COMPARATOR_TRIM = re.compile(
+    rf"(\s*){_GTLT}\s*({_LOOSE_PLAIN}|{_XRANGE_PLAIN})", re.ASCII
+)
+RE_HYPHEN_RANGE = re.compile(
+    rf"^\s*({_XRANGE_PLAIN})\s+-\s+({_XRANGE_PLAIN})\s*\Z", re.ASCII
+)
+RE_STAR = re.compile(r"(<|>)?=?\s*\*", re.ASCII)
+RE_GTE0 = re.compile(r"^\s*>=\s*0\.0\.0\s*\Z", re.ASCII)
+RE_NUMERIC = re.compile(r"^[0-9]+\Z", re.ASCII)
+RE_SPACES = re.compile(r"\s+")
+
+NULL_SET: str = "<0.0.0-0"
+
+Identifier = int | str
+
+
+class InvalidSemver(ValueError):
+    pass
+
+
+class SemVer(NamedTuple):
+    major: int
+    minor: int
+    patch: int
+    prerelease: tuple[Identifier, ...]
+    version: str
+
+
+class Comparator(NamedTuple):
+    operator: str
+    # None means any version
+    semver: SemVer | None
+    value: str
+
+
+Range = tuple[tuple[Comparator, ...], ...]
+
+
+def _group(match: re.Match[str], index: int) -> str:
+    return match.group(index) or ""
+
+
+def _is_x(identifier: str | None) -> bool:
+    return not identifier or identifier.lower() == "x" or identifier == "*"
+
+
+def _sub_once(
+    pattern: re.Pattern[str],
+    replace: Callable[[re.Match[str]], str],
+    string: str,
+) -> str:
+    return pattern.sub(replace, string, count=1)
+
+
+def parse_semver(version: str) -> SemVer:
+    if len(version) > MAX_LENGTH:
+        raise InvalidSemver(f"version is longer than {MAX_LENGTH} characters")
+
+    if not (match := RE_FULL.match(version.strip())):
+        raise InvalidSemver(f"Invalid Version: {version}")
+
+    major, minor, patch = map(int, match.group(1, 2, 3))
+    if max(major, minor, patch) > MAX_SAFE_INTEGER:
+        raise InvalidSemver(f"Invalid Version: {version}")
+
+    prerelease: tuple[Identifier, ...] = tuple(
+        int(identifier)
+        if RE_NUMERIC.match(identifier) and int(identifier) < MAX_SAFE_INTEGER
+        else identifier
+        for identifier in (match.group(4) or "").split(".")
+        if match.group(4)
+    )
+
+    formatted = f"{major}.{minor}.{patch}"
+    if prerelease:
+        formatted += "-" + ".".join(map(str, prerelease))
+
+    return SemVer(major, minor, patch, prerelease, formatted)
+
+
+def _compare_identifiers(left: Identifier, right: Identifier) -> int:
+    left_num = bool(RE_NUMERIC.match(str(left)))
+    right_num = bool(RE_NUMERIC.match(str(right)))
+    if left_num and right_num:
+        left, right = int(left), int(right)
+
+    if left == right:
+        return 0
+    if left_num and not right_num:
+        return -1
+    if right_num and not left_num:
+        return 1
+    return -1 if left < right else 1  # type: ignore
+
+
+def _compare_pre(left: SemVer, right: SemVer) -> int:
+    if left.prerelease and not right.prerelease:
+        return -1
+    if not left.prerelease and right.prerelease:
+        return 1
+    for left_id, right_id in zip(left.prerelease, right.prerelease):
+        if left_id != right_id:
+            return _compare_identifiers(left_id, right_id)
+    return _compare_identifiers(len(left.prerelease), len(right.prerelease))
+
+
+def compare(left: SemVer, right: SemVer) -> int:
+    if left.version == right.version:
+        return 0
+    return (
+        _compare_identifiers(left.major, right.major)
+        or _compare_identifiers(left.minor, right.minor)
+        or _compare_identifiers(left.patch, right.patch)
+        or _compare_pre(left, right)
+    )
+
+
+def _cmp(left: SemVer, operator: str, right: SemVer) -> bool:
+    result = compare(left, right)
+    return {
+        "": result == 0,
+        ">": result > 0,
+        ">=": result >= 0,
+        "<": result < 0,
+        "<=": result <= 0,
+    }[operator]
+
+
+def _parse_comparator(comp: str) -> Comparator:
+    if not (match := RE_COMPARATOR.match(comp)):
+        raise InvalidSemver(f"Invalid comparator: {comp}")
+
+    operator = _group(match, 1)
+    if operator == "=":
+        operator = ""
+
+    if not match.group(2):
+        return Comparator(operator, None, "")
+
+    semver = parse_semver(match.group(2))
+    return Comparator(operator, semver, operator + semver.version)
+
+
+def _replace_tilde(comp: str) -> str:
+    def replace(match: re.Match[str]) -> str:
+        major, minor, patch, pre = match.group(1, 2, 3, 4)
+        if _is_x(major):
+            return ""
+        if _is_x(minor):
+            return f">={major}.0.0 <{int(major) + 1}.0.0-0"
+        if _is_x(patch):
+            return f">={major}.{minor}.0 <{major}.{int(minor) + 1}.0-0"
+        if pre:
+            return (
+                f">={major}.{minor}.{patch}-{pre} "
+                f"<{major}.{int(minor) + 1}.0-0"
+            )
+        return f">={major}.{minor}.{patch} <{major}.{int(minor) + 1}.0-0"
+
+    return _sub_once(RE_TILDE, replace, comp)
+
+
+def _replace_caret(comp: str) -> str:
+    def replace(match: re.Match[str]) -> str:
+        major, minor, patch, pre = match.group(1, 2, 3, 4)
+        if _is_x(major):
+            return ""
+        if _is_x(minor):
+            return f">={major}.0.0 <{int(major) + 1}.0.0-0"
+        if _is_x(patch):
+            if major == "0":
+                return f">={major}.{minor}.0 <{major}.{int(minor) + 1}.0-0"
+            return f">={major}.{minor}.0 <{int(major) + 1}.0.0-0"
+
+        lower = f">={major}.{minor}.{patch}" + (f"-{pre}" if pre else "")
+        if major == "0":
+            if minor == "0":
+                return f"{lower} <{major}.{minor}.{int(patch) + 1}-0"
+            return f"{lower} <{major}.{int(minor) + 1}.0-0"
+        return f"{lower} <{int(major) + 1}.0.0-0"
+
+    return _sub_once(RE_CARET, replace, comp)
+
+
+def _replace_xrange(comp: str) -> str:
+    def replace(match: re.Match[str]) -> str:
+        gtlt = _group(match, 1)
+        major, minor, patch = match.group(2, 3, 4)
+        x_major = _is_x(major)
+        x_minor = x_major or _is_x(minor)
+        x_patch = x_minor or _is_x(patch)
+
+        if gtlt == "=" and x_patch:
+            gtlt = ""
+
+        if x_major:
+            return NULL_SET if gtlt in {">", "<"} else "*"
+        if gtlt and x_patch:
+            new_major, new_minor, new_patch = int(major), 0, 0
+            if not x_minor:
+                new_minor = int(minor)
+            if gtlt == ">":
+                gtlt = ">="
+                if x_minor:
+                    new_major, new_minor = new_major + 1, 0
+                else:
+                    new_minor += 1
+            elif gtlt == "<=":
+                gtlt = "<"
+                if x_minor:
+                    new_major += 1
+                else:
+                    new_minor += 1
+            pre = "-0" if gtlt == "<" else ""
+            return f"{gtlt}{new_major}.{new_minor}.{new_patch}{pre}"
+        if x_minor:
+            return f">={major}.0.0 <{int(major) + 1}.0.0-0"
+        if x_patch:
+            return f">={major}.{minor}.0 <{major}.{int(minor) + 1}.0-0"
+        return match.group(0)
+
+    return _sub_once(RE_XRANGE, replace, comp.strip())
+
+
+def _replace_hyphen(match: re.Match[str]) -> str:
+    from_, from_major, from_minor, from_patch = match.group(1, 2, 3, 4)
+    to_, to_major, to_minor, to_patch, to_pre = match.group(7, 8, 9, 10, 11)
+
+    if _is_x(from_major):
+        from_ = ""
+    elif _is_x(from_minor):
+        from_ = f">={from_major}.0.0"
+    elif _is_x(from_patch):
+        from_ = f">={from_major}.{from_minor}.0"
+    else:
+        from_ = f">={from_}"
+
+    if _is_x(to_major):
+        to_ = ""
+    elif _is_x(to_minor):
+        to_ = f"<{int(to_major) + 1}.0.0-0"
+    elif _is_x(to_patch):
+        to_ = f"<{to_major}.{int(to_minor) + 1}.0-0"
+    elif to_pre:
+        to_ = f"<={to_major}.{to_minor}.{to_patch}-{to_pre}"
+    else:
+        to_ = f"<={to_}"
+
+    return f"{from_} {to_}".strip()
+
+
+def _split_spaces(string: str) -> list[str]:
+    return RE_SPACES.split(string)
+
+
+def _parse_comparators(comp: str) -> str:
+    comp = " ".join(map(_replace_caret, _split_spaces(comp.strip())))
+    comp = " ".join(map(_replace_tilde, _split_spaces(comp.strip())))
+    comp = " ".join(map(_replace_xrange, _split_spaces(comp)))
+    return _sub_once(RE_STAR, lambda _: "", comp.strip())
+
+
+def _parse_range_set(range_: str) -> tuple[Comparator, ...]:
+    range_ = range_.strip()
+    range_ = _sub_once(RE_HYPHEN_RANGE, _replace_hyphen, range_)
+    range_ = RE_COMPARATOR_TRIM.sub(
+        lambda match: _group(match, 1) + _group(match, 2) + _group(match, 3),
+        range_,
+    )
+    range_ = RE_TILDE_TRIM.sub(lambda match: _group(match, 1) + "~", range_)
+    range_ = RE_CARET_TRIM.sub(lambda match: _group(match, 1) + "^", range_)
+    range_ = " ".join(_split_spaces(range_))
+
+    comps = _split_spaces(" ".join(map(_parse_comparators, range_.split(" "))))
+    comparators: dict[str, Comparator] = {}
+    # Every comparator must be valid, even when the set is a null set
+    for comparator in [
+        _parse_comparator(RE_GTE0.sub("", comp.strip(), count=1))
+        for comp in comps
+    ]:
+        if comparator.value == NULL_SET:
+            return (comparator,)
+        comparators[comparator.value] = comparator
+
+    if len(comparators) > 1 and "" in comparators:
+        del comparators[""]
+
+    return tuple(comparators.values())
+
+
+@lru_cache(maxsize=4096)
+def parse_range(range_: str) -> Range:
+    sets: list[tuple[Comparator, ...]] = [
+        comparators
+        for raw_set in range_.split("||")
+        if (comparators := _parse_range_set(raw_set.strip()))
+    ]
+    if not sets:
+        raise InvalidSemver(f"Invalid SemVer Range: {range_}")
+
+    if len(sets) > 1:
+        first = sets[0]
+        sets = [comps for comps in sets if comps[0].value != NULL_SET]
+        if not sets:
+            sets = [first]
+        elif len(sets) > 1:
+            for comps in sets:
+                if len(comps) == 1 and comps[0].value == "":
+                    sets = [comps]
+                    break
+
+    return tuple(sets)
+
+
+def _test_set(comparators: tuple[Comparator, ...], version: SemVer) -> bool:
+    if not all(
+        comp.semver is None or _cmp(version, comp.operator, comp.semver)
+        for comp in comparators
+    ):
+        return False
+
+    if version.prerelease:
+        # Prereleases only match comparators on the same [major, minor,
+        # patch] tuple that also have a prerelease
+        return any(
+            comp.semver is not None
+            and comp.semver.prerelease
+            and comp.semver[:3] == version[:3]
+            for comp in comparators
+        )
+
+    return True
+
+
+def range_test(range_: Range, version: SemVer | str) -> bool:
+    if not version:
+        return False
+
+    if isinstance(version, str):
+        try:
+            version = parse_semver(version)
+        except InvalidSemver:
+            return False
+
+    return any(_test_set(comparators, version) for comparators in range_)
+
+
+def _comparators_intersect(left: Comparator, right: Comparator) -> bool:
+    if left.operator == "":
+        if left.value == "":
+            return True
+        return range_test(parse_range(right.value), left.value)
+    if right.operator == "":
+        if right.value == "":
+            return True
+        return range_test(parse_range(left.value), right.semver or "")
+
+    if left.semver is None or right.semver is None:
+        return False
+
+    increasing = {">=", ">"}
+    decreasing = {"<=", "<"}
+    inclusive = {">=", "<="}
+    return (
+        (left.operator in increasing and right.operator in increasing)
+        or (left.operator in decreasing and right.operator in decreasing)
+        or (
+            left.semver.version == right.semver.version
+            and left.operator in inclusive
+            and right.operator in inclusive
+        )
+        or (
+            compare(left.semver, right.semver) < 0
+            and left.operator in increasing
+            and right.operator in decreasing
+        )
+        or (
+            compare(left.semver, right.semver) > 0
+            and left.operator in decreasing
+            and right.operator in increasing
+        )
+    )
+
+
+def _is_satisfiable(comparators: tuple[Comparator, ...]) -> bool:
+    remaining = list(comparators)
+    test_comparator = remaining.pop()
+    while remaining:
+        if not all(
+            _comparators_intersect(test_comparator, other)
+            for other in remaining
+        ):
+            return False
+        test_comparator = remaining.pop()
+    return True
+
+
+def ranges_intersect(left: Range, right: Range) -> bool:
+    return any(
+        _is_satisfiable(left_comps)
+        and any(
+            _is_satisfiable(right_comps)
+            and all(
+                _comparators_intersect(left_comp, right_comp)
+                for left_comp in left_comps
+                for right_comp in right_comps
+            )
+            for right_comps in right
+        )
+        for left_comps in left
+    )
+
+
+def _coerce(constraint: str) -> str:
+    # Coerce versions like a.b.c.d-pre+build to a.b.c-pre-build
+    # i.e. remove version components after the third one so it complies
+    # semver
+    tokens = re.split(r"([-+])", constraint)
+    version_coerced = tokens[0].split(".")
+    if len(version_coerced) < 3:
+        version_coerced.append("*")
+    return ".".join(version_coerced[:3]) + "".join(tokens[1:])
+
+
+def coerce_range(range_: str) -> str:
+    range_ = re.sub(r"\s*\|\|\s*", "||", re.sub(r"\s+", " ", range_))
+    return "||".join(
+        " ".join(map(_coerce, token.split(" ")))
+        for token in range_.split("||")
+    )
+
+
+@lru_cache(maxsize=4096)
+def compile_constraint(constraint: str) -> Range:
+    """Coerce and parse `constraint` once, raising InvalidSemver if needed."""
+    return parse_range(coerce_range(constraint))
+
+
+def match(left: str, right: str) -> bool:
+    """Tell if the `left` and `right` constraints have versions in common.
+
+    :raises InvalidSemver: If any of the constraints is not valid
+    """
+    return ranges_intersect(
+        compile_constraint(left), compile_constraint(right)
+    )
+
+
+def match_versions(
+    versions: Iterable[str],
+    constraint: str,
+) -> tuple[bool, ...]:
+    """Match a batch of versions against a single compiled constraint.
+
+    :raises InvalidSemver: If the constraint or any version is not valid
+    """
+    compiled: Range = compile_constraint(constraint)
+    return tuple(
+        ranges_intersect(compile_constraint(version), compiled)
+        for version in versions
+    )
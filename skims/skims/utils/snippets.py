@@ -0,0 +1,118 @@
+from functools import (
+    lru_cache,
+)
+import serializers
+from serializers import (
+    Snippet,
+    SnippetViewport,
+)
+
+# Constants
+MAX_CACHED_FILES: int = 8
+
+
+@lru_cache(maxsize=MAX_CACHED_FILES)
+def _get_lines(content: str) -> tuple[str, ...]:
+    # Replace tab by spaces so 1 char renders as 1 symbol
+    return tuple(content.replace("\t", " ").splitlines())
+
+
+@lru_cache(maxsize=MAX_CACHED_FILES)
+def _get_file_lines(path: str) -> tuple[str, ...]:
+    with open(path, encoding="latin-1") as handle:
+        return _get_lines(handle.read())
+
+
+def _render(lines: tuple[str, ...], viewport: SnippetViewport) -> Snippet:
+    """Render the viewport formatting only the lines that are displayed.
+
+    Mirrors `serializers.make_snippet` for viewports that do not wrap.
+    """
+    offset: int = 0
+    rendered: list[str] = []
+    lines_count: int = len(lines)
+    if lines_count:
+        center: int = (
+            viewport.line - 1 if 1 <= viewport.line <= lines_count else 0
+        )
+        left: int = (
+            max(viewport.column - viewport.columns_per_line // 4, 0)
+            if viewport.column is not None
+            else 0
+        )
+        context: int = viewport.line_context
+        if center - context <= 0:
+            start, end = 0, min(2 * context + 1, lines_count)
+        elif center + context < lines_count:
+            start, end = center - context, center + context + 1
+        else:
+            start, end = max(lines_count - 2 * context - 1, 0), lines_count
+        offset = start
+
+        loc_width: int = len(str(lines_count))
+        for index in range(start, end):
+            line_no: int = index + 1
+            # The line number before the first one is the penultimate line
+            line_no_last: int | None = (
+                index if index else (lines_count - 1 or None)
+            )
+            line: str = lines[index][
+                left : left + viewport.columns_per_line + 1
+            ]
+            if viewport.show_line_numbers:
+                mark_symbol = (
+                    ">"
+                    if line_no == viewport.line
+                    and line_no != line_no_last
+                    and viewport.highlight_line_number
+                    else " "
+                )
+                line_no_str = "" if line_no == line_no_last else line_no
+                fmt = f"{mark_symbol} {line_no_str!s:>{loc_width}s} | {line}"
+                rendered.append(fmt.rstrip(" "))
+            else:
+                rendered.append(line)
+
+        if (
+            viewport.column is not None
+            and viewport.show_line_numbers
+            and viewport.highlight_line_number
+        ):
+            rendered.append(f"  {' ':>{loc_width}} ^ Col {left}")
+
+    return Snippet(
+        content="\n".join(rendered),
+        offset=offset,
+        line=viewport.line,
+        column=viewport.column,
+        columns_per_line=viewport.columns_per_line,
+        line_context=viewport.line_context,
+        highlight_line_number=viewport.highlight_line_number,
+        show_line_numbers=viewport.show_line_numbers,
+        wrap=viewport.wrap,
+    )
+
+
+def make_snippet(
+    *,
+    content: str,
+    viewport: SnippetViewport | None = None,
+) -> Snippet:
+    """Same as `serializers.make_snippet`, for many snippets of one content.
+
+    The lines of the most recent contents are kept, so reporting several
+    vulnerabilities of the same file splits it only once.
+    """
+    if viewport is None or viewport.wrap:
+        return serializers.make_snippet(content=content, viewport=viewport)
+    return _render(_get_lines(content), viewport)
+
+
+def make_file_snippet(*, path: str, viewport: SnippetViewport) -> Snippet:
+    """Build the snippet of `path`, reading it at most once per process."""
+    if viewport.wrap:
+        with open(path, encoding="latin-1") as handle:
+            return serializers.make_snippet(
+                content=handle.read(), viewport=viewport
+            )
+    return _render(_get_file_lines(path), viewport)
@@ -8,9 +8,11 @@ def tcp_connect(
     hostname: str,
     port: int,
     intention: str = "establish tcp connection",
+    timeout: float | None = None,
 ) -> socket.socket | None:
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
         sock.connect((hostname, port))
         return sock
     except (
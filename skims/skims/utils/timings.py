@@ -0,0 +1,72 @@
+from collections.abc import (
+    Iterator,
+)
+from contextlib import (
+    contextmanager,
+)
+from ctx import (
+    CTX,
+)
+import json
+import os
+import time
+from typing import (
+    NamedTuple,
+)
+
+# Constants
+# Calls and seconds of each stage measured by this process since its last
+# flush, only recorded while CTX.timings_folder is set
+TIMINGS: dict[str, list[float]] = {}
+
+
+class Timing(NamedTuple):
+    calls: int
+    seconds: float
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """Add the time spent running the block to `stage`."""
+    if not CTX.timings_folder:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing = TIMINGS.setdefault(stage, [0, 0.0])
+        timing[0] += 1
+        timing[1] += time.perf_counter() - start
+
+
+def flush_timings() -> None:
+    """Append the timings of this process to CTX.timings_folder.
+
+    Worker processes call it after each task, so the parent finds their
+    timings on disk once the pool is done.
+    """
+    if not CTX.timings_folder or not TIMINGS:
+        return
+
+    path = os.path.join(CTX.timings_folder, f"{os.getpid()}.jsonl")
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write(json.dumps(TIMINGS) + "\n")
+    TIMINGS.clear()
+
+
+def load_timings(folder: str) -> dict[str, Timing]:
+    """Add up the timings flushed to `folder` by every process."""
+    totals: dict[str, Timing] = {}
+    for name in sorted(os.listdir(folder)):
+        with open(os.path.join(folder, name), encoding="utf-8") as handle:
+            for line in handle:
+                for stage, (calls, seconds) in json.loads(line).items():
+                    total = totals.get(stage, Timing(0, 0.0))
+                    totals[stage] = Timing(
+                        calls=total.calls + calls,
+                        seconds=total.seconds + seconds,
+                    )
+
+    return totals
@@ -0,0 +1,107 @@
+from core.result import (
+    get_sarif,
+    write_sarif,
+)
+from ctx import (
+    CTX,
+)
+import io
+import json
+from model import (
+    core_model,
+)
+import pytest
+from pytest_mock import (
+    MockerFixture,
+)
+from state.ephemeral import (
+    get_ephemeral_store,
+)
+from vulnerabilities import (
+    build_inputs_vuln,
+    build_lines_vuln,
+    build_metadata,
+)
+
+
+def _get_config() -> core_model.SkimsConfig:
+    return core_model.SkimsConfig(
+        apk=core_model.SkimsAPKConfig(exclude=(), include=()),
+        checks={core_model.FindingEnum.F001},
+        commit=None,
+        dast=None,
+        execution_id=None,
+        group=None,
+        language=core_model.LocalesEnum.EN,
+        namespace="test",
+        output=None,
+        path=core_model.SkimsPathConfig(
+            exclude=(),
+            include=(".",),
+            lib_path=True,
+            lib_root=True,
+        ),
+        start_dir=".",
+        working_dir=".",
+    )
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_write_sarif(mocker: MockerFixture) -> None:
+    mocker.patch.object(CTX, "config", _get_config())
+    mocker.patch("core.result.get_repo_branch", return_value="trunk")
+    mocker.patch("core.result.get_repo_head_hash", return_value="0" * 40)
+    mocker.patch("core.result.get_repo_remote", return_value="origin")
+
+    stores = {finding: get_ephemeral_store() for finding in CTX.config.checks}
+    for method, what, where in (
+        (core_model.MethodsEnum.CS_SQL_INJECTION, "src/a.cs", "10"),
+        (core_model.MethodsEnum.CS_SQL_INJECTION, "src/b.cs", "12"),
+        (
+            core_model.MethodsEnum.NPM_PACKAGE_JSON,
+            "package.json (lodash v4.17.0) [CVE-2021-23337]",
+            "3",
+        ),
+    ):
+        vulnerability = build_lines_vuln(
+            method=method,
+            what=what,
+            where=where,
+            metadata=build_metadata(
+                method=method, description="description", snippet="snippet"
+            ),
+        )
+        stores.setdefault(vulnerability.finding, get_ephemeral_store()).store(
+            vulnerability
+        )
+    method = core_model.MethodsEnum.AWS_ALLOWS_PRIV_ESCALATION_BY_ATTACH_POLICY
+    vulnerability = build_inputs_vuln(
+        method=method,
+        stream="skims",
+        what="https://example.com//",
+        where="policy",
+        metadata=build_metadata(
+            method=method, description="description", snippet=""
+        ),
+    )
+    stores.setdefault(vulnerability.finding, get_ephemeral_store()).store(
+        vulnerability
+    )
+
+    handle = io.StringIO()
+    write_sarif(CTX.config, stores, handle)
+    sarif = get_sarif(CTX.config, stores)
+
+    assert handle.getvalue() == json.dumps(sarif)
+    run = sarif["runs"][0]
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == [
+        "001",
+        "011",
+        "005",
+    ]
+    taxa_ids = [taxon["id"] for taxon in run["taxonomies"][0]["taxa"]]
+    assert len(taxa_ids) == len(set(taxa_ids))
+    assert [
+        result["locations"][0]["physicalLocation"]["artifactLocation"]["uri"]
+        for result in run["results"]
+    ] == ["src/a.cs", "src/b.cs", "package.json", "https://example.com"]
@@ -0,0 +1,76 @@
+from lib_root.analyze import (
+    _filter_by_node_types,
+    _get_queries_by_language,
+    QUERIES,
+)
+from model import (
+    graph_model,
+)
+import pytest
+from sast.query import (
+    get_query_manifest,
+    QUERY_MANIFESTS,
+)
+
+GraphLanguage = graph_model.GraphShardMetadataLanguage
+
+
+def _get_graph_db(
+    language: GraphLanguage, node_types: tuple[str, ...]
+) -> graph_model.GraphDB:
+    syntax_graph = graph_model.Graph()
+    for n_id, node_type in enumerate(node_types, start=1):
+        syntax_graph.add_node(str(n_id), label_type=node_type)
+
+    return graph_model.GraphDB(
+        context={},
+        shards=[
+            graph_model.GraphShard(
+                graph=graph_model.Graph(),
+                metadata=graph_model.GraphShardMetadata(language=language),
+                path="main.tf",
+                syntax={},
+                syntax_graph=syntax_graph,
+            )
+        ],
+        shards_by_language_class={},
+        shards_by_path={"main.tf": 0},
+    )
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_queries_declare_manifests() -> None:
+    for _, query in QUERIES:
+        assert query in QUERY_MANIFESTS, query.__qualname__
+        assert QUERY_MANIFESTS[query].languages, query.__qualname__
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_queries_by_language() -> None:
+    queries_by_language = _get_queries_by_language(QUERIES)
+
+    assert not queries_by_language[GraphLanguage.NOT_SUPPORTED]
+    assert sum(map(len, queries_by_language.values())) >= len(QUERIES)
+    for language, queries in queries_by_language.items():
+        assert all(
+            language in get_query_manifest(query).languages
+            for _, query in queries
+        )
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_filter_by_node_types() -> None:
+    queries = _get_queries_by_language(QUERIES)[GraphLanguage.HCL]
+    graph_db = _get_graph_db(GraphLanguage.HCL, ("Object", "Pair"))
+    applicable = _filter_by_node_types(queries, graph_db)
+
+    assert applicable
+    assert {
+        query
+        for _, query in queries
+        if not get_query_manifest(query).node_types
+        or get_query_manifest(query).node_types & {"Object", "Pair"}
+    } == {query for _, query in applicable}
+    assert not _filter_by_node_types(
+        queries, _get_graph_db(GraphLanguage.HCL, ("Comment",))
+    )
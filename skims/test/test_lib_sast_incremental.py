@@ -0,0 +1,146 @@
+from ctx import (
+    CTX,
+)
+from lib_sast.incremental import (
+    get_affected_paths,
+    load_baseline,
+    store_baseline,
+)
+from model import (
+    core_model,
+)
+import pytest
+from pytest_mock import (
+    MockerFixture,
+)
+from vulnerabilities import (
+    build_lines_vuln,
+    build_metadata,
+)
+
+
+def _get_config() -> core_model.SkimsConfig:
+    return core_model.SkimsConfig(
+        apk=core_model.SkimsAPKConfig(exclude=(), include=()),
+        checks={core_model.FindingEnum.F001},
+        commit=None,
+        dast=None,
+        execution_id=None,
+        group=None,
+        language=core_model.LocalesEnum.EN,
+        namespace="test",
+        output=None,
+        path=core_model.SkimsPathConfig(
+            exclude=(),
+            include=(".",),
+            lib_path=True,
+            lib_root=True,
+            base_commit="0" * 40,
+        ),
+        start_dir=".",
+        working_dir=".",
+    )
+
+
+def _get_vulnerability(
+    method: core_model.MethodsEnum, what: str
+) -> core_model.Vulnerability:
+    return build_lines_vuln(
+        method=method,
+        what=what,
+        where="1",
+        metadata=build_metadata(
+            method=method, description="description", snippet="snippet"
+        ),
+    )
+
+
+@pytest.mark.skims_test_group("unittesting")
+@pytest.mark.parametrize(
+    "changed_paths,expected",
+    [
+        ({"src/app.py"}, {"src/app.py"}),
+        ({"front/package.json"}, {"front/package.json", "front/yarn.lock"}),
+        (
+            {"pom.xml"},
+            {"pom.xml", "api/pom.xml", "api/core/pom.xml"},
+        ),
+        ({"api/pom.xml"}, {"api/pom.xml", "api/core/pom.xml"}),
+        ({"removed.py"}, {"removed.py"}),
+    ],
+)
+def test_get_affected_paths(
+    changed_paths: set[str], expected: set[str]
+) -> None:
+    all_paths = (
+        "src/app.py",
+        "front/package.json",
+        "front/yarn.lock",
+        "yarn.lock",
+        "pom.xml",
+        "api/pom.xml",
+        "api/core/pom.xml",
+    )
+    assert get_affected_paths(changed_paths, all_paths) == expected
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_load_baseline(mocker: MockerFixture) -> None:
+    mocker.patch.object(CTX, "config", _get_config())
+    mocker.patch(
+        "lib_sast.incremental.get_changed_paths",
+        return_value={"src/changed.cs"},
+    )
+    sql_injection = core_model.MethodsEnum.CS_SQL_INJECTION
+    package_json = core_model.MethodsEnum.NPM_PACKAGE_JSON
+    results = (
+        _get_vulnerability(sql_injection, "src/changed.cs"),
+        _get_vulnerability(sql_injection, "src/Copy (2).cs"),
+        _get_vulnerability(
+            package_json,
+            "Copy (2)/package.json (lodash v4.17.0) [CVE-2021-23337]",
+        ),
+        _get_vulnerability(
+            package_json, "package.json (lodash v4.17.0) [CVE-2021-23337]"
+        ),
+        _get_vulnerability(sql_injection, "src/removed.cs"),
+    )
+    cache = mocker.patch("lib_sast.incremental._get_results_cache")
+    cache.return_value.get.return_value = results
+
+    baseline = load_baseline(
+        (
+            "src/changed.cs",
+            "src/Copy (2).cs",
+            "Copy (2)/package.json",
+            "package.json",
+        )
+    )
+
+    assert baseline == ({"src/changed.cs"}, results[1:4])
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_load_baseline_other_version(mocker: MockerFixture) -> None:
+    mocker.patch.object(CTX, "config", _get_config())
+    mocker.patch("lib_sast.incremental.get_changed_paths", return_value=set())
+    mocker.patch(
+        "lib_sast.incremental.get_repo_head_hash", return_value="0" * 40
+    )
+    stored: dict = {}
+    cache = mocker.patch("lib_sast.incremental._get_results_cache")
+    cache.return_value.get.side_effect = stored.get
+    cache.return_value.store.side_effect = stored.__setitem__
+    results = (
+        _get_vulnerability(
+            core_model.MethodsEnum.CS_SQL_INJECTION, "src/app.cs"
+        ),
+    )
+
+    store_baseline(results)
+    assert load_baseline(("src/app.cs",)) == (set(), results)
+
+    mocker.patch(
+        "lib_sast.incremental._get_skims_version", return_value="upgraded"
+    )
+    assert load_baseline(("src/app.cs",)) is None
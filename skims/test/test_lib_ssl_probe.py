@@ -0,0 +1,70 @@
+from lib_ssl import (
+    probe,
+)
+from lib_ssl.suites import (
+    SSLVersionId,
+)
+from lib_ssl.types import (
+    SSLRecord,
+    SSLServerResponse,
+)
+import pytest
+from pytest_mock import (
+    MockerFixture,
+)
+from threading import (
+    Lock,
+)
+import time
+
+
+@pytest.mark.asyncio
+@pytest.mark.skims_test_group("unittesting")
+async def test_probe_tls_versions(mocker: MockerFixture) -> None:
+    calls: list[tuple[str, int, SSLVersionId]] = []
+    running: dict[str, int] = {}
+    max_running: dict[str, int] = {}
+    lock = Lock()
+
+    def tls_connect(
+        host: str, port: int, v_id: SSLVersionId, timeout: float
+    ) -> SSLServerResponse | None:
+        with lock:
+            calls.append((host, port, v_id))
+            running[host] = running.get(host, 0) + 1
+            max_running[host] = max(max_running.get(host, 0), running[host])
+        time.sleep(0.05)
+        with lock:
+            running[host] -= 1
+        if timeout != 1.0 or v_id != SSLVersionId.tlsv1_2:
+            return None
+        return SSLServerResponse(record=SSLRecord.HANDSHAKE, version_id=v_id)
+
+    mocker.patch.dict(probe.PROBE_RESULTS, clear=True)
+    mocker.patch.object(probe.analyze_protocol, "tls_connect", tls_connect)
+
+    targets = [("a.test", 443), ("a.test", 8443), ("b.test", 443)]
+    for _ in range(2):
+        results = await probe.probe_tls_versions(
+            [*targets, ("a.test", 443)], host_concurrency=2, timeout=1.0
+        )
+        assert set(results) == set(targets)
+        assert all(
+            tuple(response.version_id for response in responses)
+            == (SSLVersionId.tlsv1_2,)
+            for responses in results.values()
+        )
+
+    assert len(calls) == len(set(calls)) == 3 * len(probe.PROBED_VERSIONS)
+    assert max_running == {"a.test": 2, "b.test": 2}
+
+
+@pytest.mark.asyncio
+@pytest.mark.skims_test_group("lib_ssl")
+@pytest.mark.usefixtures("test_mocks_ssl_safe")
+async def test_probe_tls_versions_server(mocker: MockerFixture) -> None:
+    mocker.patch.dict(probe.PROBE_RESULTS, clear=True)
+    results = await probe.probe_tls_versions([("localhost", 4445)])
+    assert tuple(
+        response.version_id for response in results[("localhost", 4445)]
+    ) == (SSLVersionId.tlsv1_3,)
@@ -1,6 +1,7 @@
 import json
 from model import (
     core_model,
+    value_model,
 )
 import os
 import pytest
@@ -73,6 +74,22 @@ def test_model_core_model_manifest_queues() -> None:
         assert handle_r.read() == expected
 
 
+@pytest.mark.skims_test_group("unittesting")
+def test_model_value_model_merge() -> None:
+    worker = value_model.ValueToAdd({})
+    worker.add("npm - lodash")
+    worker.add("npm - lodash")
+    worker.add("maven - log4j")
+    counts = worker.pop_all()
+    assert counts == {"npm - lodash": 2, "maven - log4j": 1}
+    assert not worker.data
+
+    parent = value_model.ValueToAdd({"npm - lodash": 1})
+    parent.merge(counts)
+    parent.merge({"maven - log4j": 2})
+    assert parent.data == {"npm - lodash": 3, "maven - log4j": 3}
+
+
 @pytest.mark.skims_test_group("unittesting")
 def test_model_core_model_from_integrates() -> None:
     assert ("", "test") == core_model.Vulnerability.what_from_integrates(
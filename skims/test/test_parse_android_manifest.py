@@ -0,0 +1,16 @@
+from parse_android_manifest import (
+    get_apk_context,
+)
+import pytest
+
+
+@pytest.mark.skims_test_group("lib_apk")
+def test_get_apk_context_cache() -> None:
+    path = "skims/test/data/lib_apk/unsafe_delete.apk"
+    apk_ctx = get_apk_context(path)
+    cached_apk_ctx = get_apk_context(path)
+
+    assert apk_ctx.index is not None
+    assert apk_ctx.index == cached_apk_ctx.index
+    assert apk_ctx.index.get_method_callers("Ljava/io/File;", "delete", "()Z")
+    assert str(apk_ctx.apk_manifest) == str(cached_apk_ctx.apk_manifest)
@@ -0,0 +1,38 @@
+from frozendict import (
+    frozendict,
+)
+from parse_json import (
+    _get_json_parser,
+    loads_blocking,
+)
+import pytest
+
+
+@pytest.mark.skims_test_group("unittesting")
+@pytest.mark.parametrize(
+    "stream",
+    [
+        '{"name": "skims", "version": "1.0.0"}',
+        '{\n  "a": [1, -2.5, 3e2, true, false, null],\n  "b": {}\n}',
+        '[{"c": "x\\"y\\\\z\\/\\u00e9"}, [], [[]]]',
+        '\r\n\t {"lockfileVersion": 2,\n\n "packages": {"": {}}} \n',
+        '"single"',
+        "+1",
+        "1.",
+        ".5",
+    ],
+)
+def test_loads_blocking(stream: str) -> None:
+    expected = _get_json_parser().parse(stream)
+    result = loads_blocking(stream)
+    assert result == expected
+    assert repr(result) == repr(expected)
+
+
+@pytest.mark.skims_test_group("unittesting")
+@pytest.mark.parametrize(
+    "stream",
+    ["", "{", '{"a" 1}', "[1,]", '{"a": 1} x', '"multi\nline"'],
+)
+def test_loads_blocking_invalid(stream: str) -> None:
+    assert loads_blocking(stream, default=frozendict()) == frozendict()
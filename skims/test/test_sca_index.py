@@ -0,0 +1,81 @@
+import os
+import pytest
+from pytest_mock import (
+    MockerFixture,
+)
+from sca.index import (
+    build_index,
+    ensure_index,
+    get_advisories_from_index,
+    is_index_fresh,
+    SUPPORTED_PLATFORMS,
+)
+from tempfile import (
+    TemporaryDirectory,
+)
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_sca_index() -> None:
+    advisories = {
+        "npm": {
+            "lodash": {
+                "CVE-2020-8203": "<4.17.19",
+                "GMS-2020-1": "<4.17.16",
+            },
+            "minimist": {"CVE-2021-44906": "<1.2.6"},
+        },
+        "pip": {"django": {"CVE-2022-28346": ">=2.2 <2.2.28"}},
+    }
+    patch_advisories = {
+        "npm": {"lodash": {"CVE-2020-8203": "<4.17.20"}},
+    }
+    with TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "advisories.sqlite")
+        build_index(advisories, patch_advisories, path)
+
+        assert get_advisories_from_index("lodash", "npm", path) == [
+            ("CVE-2020-8203", "<4.17.20")
+        ]
+        assert get_advisories_from_index("django", "pip", path) == [
+            ("CVE-2022-28346", ">=2.2 <2.2.28")
+        ]
+        assert not get_advisories_from_index("django", "npm", path)
+        assert (
+            get_advisories_from_index(
+                "lodash", "npm", os.path.join(tmp_dir, "missing.sqlite")
+            )
+            is None
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.skims_test_group("unittesting")
+async def test_sca_index_incomplete(mocker: MockerFixture) -> None:
+    mocker.patch("sca.index.s3_start_resource")
+    mocker.patch("sca.index.s3_shutdown")
+    mocker.patch("sca.index._download_index", return_value=False)
+    advisories = {
+        platform: {"package": {"CVE-2022-0001": "<1.0.0"}}
+        for platform in SUPPORTED_PLATFORMS
+    }
+    download = mocker.patch(
+        "sca.index.download_advisories",
+        return_value=({**advisories, "npm": {}}, {}),
+    )
+    with TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "advisories.sqlite")
+        build_index(
+            {"npm": {"lodash": {"CVE-2020-8203": "<4.17.19"}}}, {}, path
+        )
+        os.utime(path, (0, 0))
+
+        assert not await ensure_index(path)
+        assert not is_index_fresh(path)
+        assert get_advisories_from_index("lodash", "npm", path) == [
+            ("CVE-2020-8203", "<4.17.19")
+        ]
+
+        download.return_value = (advisories, {})
+        assert await ensure_index(path)
+        assert is_index_fresh(path)
@@ -0,0 +1,34 @@
+from model import (
+    core_model,
+)
+import pytest
+from pytest_mock import (
+    MockerFixture,
+)
+from sca import (
+    get_vulnerabilities,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skims_test_group("unittesting")
+async def test_get_vulnerabilities(mocker: MockerFixture) -> None:
+    advisories = mocker.patch(
+        "sca.get_remote_advisories",
+        return_value=[
+            ("CVE-2020-8203", "<4.17.19"),
+            ("CVE-2021-23337", "<4.17.21"),
+        ],
+    )
+
+    assert await get_vulnerabilities(
+        core_model.Platform.NPM,
+        "Lodash",
+        ("4.17.15", "4.17.20", "4.17.21", "not-a-version", "4.17.15"),
+    ) == {
+        "4.17.15": ["CVE-2020-8203", "CVE-2021-23337"],
+        "4.17.20": ["CVE-2021-23337"],
+        "4.17.21": [],
+        "not-a-version": [],
+    }
+    advisories.assert_called_once_with("lodash", "NPM")
@@ -0,0 +1,35 @@
+import os
+import pytest
+from pytest_mock import (
+    MockerFixture,
+)
+from state.cache import (
+    get_cache_store,
+)
+from tempfile import (
+    TemporaryDirectory,
+)
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_cache_store(mocker: MockerFixture) -> None:
+    with TemporaryDirectory() as tmp_dir:
+        mocker.patch("state.cache.CACHE", tmp_dir)
+        store = get_cache_store("test")
+        folder = os.path.join(tmp_dir, "test")
+
+        store.store(("key",), {"value": 1})
+        assert store.get(("key",)) == {"value": 1}
+        assert store.get(("missing",)) is None
+
+        # Failed writes leave neither the entry nor its temporary file
+        with pytest.raises(KeyError):
+            store.store(("object",), object())
+        mocker.patch("state.cache.py_dumps", side_effect=KeyboardInterrupt)
+        with pytest.raises(KeyboardInterrupt):
+            store.store(("interrupted",), "value")
+        mocker.patch("state.cache.py_dumps", side_effect=OSError)
+        store.store(("full",), "value")
+
+        assert len(os.listdir(folder)) == 1
+        assert store.get(("object",)) is None
@@ -0,0 +1,58 @@
+from model.core_model import (
+    MethodsEnum,
+)
+import pytest
+from state.ephemeral import (
+    get_ephemeral_store,
+)
+from vulnerabilities import (
+    build_inputs_vuln,
+    build_metadata,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skims_test_group("unittesting")
+async def test_ephemeral_store() -> None:
+    store = get_ephemeral_store()
+    assert store.length() == 0
+    assert not tuple(store.iterate())
+
+    for obj in ("a", "b", "a", "c"):
+        store.store(obj)
+
+    assert store.length() == 3
+    assert tuple(store.iterate()) == ("a", "b", "c")
+    assert await store.get_a_few(2) == ("a", "b")
+
+    await store.clear()
+    assert store.length() == 0
+    assert not tuple(store.iterate())
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_ephemeral_store_vulnerabilities() -> None:
+    store = get_ephemeral_store()
+    vulnerabilities = tuple(
+        build_inputs_vuln(
+            method=method,
+            stream="skims",
+            what="arn:aws:iam::123456789012:policy/policy",
+            where="policy",
+            metadata=build_metadata(
+                method=method, description="description", snippet=""
+            ),
+        )
+        for method in (
+            MethodsEnum.AWS_ALLOWS_PRIV_ESCALATION_BY_ATTACH_POLICY,
+            MethodsEnum.AWS_ALLOWS_PRIV_ESCALATION_BY_POLICIES_VERSIONS,
+            MethodsEnum.AWS_ALLOWS_PRIV_ESCALATION_BY_ATTACH_POLICY,
+        )
+    )
+    for vulnerability in vulnerabilities:
+        store.store(vulnerability)
+
+    # Same location, but reported by different methods
+    assert vulnerabilities[0].digest == vulnerabilities[1].digest
+    assert store.length() == 2
+    assert tuple(store.iterate()) == vulnerabilities[:2]
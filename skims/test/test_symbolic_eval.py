@@ -0,0 +1,90 @@
+from model import (
+    core_model,
+    graph_model,
+)
+import pytest
+from pytest_mock import (
+    MockerFixture,
+)
+from symbolic_eval.evaluate import (
+    get_node_evaluation_results,
+)
+from symbolic_eval.utils import (
+    _get_cfg_parents,
+    iter_backward_paths,
+)
+
+
+def _get_diamonds_graph(count: int) -> graph_model.Graph:
+    # 1 -> (2 | 3) -> 4 -> (5 | 6) -> 7 ..., each diamond doubles the paths
+    graph = graph_model.Graph()
+    for index in range(count):
+        start = 3 * index + 1
+        for n_id in range(start, start + 4):
+            graph.add_node(str(n_id))
+        for u_id, v_id in ((0, 1), (0, 2), (1, 3), (2, 3)):
+            graph.add_edge(
+                str(start + u_id), str(start + v_id), label_cfg="CFG"
+            )
+    return graph
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_get_cfg_parents() -> None:
+    graph = _get_diamonds_graph(1)
+
+    assert _get_cfg_parents(graph, "4") == ("2", "3")
+    assert not _get_cfg_parents(graph, "1")
+
+    # Parents are read once per node and then served from the graph
+    graph.remove_edge("3", "4")
+    assert _get_cfg_parents(graph, "4") == ("2", "3")
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_iter_backward_paths(mocker: MockerFixture) -> None:
+    log = mocker.patch("symbolic_eval.utils.log_blocking")
+    graph = _get_diamonds_graph(1)
+
+    assert list(iter_backward_paths(graph, "4")) == [
+        ["4", "2", "1"],
+        ["4", "3", "1"],
+    ]
+    assert list(iter_backward_paths(graph, "1")) == [["1"]]
+    log.assert_not_called()
+
+    graph = _get_diamonds_graph(3)
+    paths = list(iter_backward_paths(graph, "10", max_paths=None))
+    assert len(paths) == 8
+    assert paths[0] == ["10", "8", "7", "5", "4", "2", "1"]
+    assert paths[-1] == ["10", "9", "7", "6", "4", "3", "1"]
+    log.assert_not_called()
+
+    assert list(iter_backward_paths(graph, "10", max_paths=5)) == paths[:5]
+    assert log.call_args.args[0] == "warning"
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_get_node_evaluation_results(mocker: MockerFixture) -> None:
+    find = mocker.patch(
+        "symbolic_eval.evaluate._find_evaluation_result", return_value=True
+    )
+    graph = _get_diamonds_graph(1)
+    method = core_model.MethodsEnum.CS_SQL_INJECTION
+
+    assert get_node_evaluation_results(method, graph, "4", {"a", "b"})
+    assert get_node_evaluation_results(method, graph, "4", {"b", "a"})
+    find.assert_called_once_with(method, graph, "4", {"a", "b"}, True)
+
+    # Every part of the question is part of the key
+    for args in (
+        (method, graph, "4", {"a", "b"}, False),
+        (method, graph, "4", {"a"}),
+        (method, graph, "3", {"a", "b"}),
+        (core_model.MethodsEnum.CS_XPATH_INJECTION, graph, "4", {"a", "b"}),
+    ):
+        find.reset_mock()
+        find.return_value = not find.return_value
+        assert get_node_evaluation_results(*args) is find.return_value
+        assert get_node_evaluation_results(*args) is find.return_value
+        find.assert_called_once()
@@ -0,0 +1,53 @@
+from model.graph_model import (
+    Graph,
+)
+import pytest
+from syntax_cfg.dispatchers import (
+    CFG_BUILDERS,
+    DISPATCHERS,
+)
+from syntax_graph.dispatchers import (
+    DISPATCHERS_BY_LANG,
+    SYNTAX_READERS_BY_LANG,
+)
+from utils.graph.text_nodes import (
+    get_childs,
+    node_to_str,
+)
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_dispatch_tables() -> None:
+    for language, dispatchers in DISPATCHERS_BY_LANG.items():
+        for node_type, reader in SYNTAX_READERS_BY_LANG[language].items():
+            assert reader is next(
+                dispatcher.syntax_reader
+                for dispatcher in dispatchers
+                if node_type in dispatcher.applicable_types
+            )
+
+    for node_type, builder in CFG_BUILDERS.items():
+        assert builder is next(
+            dispatcher.cfg_builder
+            for dispatcher in DISPATCHERS
+            if node_type in dispatcher.applicable_types
+        )
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_text_nodes_deep_tree() -> None:
+    depth = 100000
+    graph = Graph()
+    for n_id in range(1, depth):
+        graph.add_node(str(n_id))
+        graph.add_edge(str(n_id), str(n_id + 1), label_ast="AST")
+    graph.add_node(str(depth), label_text="a")
+    graph.add_node(str(depth + 1), label_text="b")
+    graph.add_edge("1", str(depth + 1), label_ast="AST")
+
+    assert get_childs(graph, "1") == [
+        *map(str, range(depth, 1, -1)),
+        str(depth + 1),
+        "1",
+    ]
+    assert node_to_str(graph, "1") == "ab"
@@ -0,0 +1,39 @@
+import pytest
+import time
+from utils.budget import (
+    budget,
+    BudgetExceeded,
+)
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_budget() -> None:
+    with budget(10.0, 1024**3):
+        total = sum(range(1000))
+    assert total == 499500
+
+    with pytest.raises(BudgetExceeded) as exc:
+        with budget(0.2, 1024**3):
+            while True:
+                pass
+    assert exc.value.reason == "timeout"
+
+    chunks = []
+    with pytest.raises(BudgetExceeded) as exc:
+        with budget(10.0, 64 * 1024**2):
+            while True:
+                chunks.append(bytearray(1024**2))
+    assert exc.value.reason == "memory"
+    chunks.clear()
+
+    # Nothing goes off once the block is over
+    time.sleep(0.3)
+
+    # The broad except clauses of the code under budget do not swallow it
+    with pytest.raises(BudgetExceeded):
+        with budget(0.2, 1024**3):
+            while True:
+                try:
+                    sum(range(1000))
+                except Exception:  # pylint: disable=broad-except
+                    pass
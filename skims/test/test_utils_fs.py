@@ -0,0 +1,97 @@
+import os
+import pytest
+from utils.fs import (
+    decide_language,
+    resolve_paths,
+)
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_resolve_paths(monkeypatch: pytest.MonkeyPatch, tmp_path: str) -> None:
+    for path in (
+        "app/main.py",
+        "app/.hidden/config.py",
+        "app/node_modules/pkg/index.js",
+        "app/lib.jar",
+        "web/Scripts/_references.js",
+        "web/Scripts/site.js",
+        "web/wwwroot/lib/vendor.js",
+        "web/.settings/prefs",
+    ):
+        os.makedirs(
+            os.path.join(tmp_path, os.path.dirname(path)), exist_ok=True
+        )
+        with open(os.path.join(tmp_path, path), "w", encoding="utf-8"):
+            pass
+    monkeypatch.chdir(tmp_path)
+
+    ok_paths, nu_paths, nv_paths = resolve_paths(
+        include=(".",),
+        exclude=("glob(**/node_modules)", "glob(**/*.jar)"),
+    )
+    assert sorted(ok_paths) == ["app/.hidden/config.py", "app/main.py"]
+    assert sorted(nu_paths) == [
+        "web/Scripts/_references.js",
+        "web/Scripts/site.js",
+        "web/wwwroot/lib/vendor.js",
+    ]
+    assert sorted(nv_paths) == ["web/.settings/prefs"]
+
+    ok_paths, nu_paths, nv_paths = resolve_paths(
+        include=("./app", "glob(web/*/site.js)"),
+        exclude=("app/.hidden", "glob(app/*/pkg)", "glob(**/*.jar)"),
+    )
+    assert sorted(ok_paths) == ["app/main.py", "web/Scripts/site.js"]
+    assert not nu_paths
+    assert not nv_paths
+
+    assert resolve_paths(include=("app/main.py",), exclude=(".",)) == (
+        (),
+        (),
+        (),
+    )
+
+
+@pytest.mark.skims_test_group("unittesting")
+@pytest.mark.parametrize(
+    "exclude,expected",
+    [
+        ("glob(src/*/**)", ["main.py", "src/.env", "src/main.py"]),
+        ("glob(*/**)", ["main.py"]),
+        ("glob(src/**)", ["main.py"]),
+        ("glob(src/*)", ["main.py", "src/.env"]),
+        ("glob(src/*/)", ["main.py", "src/.env", "src/main.py"]),
+        ("glob(**/*.py)", ["src/.env"]),
+        ("glob(**/pkg)", ["main.py", "src/.env", "src/main.py"]),
+        (
+            "glob(src/main.py/**)",
+            ["main.py", "src/.env", "src/main.py", "src/pkg/a.py"],
+        ),
+    ],
+)
+def test_resolve_paths_globs(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: str,
+    exclude: str,
+    expected: list[str],
+) -> None:
+    for path in ("main.py", "src/main.py", "src/.env", "src/pkg/a.py"):
+        os.makedirs(
+            os.path.join(tmp_path, os.path.dirname(path)), exist_ok=True
+        )
+        with open(os.path.join(tmp_path, path), "w", encoding="utf-8"):
+            pass
+    monkeypatch.chdir(tmp_path)
+
+    ok_paths, nu_paths, nv_paths = resolve_paths(
+        include=(".",), exclude=(exclude,)
+    )
+    assert sorted((*ok_paths, *nu_paths, *nv_paths)) == expected
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_decide_language() -> None:
+    assert decide_language("app/main.py").name == "PYTHON"
+    assert decide_language("infra/main.tf").name == "HCL"
+    assert decide_language("Makefile").name == "NOT_SUPPORTED"
+    assert decide_language("docs/.py/README").name == "NOT_SUPPORTED"
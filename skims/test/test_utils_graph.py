@@ -3,9 +3,17 @@ from model import (
     graph_model,
 )
 import pytest
+from serialization import (
+    dump,
+    load,
+)
 from utils import (
     graph as g,
 )
+from utils.graph.compact import (
+    CompactGraph,
+    to_compact_graph,
+)
 
 
 @pytest.mark.skims_test_group("unittesting")
@@ -99,3 +107,78 @@ def test_branches_adj() -> None:
 
     assert g.adj_ast(graph, "1", strict=True) == ("2", "3")
     assert g.adj_cfg(graph, "3", strict=True, depth=-1) == ("5", "6")
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_matching_nodes_index() -> None:
+    graph = graph_model.Graph()
+    graph.add_node("1", label_type="MethodInvocation", expression="a")
+    graph.add_node("2", label_type="MemberAccess", expression="a", member="b")
+    graph.add_node("3", label_type="MethodInvocation", expression="c")
+    graph.add_node("4", label_type="MemberAccess", expression="a", member="c")
+
+    expected = (
+        g.matching_nodes(graph, label_type="MethodInvocation"),
+        g.matching_nodes(graph, label_type="MemberAccess", member="c"),
+        g.matching_nodes(graph, expression="a"),
+        g.matching_nodes(graph, label_type="Literal"),
+    )
+    node_types = g.get_node_types(graph)
+    g.build_node_index(graph)
+
+    assert node_types == g.get_node_types(graph)
+    assert node_types == {"MemberAccess", "MethodInvocation"}
+
+    assert expected == (("1", "3"), ("4",), ("1", "2", "4"), ())
+    assert expected == (
+        g.matching_nodes(graph, label_type="MethodInvocation"),
+        g.matching_nodes(graph, label_type="MemberAccess", member="c"),
+        g.matching_nodes(graph, expression="a"),
+        g.matching_nodes(graph, label_type="Literal"),
+    )
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_compact_graph() -> None:
+    graph = graph_model.Graph()
+    graph.add_node("1", label_type="MethodDeclaration", name="main")
+    graph.add_node("10", label_type="MethodInvocation", expression="exec")
+    graph.add_node("2", label_type="Literal", value="a")
+    graph.add_node("3", label_type="Literal", label_sink_type={"F004"})
+    graph.add_edge("1", "10", label_ast="AST", label_cfg="CFG")
+    graph.add_edge("1", "2", label_ast="AST")
+    graph.add_edge("10", "3", label_ast="AST")
+    graph.add_edge("2", "3", label_cfg="CFG")
+
+    compact = to_compact_graph(graph)
+    assert g.export_graph_as_json(compact) == g.export_graph_as_json(graph)
+    assert list(compact.nodes) == ["1", "10", "2", "3"]
+    assert [c_id for c_id, _ in compact.sorted_succ("1")] == ["2", "10"]
+    assert [p_id for p_id, _ in compact.sorted_pred("3")] == ["2", "10"]
+    for n_id in graph.nodes:
+        assert g.adj_ast(compact, n_id, depth=-1) == g.adj_ast(
+            graph, n_id, depth=-1
+        )
+        assert g.pred_cfg(compact, n_id, depth=-1) == g.pred_cfg(
+            graph, n_id, depth=-1
+        )
+    assert g.matching_nodes(compact, label_type="Literal") == ("2", "3")
+    assert g.matching_nodes(compact, label_type="Literal", value="a") == ("2",)
+    assert g.branches_cfg(
+        compact, "1", core_model.FindingEnum.F004
+    ) == g.branches_cfg(graph, "1", core_model.FindingEnum.F004)
+
+    restored = load(dump(compact))
+    assert isinstance(restored, CompactGraph)
+    assert g.export_graph_as_json(restored) == g.export_graph_as_json(graph)
+
+    # Edits after compaction leave the other edges, sharing attributes, alone
+    for changed in (graph, compact):
+        changed.nodes["2"]["value"] = "b"
+        changed.nodes["3"]["label_text"] = "text"
+        changed.add_edge("2", "3", label_ast="AST")
+        changed.add_edge("3", "4", label_ast="AST")
+        changed.remove_edge("1", "10")
+    assert g.export_graph_as_json(compact) == g.export_graph_as_json(graph)
+    assert compact["10"]["3"] == {"label_ast": "AST"}
+    assert g.adj_ast(compact, "1", depth=-1) == ("2", "3", "4")
@@ -0,0 +1,48 @@
+from aiohttp import (
+    web,
+)
+from aiohttp.test_utils import (
+    TestServer,
+)
+import pytest
+import time
+from utils.http import (
+    create_client,
+    fetch,
+    TokenBucket,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skims_test_group("unittesting")
+async def test_fetch() -> None:
+    peers: list[tuple[str, int]] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.Response(text=request.headers.get("X-Test", "empty"))
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    async with TestServer(app) as server:
+        url = str(server.make_url("/"))
+        async with create_client(requests_per_second=1000) as client:
+            for headers in (None, None, {"X-Test": "a"}, {"X-Test": "a"}):
+                response = await fetch(client, "GET", url, headers=headers)
+                assert response is not None
+                assert response.status == 200
+                assert response.content == (b"a" if headers else b"empty")
+
+    # Identical requests are cached and the connection is kept alive
+    assert len(peers) == 2
+    assert len(set(peers)) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.skims_test_group("unittesting")
+async def test_token_bucket() -> None:
+    bucket = TokenBucket(rate=50.0)
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    assert time.monotonic() - start >= 0.09
@@ -0,0 +1,92 @@
+from ctx import (
+    TOOLS_SEMVER_MATCH,
+)
+import json
+import pytest
+from utils import (
+    semver,
+)
+from utils.system import (
+    read_blocking,
+)
+
+# (version, constraint, expected match or None if the tool fails)
+CASES: tuple[tuple[str, str, bool | None], ...] = (
+    ("1.2.3", ">=1.0.0 <2.0.0", True),
+    ("2.0.0", ">=1.0.0 <2.0.0", False),
+    ("1.0.0", ">1.0.0", False),
+    ("1.0.0", ">=1.0.0", True),
+    ("0.9.9", "<1.0.0", True),
+    ("1.0.0", "<=1.0.0", True),
+    ("1.0.1", "=1.0.0", False),
+    ("1.2", ">=1.2.5 <1.3.0", True),
+    ("1.2", "<1.2.0", False),
+    ("1", ">=1.9.0 <2.0.0", True),
+    ("2.3.4.5", "=2.3.4", True),
+    ("2.3.4.5", ">2.3.4", False),
+    ("1.0.0-beta", "<1.0.0", False),
+    ("1.0.0-beta", ">=1.0.0-alpha <1.0.0", False),
+    ("1.0.0-rc.1", ">=0.9.0 <1.0.0", False),
+    ("4.17.20", "<4.17.21", True),
+    ("4.17.21", "<4.17.21", False),
+    ("3.0.0", "<2.0.0 || >=3.0.0 <3.0.5", True),
+    ("2.5.0", "<2.0.0 || >=3.0.0 <3.0.5", False),
+    ("1.5.0", "^1.2.3", True),
+    ("2.0.0", "^1.2.3", False),
+    ("0.2.5", "^0.2.3", True),
+    ("0.3.0", "^0.2.3", False),
+    ("1.2.9", "~1.2.3", True),
+    ("1.3.0", "~1.2.3", False),
+    ("1.0.0", "*", True),
+    ("1.0.0", ">=0.0.0", True),
+    ("1.0.0", "1.0 - 2.0", None),
+    ("1.0.0", ">= 1.0.0", None),
+    ("v1.2.3", "=1.2.3", True),
+    ("1.2.3+build", "=1.2.3", True),
+    ("1.2.3", "1.2.x", True),
+    ("1.0.0", "<0.0.0-0", False),
+    ("1.0.0-SNAPSHOT", "<1.0.0", False),
+    ("2.0.0.RELEASE", ">=2.0.0 <2.0.5", True),
+    ("not-a-version", ">=1.0.0", None),
+    ("1.0.0", ">=a.b.c", None),
+    ("1.0.0", "", None),
+    ("1.0", ">=1.0.0 <1.0.1||>=2.0.0", True),
+    ("1.10.0", ">1.9.0 <=1.10.0", True),
+    ("10.0.0", ">9 <11", True),
+)
+
+
+def _match(left: str, right: str) -> bool | None:
+    try:
+        return semver.match(left, right)
+    except semver.InvalidSemver:
+        return None
+
+
+def _tool_match(left: str, right: str) -> bool | None:
+    code, out, _ = read_blocking(TOOLS_SEMVER_MATCH, left, right)
+    if code != 0 or not (data := json.loads(out))["success"]:
+        return None
+    return data["match"]
+
+
+@pytest.mark.skims_test_group("unittesting")
+@pytest.mark.parametrize("left,right,expected", CASES)
+def test_semver_match(left: str, right: str, expected: bool | None) -> None:
+    assert _match(left, right) is expected
+
+
+@pytest.mark.skims_test_group("unittesting")
+@pytest.mark.parametrize("left,right,expected", CASES)
+def test_semver_match_tool_compatibility(
+    left: str, right: str, expected: bool | None
+) -> None:
+    assert _match(left, right) is _tool_match(left, right) is expected
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_semver_match_versions() -> None:
+    assert semver.match_versions(
+        ("1.2.3", "1.4.0", "2.0.0", "0.1"),
+        ">=1.0.0 <1.4.0 || >=2.0.0 <2.0.1",
+    ) == (True, False, True, False)
@@ -0,0 +1,38 @@
+import pytest
+import serializers
+from serializers import (
+    SnippetViewport,
+)
+from utils.snippets import (
+    make_snippet,
+)
+
+# Constants
+CONTENT: str = "\n".join(
+    f"\tline {line_no} " + "x" * (line_no * 7 % 200) for line_no in range(60)
+)
+
+
+@pytest.mark.skims_test_group("unittesting")
+@pytest.mark.parametrize(
+    "content",
+    ["", "single line", "first\nsecond", CONTENT],
+)
+@pytest.mark.parametrize(
+    "viewport",
+    [
+        None,
+        SnippetViewport(line=0, column=0),
+        SnippetViewport(line=1),
+        SnippetViewport(line=2, column=130),
+        SnippetViewport(line=30, column=45),
+        SnippetViewport(line=55, column=3, line_context=2),
+        SnippetViewport(line=60, show_line_numbers=False),
+        SnippetViewport(line=12, column=8, highlight_line_number=False),
+        SnippetViewport(line=20, column=0, wrap=True),
+    ],
+)
+def test_make_snippet(content: str, viewport: SnippetViewport | None) -> None:
+    assert make_snippet(
+        content=content, viewport=viewport
+    ) == serializers.make_snippet(content=content, viewport=viewport)
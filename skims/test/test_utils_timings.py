@@ -0,0 +1,34 @@
+from ctx import (
+    CTX,
+)
+import pytest
+from pytest_mock import (
+    MockerFixture,
+)
+from utils import (
+    timings,
+)
+
+
+@pytest.mark.skims_test_group("unittesting")
+def test_timings(mocker: MockerFixture, tmp_path: str) -> None:
+    mocker.patch.dict(timings.TIMINGS, clear=True)
+    mocker.patch.object(CTX, "timings_folder", None)
+    with timings.timed("parse"):
+        pass
+    assert not timings.TIMINGS
+
+    mocker.patch.object(CTX, "timings_folder", str(tmp_path))
+    for _ in range(2):
+        for stage in ("parse", "parse", "syntax_graph"):
+            with timings.timed(stage):
+                pass
+        timings.flush_timings()
+    assert not timings.TIMINGS
+
+    totals = timings.load_timings(str(tmp_path))
+    assert {stage: timing.calls for stage, timing in totals.items()} == {
+        "parse": 4,
+        "syntax_graph": 2,
+    }
+    assert all(timing.seconds >= 0.0 for timing in totals.values())